@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+import html
+import threading
 from time import perf_counter
+from typing import Any, Callable
 from urllib.parse import urlencode
 
 import streamlit as st
 
+from core.citation import highlight_parts
 from core.demo_cases import DemoCase, demo_case_titles, get_demo_case
 from core.framing import framing_table, source_context_summary, source_diversity, takeaways, watch_items
-from core.llm_provider import DEFAULT_MODELS
+from core.llm_provider import DEFAULT_MODELS, prewarm_ollama
 from core.schemas import Article, LLMKeys, PipelineTrace
-from impls.registry import IMPLEMENTATIONS, get_runner
+from impls.registry import IMPLEMENTATIONS, arun, get_runner
 
 
 IMPLEMENTATION_NOTES = {
@@ -46,6 +51,12 @@ STAGE_LABELS = {
     "reconcile": "Write the final reader-facing result",
 }
 
+# Streamed response fields worth showing before a stage finishes.
+PARTIAL_FIELDS = ("headline", "neutral_summary", "label", "confidence", "refined_label", "final_label")
+
+# Compare mode overlaps the implementations' model calls on one event loop.
+COMPARE_CONCURRENCY = 6
+
 APP_URL = "https://news-bias-multi-agent-pipeline.streamlit.app/"
 PROVIDERS = ["heuristic", "anthropic", "openai", "google", "ollama"]
 
@@ -104,6 +115,15 @@ def _keys_from_sidebar() -> LLMKeys:
     )
 
 
+@st.cache_resource(show_spinner=False)
+def _prewarm_ollama(host: str, model: str) -> threading.Thread:
+    # Once per server process and host/model: load the model in the
+    # background so it is resident before the first stage call.
+    thread = threading.Thread(target=prewarm_ollama, args=(host, model or None), daemon=True)
+    thread.start()
+    return thread
+
+
 def _run(
     implementation: str,
     subject: str,
@@ -112,6 +132,7 @@ def _run(
     keys: LLMKeys,
     max_articles: int,
     fixture_articles: list[Article] | None,
+    on_partial: Callable[[str, dict[str, Any]], None] | None = None,
 ) -> tuple[PipelineTrace, float]:
     started = perf_counter()
     trace = get_runner(implementation)(
@@ -121,10 +142,53 @@ def _run(
         keys=keys,
         max_articles=max_articles,
         fixture_articles=fixture_articles,
+        on_partial=on_partial,
     )
     return trace, perf_counter() - started
 
 
+async def _run_compare(
+    subject: str,
+    provider: str,
+    model: str | None,
+    keys: LLMKeys,
+    max_articles: int,
+    fixture_articles: list[Article] | None,
+) -> dict[str, tuple[PipelineTrace, float]]:
+    semaphore = asyncio.Semaphore(COMPARE_CONCURRENCY)
+
+    async def timed(implementation: str) -> tuple[str, tuple[PipelineTrace, float]]:
+        started = perf_counter()
+        trace = await arun(
+            implementation,
+            subject,
+            concurrency=semaphore,
+            provider=provider,
+            model=model or None,
+            keys=keys,
+            max_articles=max_articles,
+            fixture_articles=fixture_articles,
+        )
+        return implementation, (trace, perf_counter() - started)
+
+    return dict(await asyncio.gather(*(timed(implementation) for implementation in IMPLEMENTATIONS)))
+
+
+def _partial_renderer(placeholder: Any) -> Callable[[str, dict[str, Any]], None]:
+    received: dict[str, dict[str, Any]] = {}
+
+    def on_partial(stage: str, fields: dict[str, Any]) -> None:
+        received.setdefault(stage, {}).update({key: value for key, value in fields.items() if key in PARTIAL_FIELDS})
+        lines = [
+            f"- **{STAGE_LABELS.get(name, name)}**: " + "; ".join(f"{key}: {value}" for key, value in values.items())
+            for name, values in received.items()
+            if values
+        ]
+        placeholder.markdown("\n".join(lines))
+
+    return on_partial
+
+
 def _selected_articles(mode: str, demo_case: DemoCase | None) -> list[Article] | None:
     if mode == "Story pack" and demo_case is not None:
         return list(demo_case.articles)
@@ -186,10 +250,20 @@ def _render_evidence(trace: PipelineTrace) -> None:
     if not trace.bias_judgment.evidence:
         st.info("No citation spans were produced for this run.")
         return
+    articles = {article.id: article for article in trace.articles}
     for citation in trace.bias_judgment.evidence:
         with st.container(border=True):
             st.caption(_article_title(trace, citation.article_id))
-            st.write(citation.span_text)
+            article = articles.get(citation.article_id)
+            if article is None or citation.start is None or citation.end is None:
+                st.write(citation.span_text)
+                continue
+            # Offsets come from the citation verifier; no need to search the text again.
+            before, span, after = highlight_parts(article.text, citation.start, citation.end)
+            st.markdown(
+                f"{html.escape(before)}<mark>{html.escape(span)}</mark>{html.escape(after)}",
+                unsafe_allow_html=True,
+            )
 
 
 def _render_sources(trace: PipelineTrace) -> None:
@@ -284,6 +358,9 @@ with st.sidebar:
     max_articles = st.slider("Max live articles", min_value=1, max_value=8, value=4)
     keys = _keys_from_sidebar()
 
+if provider == "ollama":
+    _prewarm_ollama(keys.ollama_host, model)
+
 mode = st.radio(
     "Story source",
     ["Story pack", "Live search"],
@@ -325,8 +402,11 @@ run_compare = buttons[1].button("Under the hood: compare engines")
 if run_single:
     try:
         _update_query_params(mode, subject, provider, selected_impl, demo_case)
+        partial_box = st.empty()
+        on_partial = _partial_renderer(partial_box) if provider != "heuristic" else None
         with st.spinner("Analyzing story..."):
-            trace, elapsed = _run(selected_impl, subject, provider, model, keys, max_articles, fixture_articles)
+            trace, elapsed = _run(selected_impl, subject, provider, model, keys, max_articles, fixture_articles, on_partial)
+        partial_box.empty()
         _render_trace(trace, elapsed)
     except Exception as exc:
         st.error(f"Run failed: {exc}")
@@ -335,10 +415,7 @@ if run_compare:
     try:
         _update_query_params(mode, subject, provider, selected_impl, demo_case)
         with st.spinner("Running the same story through all three implementations..."):
-            results = {
-                implementation: _run(implementation, subject, provider, model, keys, max_articles, fixture_articles)
-                for implementation in IMPLEMENTATIONS
-            }
+            results = asyncio.run(_run_compare(subject, provider, model, keys, max_articles, fixture_articles))
         _render_comparison(results)
     except Exception as exc:
         st.error(f"Comparison failed: {exc}")
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+
+from core.lexicon import FRAME_TERMS, LEXICON, TermHit
+from core.schemas import Article
+from core.source_catalog import SourceCatalog, default_source_catalog
+
+
+SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
+LEAD_SENTENCE = re.compile(r"(.{40,220}?[.!?])(?:\s|$)")
+
+# Analyses kept per process; a run, its re-renders, and the next few runs
+# reuse them.
+ANALYSIS_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class ArticleAnalysis:
+    """Text features of one article, computed once and read by every stage.
+
+    ``hits`` are shared-lexicon matches with offsets into ``lowered`` (the
+    lowercased article text); ``sentence_terms`` holds the lexicon terms
+    inside each of ``sentences``.
+    """
+
+    lowered: str
+    sentences: tuple[str, ...]
+    sentence_spans: tuple[tuple[int, int], ...]
+    sentence_terms: tuple[frozenset[str], ...]
+    hits: tuple[TermHit, ...]
+    terms: frozenset[str]
+    lead: str | None
+    thin: bool
+    source_context: tuple[str, str] | None
+    frames: tuple[str, ...]
+
+    def has(self, lexicon: str) -> bool:
+        return any(term in self.terms for term in LEXICON.lexicons[lexicon])
+
+
+def lead_sentence(text: str) -> str | None:
+    """The opening sentence when it reads as one, else None (clipped feed text)."""
+
+    match = LEAD_SENTENCE.search(text.strip())
+    if not match:
+        return None
+    sentence = match.group(1).strip()
+    if len(sentence) < 80 and len(text.strip()) > len(sentence) + 20:
+        return None
+    return sentence
+
+
+def _sentence_spans(text: str) -> list[tuple[int, int]]:
+    spans: list[tuple[int, int]] = []
+    start = 0
+    for match in SENTENCE_BREAK.finditer(text):
+        spans.append((start, match.start()))
+        start = match.end()
+    spans.append((start, len(text)))
+    return spans
+
+
+@lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
+def _analysis(title: str, url: str, source: str, text: str, catalog: SourceCatalog) -> ArticleAnalysis:
+    # One scan over title and text: every hit feeds the frame tags, hits
+    # past the title feed the text-level terms.
+    offset = len(title.lower()) + 1
+    combined = f"{title} {text}".lower()
+    all_hits = LEXICON.scan(combined)
+    hits = tuple(TermHit(hit.term, hit.start - offset, hit.end - offset) for hit in all_hits if hit.start >= offset)
+    lowered = combined[offset:]
+    spans = _sentence_spans(text)
+    if len(lowered) == len(text):
+        sentence_terms = tuple(
+            frozenset(hit.term for hit in hits if start <= hit.start and hit.end <= end) for start, end in spans
+        )
+    else:
+        # Lowercasing changed the length (rare non-ASCII), so offsets do not line up.
+        sentence_terms = tuple(LEXICON.find_terms(text[start:end].lower()) for start, end in spans)
+    frame_terms = frozenset(hit.term for hit in all_hits)
+    frames = tuple(
+        frame for frame in FRAME_TERMS if any(term in frame_terms for term in LEXICON.lexicons[f"frame:{frame}"])
+    )
+    return ArticleAnalysis(
+        lowered=lowered,
+        sentences=tuple(text[start:end] for start, end in spans),
+        sentence_spans=tuple(spans),
+        sentence_terms=sentence_terms,
+        hits=hits,
+        terms=frozenset(hit.term for hit in hits),
+        lead=lead_sentence(text),
+        thin=len(text) < 240 and text.count(".") <= 1,
+        source_context=catalog.context_for(source, title, url),
+        frames=frames or ("General reporting",),
+    )
+
+
+def analyze(article: Article, catalog: SourceCatalog | None = None) -> ArticleAnalysis:
+    """The article's analysis, memoized on its content."""
+
+    catalog = catalog if catalog is not None else default_source_catalog()
+    return _analysis(article.title, article.url, article.source, article.text, catalog)
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from core.news_search import canonical_url
+
+
+ARTICLE_CACHE_TTL_SECONDS = 6 * 60 * 60
+ARTICLE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+CACHE_DIR_ENV = "NEWS_BIAS_CACHE_DIR"
+CACHE_DISABLE_ENV = "NEWS_BIAS_DISABLE_CACHE"
+
+
+@dataclass(frozen=True)
+class CachedArticle:
+    url: str
+    text: str
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+
+    def is_fresh(self, ttl_seconds: float, now: float | None = None) -> bool:
+        return ((now or time.time()) - self.fetched_at) < ttl_seconds
+
+
+class ArticleCache:
+    """Disk-backed store of extracted article text keyed by canonical URL.
+
+    Entries keep the validators (ETag / Last-Modified) from the response
+    that produced them so stale entries can be revalidated with a
+    conditional GET instead of a full download. Total stored text is kept
+    under ``max_bytes`` by evicting the least recently used entries.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        ttl_seconds: float = ARTICLE_CACHE_TTL_SECONDS,
+        max_bytes: int = ARTICLE_CACHE_MAX_BYTES,
+    ) -> None:
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS articles (
+                    url TEXT PRIMARY KEY,
+                    text TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS articles_accessed ON articles (accessed_at)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, url: str) -> CachedArticle | None:
+        key = canonical_url(url)
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT text, etag, last_modified, fetched_at FROM articles WHERE url = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute("UPDATE articles SET accessed_at = ? WHERE url = ?", (time.time(), key))
+        return CachedArticle(url=key, text=row[0], etag=row[1], last_modified=row[2], fetched_at=row[3])
+
+    def put(self, url: str, text: str, *, etag: str | None = None, last_modified: str | None = None) -> None:
+        key = canonical_url(url)
+        now = time.time()
+        size = len(text.encode("utf-8"))
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO articles (url, text, etag, last_modified, fetched_at, accessed_at, size)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (key, text, etag, last_modified, now, now, size),
+            )
+            self._evict(conn)
+
+    def mark_revalidated(self, url: str) -> None:
+        """Restart the TTL of an entry after the origin answered 304."""
+
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "UPDATE articles SET fetched_at = ?, accessed_at = ? WHERE url = ?",
+                (now, now, canonical_url(url)),
+            )
+
+    def total_bytes(self) -> int:
+        with self._lock, self._connect() as conn:
+            return int(conn.execute("SELECT COALESCE(SUM(size), 0) FROM articles").fetchone()[0])
+
+    def clear(self) -> None:
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM articles")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = int(conn.execute("SELECT COALESCE(SUM(size), 0) FROM articles").fetchone()[0])
+        if total <= self.max_bytes:
+            return
+        victims: list[str] = []
+        for url, size in conn.execute("SELECT url, size FROM articles ORDER BY accessed_at ASC").fetchall():
+            if total <= self.max_bytes:
+                break
+            victims.append(url)
+            total -= size
+        conn.executemany("DELETE FROM articles WHERE url = ?", [(url,) for url in victims])
+
+
+_default_cache: ArticleCache | None = None
+_default_lock = threading.Lock()
+
+
+def default_article_cache() -> ArticleCache | None:
+    """Return the process-wide article cache, or None when disabled.
+
+    The cache lives under ``NEWS_BIAS_CACHE_DIR`` when set, otherwise in
+    the user cache directory. Set ``NEWS_BIAS_DISABLE_CACHE=1`` to turn it
+    off.
+    """
+
+    global _default_cache
+    if os.environ.get(CACHE_DISABLE_ENV, "").strip().lower() in {"1", "true", "yes"}:
+        return None
+    with _default_lock:
+        if _default_cache is None:
+            root = os.environ.get(CACHE_DIR_ENV) or Path.home() / ".cache" / "news-bias-pipeline"
+            try:
+                _default_cache = ArticleCache(Path(root) / "articles.sqlite3")
+            except (OSError, sqlite3.Error):
+                return None
+        return _default_cache
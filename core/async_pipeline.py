@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, TypeVar
+
+from core.llm_provider import LLMClient, get_llm
+from core.pipeline import (
+    digest_prompts,
+    digest_response,
+    fetch_articles,
+    parse_digests,
+    preprocess_subject,
+    run_stages,
+    uses_map_reduce,
+)
+from core.schemas import Article, ArticleDigest, LLMKeys, PipelineTrace
+
+
+# Default cap on concurrent model calls / blocking stage steps per event loop.
+ASYNC_CONCURRENCY = 8
+
+T = TypeVar("T")
+
+
+class ConcurrencyLimit(asyncio.Semaphore):
+    """Semaphore that remembers its size, for stage notes."""
+
+    def __init__(self, limit: int) -> None:
+        super().__init__(limit)
+        self.limit = limit
+
+
+def semaphore_for(concurrency: int | asyncio.Semaphore) -> asyncio.Semaphore:
+    return concurrency if isinstance(concurrency, asyncio.Semaphore) else ConcurrencyLimit(max(1, concurrency))
+
+
+async def _limited(semaphore: asyncio.Semaphore, function: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    async with semaphore:
+        return await asyncio.to_thread(function, *args, **kwargs)
+
+
+async def _digest_one(prompt: str, llm: LLMClient, semaphore: asyncio.Semaphore) -> str | None:
+    async with semaphore:
+        return await asyncio.to_thread(digest_response, llm, prompt)
+
+
+async def adigest_articles(
+    articles: list[Article],
+    llm: LLMClient,
+    *,
+    mode: str = "auto",
+    query: str = "",
+    notes: list[str] | None = None,
+    concurrency: int | asyncio.Semaphore = ASYNC_CONCURRENCY,
+) -> list[ArticleDigest] | None:
+    """Async map step: every article's digest prompt is awaited together."""
+
+    if not uses_map_reduce(articles, llm, mode):
+        return None
+    semaphore = semaphore_for(concurrency)
+    prompts = digest_prompts(articles, llm, query)
+    responses = await asyncio.gather(*(_digest_one(prompt, llm, semaphore) for prompt in prompts))
+    workers = min(getattr(semaphore, "limit", len(articles)), llm.max_concurrency or len(articles), len(articles))
+    return parse_digests(articles, list(responses), workers, notes)
+
+
+async def arun_pipeline(
+    subject: str,
+    *,
+    implementation: str,
+    provider: str = "heuristic",
+    model: str | None = None,
+    keys: LLMKeys | None = None,
+    max_articles: int = 5,
+    fixture_articles: list[Article] | None = None,
+    framework_notes: list[str] | None = None,
+    summary_mode: str = "auto",
+    on_partial: Callable[[str, dict[str, Any]], None] | None = None,
+    concurrency: int | asyncio.Semaphore = ASYNC_CONCURRENCY,
+) -> PipelineTrace:
+    """Asyncio-native ``run_pipeline``.
+
+    Stages stay in order within one run, but the fetch, each digest call,
+    and the stage sequence yield the event loop, so many runs
+    (implementations, subjects) overlap their network waits. Pass one
+    ``asyncio.Semaphore`` as ``concurrency`` to share a single limit
+    across runs.
+    """
+
+    semaphore = semaphore_for(concurrency)
+    keys = keys or LLMKeys()
+    llm = get_llm(provider, model, keys)
+    query = preprocess_subject(subject)
+    articles, fetch_notes = await _limited(
+        semaphore,
+        fetch_articles,
+        query,
+        keys=keys,
+        max_articles=max_articles,
+        fixture_articles=fixture_articles,
+    )
+    summary_notes: list[str] = []
+    digests = await adigest_articles(
+        articles, llm, mode=summary_mode, query=query.query, notes=summary_notes, concurrency=semaphore
+    )
+    return await _limited(
+        semaphore,
+        run_stages,
+        subject,
+        query,
+        articles,
+        llm,
+        implementation=implementation,
+        fetch_notes=fetch_notes,
+        digests=digests,
+        summary_notes=summary_notes,
+        framework_notes=framework_notes,
+        on_partial=on_partial,
+    )
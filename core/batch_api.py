@@ -0,0 +1,472 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Protocol
+
+from core.llm_provider import (
+    ANTHROPIC_API,
+    OPENAI_API,
+    LLMClient,
+    anthropic_headers,
+    anthropic_request,
+    anthropic_text,
+    get_llm,
+    openai_headers,
+    openai_request,
+    openai_text,
+)
+from core.pipeline import (
+    digest_prompts,
+    fetch_articles,
+    llm_options,
+    parse_digests,
+    preprocess_subject,
+    run_stages,
+    uses_map_reduce,
+)
+from core.resilience import ProviderUnavailable
+from core.schemas import Article, ArticleDigest, LLMKeys, PipelineTrace, StructuredQuery
+from core.structured_output import STAGE_SCHEMAS, OutputSchema
+from core.transport import HttpTransport, get_transport
+
+
+BATCH_POLL_SECONDS = 30.0
+# Give up on a sweep after a day; that is both providers' completion window.
+BATCH_TIMEOUT_SECONDS = 24 * 3600.0
+BATCH_MAX_REQUESTS = 10_000
+BATCH_FETCH_WORKERS = 4
+DIRECT_WORKERS = 4
+OPENAI_BATCH_ENDPOINT = "/v1/responses"
+
+
+@dataclass(frozen=True)
+class BatchRequest:
+    """One stage prompt for a batch, with the output schema a live call would send."""
+
+    prompt: str
+    schema: OutputSchema | None = None
+
+
+class BatchPending(Exception):
+    """Raised by the replay client when a prompt has no batch result yet."""
+
+    def __init__(self, requests: list[BatchRequest]) -> None:
+        super().__init__(f"{len(requests)} prompt(s) awaiting batch results")
+        self.requests = requests
+
+
+class BatchBackend(Protocol):
+    name: str
+
+    def submit(self, requests: dict[str, BatchRequest]) -> str:
+        """Submit ``custom_id -> request`` entries and return a batch id."""
+
+    def poll(self, batch_id: str) -> dict[str, str | ProviderUnavailable] | None:
+        """Return per-request text or error once the batch has ended, else None."""
+
+    def cancel(self, batch_id: str) -> None:
+        """Stop a batch whose results are no longer wanted."""
+
+
+def request_id(prompt: str) -> str:
+    # Both batch APIs cap custom ids at 64 characters of [A-Za-z0-9_-].
+    return "p-" + hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:40]
+
+
+def _jsonl(text: str) -> list[dict[str, Any]]:
+    rows = []
+    for line in text.splitlines():
+        if line.strip():
+            try:
+                rows.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return [row for row in rows if isinstance(row, dict)]
+
+
+class AnthropicBatches:
+    """Anthropic Message Batches: one POST, poll until ``ended``, then read the JSONL results."""
+
+    name = "anthropic"
+
+    def __init__(
+        self,
+        model: str,
+        token: str | None,
+        *,
+        base_url: str = ANTHROPIC_API,
+        transport: HttpTransport | None = None,
+    ) -> None:
+        self.model = model
+        self.base_url = base_url.rstrip("/")
+        self.headers = anthropic_headers(token)
+        self.transport = transport or get_transport()
+
+    def submit(self, requests: dict[str, BatchRequest]) -> str:
+        body = {
+            "requests": [
+                {"custom_id": custom_id, "params": anthropic_request(self.model, request.prompt, schema=request.schema)}
+                for custom_id, request in requests.items()
+            ]
+        }
+        response = self.transport.post(f"{self.base_url}/v1/messages/batches", headers=self.headers, json=body)
+        response.raise_for_status()
+        return str(response.json()["id"])
+
+    def poll(self, batch_id: str) -> dict[str, str | ProviderUnavailable] | None:
+        response = self.transport.get(f"{self.base_url}/v1/messages/batches/{batch_id}", headers=self.headers)
+        response.raise_for_status()
+        batch = response.json()
+        if batch.get("processing_status") != "ended":
+            return None
+        results = self.transport.get(batch["results_url"], headers=self.headers)
+        results.raise_for_status()
+        outcomes: dict[str, str | ProviderUnavailable] = {}
+        for row in _jsonl(results.text):
+            result = row.get("result", {})
+            if result.get("type") == "succeeded":
+                outcomes[row["custom_id"]] = anthropic_text(result.get("message", {}))
+            else:
+                detail = result.get("error", {}).get("message") or result.get("type", "unknown")
+                outcomes[row["custom_id"]] = ProviderUnavailable(f"anthropic batch: {detail}")
+        return outcomes
+
+    def cancel(self, batch_id: str) -> None:
+        response = self.transport.post(f"{self.base_url}/v1/messages/batches/{batch_id}/cancel", headers=self.headers)
+        response.raise_for_status()
+
+
+class OpenAIBatches:
+    """OpenAI Batch API: upload a JSONL file, create a batch, read the output file."""
+
+    name = "openai"
+
+    def __init__(
+        self,
+        model: str,
+        token: str | None,
+        *,
+        base_url: str = OPENAI_API,
+        transport: HttpTransport | None = None,
+    ) -> None:
+        self.model = model
+        self.base_url = base_url.rstrip("/")
+        self.headers = openai_headers(token)
+        self.transport = transport or get_transport()
+
+    def submit(self, requests: dict[str, BatchRequest]) -> str:
+        lines = "\n".join(
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": OPENAI_BATCH_ENDPOINT,
+                    "body": openai_request(self.model, request.prompt, request.schema),
+                }
+            )
+            for custom_id, request in requests.items()
+        )
+        # The upload is multipart, so requests must set its own Content-Type.
+        auth = {"Authorization": self.headers["Authorization"]}
+        upload = self.transport.post(
+            f"{self.base_url}/v1/files",
+            headers=auth,
+            data={"purpose": "batch"},
+            files={"file": ("batch.jsonl", lines.encode("utf-8"), "application/jsonl")},
+        )
+        upload.raise_for_status()
+        response = self.transport.post(
+            f"{self.base_url}/v1/batches",
+            headers=self.headers,
+            json={
+                "input_file_id": upload.json()["id"],
+                "endpoint": OPENAI_BATCH_ENDPOINT,
+                "completion_window": "24h",
+            },
+        )
+        response.raise_for_status()
+        return str(response.json()["id"])
+
+    def _file_rows(self, file_id: str | None) -> list[dict[str, Any]]:
+        if not file_id:
+            return []
+        response = self.transport.get(f"{self.base_url}/v1/files/{file_id}/content", headers=self.headers)
+        response.raise_for_status()
+        return _jsonl(response.text)
+
+    def poll(self, batch_id: str) -> dict[str, str | ProviderUnavailable] | None:
+        response = self.transport.get(f"{self.base_url}/v1/batches/{batch_id}", headers=self.headers)
+        response.raise_for_status()
+        batch = response.json()
+        status = batch.get("status")
+        if status not in {"completed", "failed", "expired", "cancelled"}:
+            return None
+        outcomes: dict[str, str | ProviderUnavailable] = {}
+        # Expired and cancelled batches still return whatever finished.
+        for row in self._file_rows(batch.get("output_file_id")) + self._file_rows(batch.get("error_file_id")):
+            reply = row.get("response") or {}
+            if reply.get("status_code") == 200:
+                outcomes[row["custom_id"]] = openai_text(reply.get("body", {}))
+            else:
+                detail = (row.get("error") or {}).get("message") or f"HTTP {reply.get('status_code')}"
+                outcomes[row["custom_id"]] = ProviderUnavailable(f"openai batch: {detail}")
+        if status != "completed" and not outcomes:
+            raise ProviderUnavailable(f"openai batch {batch_id} {status}")
+        return outcomes
+
+    def cancel(self, batch_id: str) -> None:
+        response = self.transport.post(f"{self.base_url}/v1/batches/{batch_id}/cancel", headers=self.headers)
+        response.raise_for_status()
+
+
+class DirectBackend:
+    """Stand-in for providers without a batch API: runs each batch's prompts directly, concurrently."""
+
+    name = "direct"
+
+    def __init__(self, llm: LLMClient, *, workers: int | None = None) -> None:
+        self.llm = llm
+        self.workers = workers or llm.max_concurrency or DIRECT_WORKERS
+        self._done: dict[str, dict[str, str | ProviderUnavailable]] = {}
+
+    def _one(self, request: BatchRequest) -> str | ProviderUnavailable:
+        try:
+            return self.llm.generate(request.prompt, **llm_options(self.llm, schema=request.schema))
+        except ProviderUnavailable as exc:
+            return exc
+
+    def submit(self, requests: dict[str, BatchRequest]) -> str:
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(requests)))) as executor:
+            results = list(executor.map(self._one, requests.values()))
+        batch_id = f"direct-{len(self._done)}"
+        self._done[batch_id] = dict(zip(requests, results, strict=True))
+        return batch_id
+
+    def poll(self, batch_id: str) -> dict[str, str | ProviderUnavailable] | None:
+        return self._done.pop(batch_id)
+
+    def cancel(self, batch_id: str) -> None:
+        self._done.pop(batch_id, None)
+
+
+def batch_backend(
+    provider: str,
+    model: str | None = None,
+    keys: LLMKeys | None = None,
+    *,
+    base_url: str | None = None,
+    transport: HttpTransport | None = None,
+) -> BatchBackend:
+    """The provider's batch API, or direct calls when it has none (Google, Ollama)."""
+
+    keys = keys or LLMKeys()
+    llm = get_llm(provider, model, keys, transport=transport)
+    if llm.provider == "anthropic":
+        return AnthropicBatches(llm.model, keys.anthropic_token, base_url=base_url or ANTHROPIC_API, transport=transport)
+    if llm.provider == "openai":
+        return OpenAIBatches(llm.model, keys.openai_token, base_url=base_url or OPENAI_API, transport=transport)
+    return DirectBackend(llm)
+
+
+@dataclass
+class _Job:
+    subject: str
+    query: StructuredQuery
+    articles: list[Article]
+    fetch_notes: list[str]
+    trace: PipelineTrace | None = None
+    pending: list[BatchRequest] = field(default_factory=list)
+
+
+def _replay_client(
+    provider: str, model: str, answers: dict[str, str], errors: dict[str, str]
+) -> LLMClient:
+    def generate(prompt: str, schema: OutputSchema | None = None) -> str:
+        if prompt in errors:
+            raise ProviderUnavailable(errors[prompt])
+        if prompt in answers:
+            return answers[prompt]
+        raise BatchPending([BatchRequest(prompt, schema)])
+
+    # Structured so the stages hand over their schemas; each backend decides
+    # whether its provider can take them.
+    return LLMClient(provider=provider, model=model, generate=generate, structured=True)
+
+
+def _digests(
+    job: _Job,
+    llm: LLMClient,
+    answers: dict[str, str],
+    errors: dict[str, str],
+    mode: str,
+    notes: list[str],
+) -> list[ArticleDigest] | None:
+    if not uses_map_reduce(job.articles, llm, mode):
+        return None
+    prompts = digest_prompts(job.articles, llm, job.query.query)
+    missing = [prompt for prompt in prompts if prompt not in answers and prompt not in errors]
+    if missing:
+        raise BatchPending([BatchRequest(prompt, STAGE_SCHEMAS["digest"]) for prompt in missing])
+    return parse_digests(job.articles, [answers.get(prompt) for prompt in prompts], len(job.articles), notes)
+
+
+def _replay(
+    job: _Job,
+    llm: LLMClient,
+    answers: dict[str, str],
+    errors: dict[str, str],
+    *,
+    implementation: str,
+    summary_mode: str,
+    framework_notes: list[str],
+) -> PipelineTrace:
+    """Run the stages against known batch results; raises ``BatchPending`` at the first unanswered prompt.
+
+    Every replay starts from the first stage, so a later prompt is only
+    submitted once the outputs it is built from are final.
+    """
+
+    summary_notes: list[str] = []
+    digests = _digests(job, llm, answers, errors, summary_mode, summary_notes)
+    return run_stages(
+        job.subject,
+        job.query,
+        job.articles,
+        llm,
+        implementation=implementation,
+        fetch_notes=job.fetch_notes,
+        digests=digests,
+        summary_notes=summary_notes,
+        framework_notes=list(framework_notes),
+    )
+
+
+def _fetch(subject: str, keys: LLMKeys, max_articles: int, fixture_articles: list[Article] | None) -> _Job:
+    query = preprocess_subject(subject)
+    articles, notes = fetch_articles(query, keys=keys, max_articles=max_articles, fixture_articles=fixture_articles)
+    return _Job(subject=subject, query=query, articles=articles, fetch_notes=notes)
+
+
+def run_batch(
+    subjects: list[str],
+    *,
+    provider: str = "heuristic",
+    model: str | None = None,
+    keys: LLMKeys | None = None,
+    max_articles: int = 5,
+    fixture_articles: list[Article] | None = None,
+    summary_mode: str = "auto",
+    implementation: str = "static",
+    framework_notes: list[str] | None = None,
+    backend: BatchBackend | None = None,
+    poll_seconds: float = BATCH_POLL_SECONDS,
+    timeout_seconds: float = BATCH_TIMEOUT_SECONDS,
+    max_requests: int = BATCH_MAX_REQUESTS,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> list[PipelineTrace]:
+    """Run many subjects through the provider's batch API instead of live calls.
+
+    Each subject's pipeline is replayed until it reaches a prompt with no
+    result; those prompts are submitted together and, as each batch ends,
+    the subjects waiting on it resume. Stage order is preserved because a
+    stage's prompt only exists once the earlier stages' results are in, so
+    a sweep takes one batch round per model-backed stage (plus one for
+    map-reduce digests). Identical prompts across subjects are sent once.
+    Requests that fail, or are still out at ``timeout_seconds``, fall back
+    to the heuristic stage output with a note, as in live runs; batches
+    still out at the deadline are cancelled and no new ones are submitted.
+    """
+
+    keys = keys or LLMKeys()
+    llm = get_llm(provider, model, keys)
+    backend = backend or batch_backend(llm.provider, llm.model, keys)
+    with ThreadPoolExecutor(max_workers=max(1, min(BATCH_FETCH_WORKERS, len(subjects)))) as executor:
+        jobs = list(executor.map(lambda subject: _fetch(subject, keys, max_articles, fixture_articles), subjects))
+
+    answers: dict[str, str] = {}
+    errors: dict[str, str] = {}
+    inflight: dict[str, dict[str, BatchRequest]] = {}
+    submitted: set[str] = set()
+    batches = 0
+    deadline = clock() + timeout_seconds
+
+    while True:
+        for job in jobs:
+            if job.trace is not None:
+                continue
+            replay_llm = _replay_client(llm.provider, llm.model, answers, errors)
+            try:
+                job.trace = _replay(
+                    job,
+                    replay_llm,
+                    answers,
+                    errors,
+                    implementation=implementation,
+                    summary_mode=summary_mode,
+                    framework_notes=framework_notes or [],
+                )
+            except BatchPending as pending:
+                job.pending = pending.requests
+        waiting = [job for job in jobs if job.trace is None]
+        if not waiting:
+            break
+
+        fresh = {
+            request_id(request.prompt): request
+            for job in waiting
+            for request in job.pending
+            if request.prompt not in submitted
+        }
+        if clock() >= deadline:
+            # Past the deadline nothing new is sent and batches still out are
+            # abandoned; the remaining stages fall back to heuristic output.
+            errors.update({request.prompt: f"{backend.name} batch timed out before submit" for request in fresh.values()})
+            for batch_id, chunk in inflight.items():
+                detail = f"{backend.name} batch timed out"
+                try:
+                    backend.cancel(batch_id)
+                except Exception as exc:
+                    detail += f" (cancel failed: {exc})"
+                errors.update({request.prompt: detail for request in chunk.values()})
+            inflight.clear()
+            continue
+
+        ids = list(fresh)
+        for start in range(0, len(ids), max_requests):
+            chunk = {custom_id: fresh[custom_id] for custom_id in ids[start : start + max_requests]}
+            try:
+                inflight[backend.submit(chunk)] = chunk
+            except Exception as exc:
+                errors.update({request.prompt: f"{backend.name} batch submit failed: {exc}" for request in chunk.values()})
+            submitted.update(request.prompt for request in chunk.values())
+            batches += 1
+
+        progressed = False
+        for batch_id, chunk in list(inflight.items()):
+            try:
+                outcomes = backend.poll(batch_id)
+            except Exception as exc:
+                outcomes = {custom_id: ProviderUnavailable(f"{backend.name} batch: {exc}") for custom_id in chunk}
+            if outcomes is None:
+                continue
+            for custom_id, request in chunk.items():
+                outcome = outcomes.get(custom_id, ProviderUnavailable(f"{backend.name} batch: no result returned"))
+                if isinstance(outcome, ProviderUnavailable):
+                    errors[request.prompt] = str(outcome)
+                else:
+                    answers[request.prompt] = outcome
+            del inflight[batch_id]
+            progressed = True
+        if not progressed and inflight:
+            sleep(poll_seconds)
+
+    note = f"batch mode ({backend.name}): {batches} batch(es), {len(submitted)} request(s) for {len(jobs)} subject(s)"
+    traces = [job.trace for job in jobs if job.trace is not None]
+    for trace in traces:
+        trace.framework_notes.append(note)
+    return traces
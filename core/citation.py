@@ -1,32 +1,188 @@
 from __future__ import annotations
 
+import re
+import unicodedata
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass
+
 from core.schemas import Article, Citation, PipelineTrace
 
 
+# Typographic variants models often straighten or swap when quoting.
+_EQUIVALENTS = str.maketrans(
+    {
+        "\u2018": "'",
+        "\u2019": "'",
+        "\u201a": "'",
+        "\u201b": "'",
+        "\u201c": '"',
+        "\u201d": '"',
+        "\u201e": '"',
+        "\u2013": "-",
+        "\u2014": "-",
+        "\u2212": "-",
+    }
+)
+# Soft hyphen and zero-width characters.
+_DROPPED = frozenset("\u00ad\u200b\u200c\u200d\u2060\ufeff")
+# Whitespace other than a lone space, and runs of non-ASCII characters.
+_IRREGULAR = re.compile(r"\s{2,}|[^\S ]|[^\x00-\x7f\s]+")
+# The same test for ASCII text, as plain substring checks.
+_ASCII_IRREGULAR_SPACE = ("  ", "\t", "\n", "\r", "\x0b", "\x0c", "\x1c", "\x1d", "\x1e", "\x1f")
+
+# Characters of article text shown on each side of a highlighted span.
+HIGHLIGHT_CONTEXT_CHARS = 160
+
+
 class CitationError(ValueError):
     pass
 
 
+def _normalize_char(char: str) -> str:
+    if char in _DROPPED:
+        return ""
+    return unicodedata.normalize("NFKD", char).translate(_EQUIVALENTS)
+
+
+@dataclass(frozen=True)
+class NormalizedText:
+    """Normalized text with a sparse map back to offsets in the original.
+
+    From normalized offset ``starts[i]`` on, offsets map linearly onto the
+    original from ``origins[i]``; breakpoints only sit where normalization
+    shifted the text, so plain prose needs one.
+    """
+
+    text: str
+    starts: list[int]
+    origins: list[int]
+
+    def original(self, position: int) -> int:
+        mark = bisect_right(self.starts, position) - 1
+        return self.origins[mark] + position - self.starts[mark]
+
+
+def normalized_view(text: str) -> NormalizedText:
+    """Whitespace- and Unicode-normalized ``text``, mapped back to ``text`` offsets.
+
+    Whitespace runs collapse to one space; characters are NFKD-decomposed,
+    typographic quotes and dashes become ASCII, and invisible format
+    characters drop out. Decomposition works per character, so a span and
+    its article normalize the same way wherever the span starts.
+    """
+
+    if text.isascii() and not any(space in text for space in _ASCII_IRREGULAR_SPACE):
+        # Fetched text is whitespace-collapsed already (clean_feed_text).
+        return NormalizedText(text, [0], [0])
+    pieces: list[str] = []
+    starts: list[int] = []
+    origins: list[int] = []
+    length = 0
+
+    def append(piece: str, origin: int) -> None:
+        nonlocal length
+        if not starts or origins[-1] + length - starts[-1] != origin:
+            starts.append(length)
+            origins.append(origin)
+        pieces.append(piece)
+        length += len(piece)
+
+    cursor = 0
+    # Plain ASCII text between irregular stretches is copied as is.
+    for match in _IRREGULAR.finditer(text):
+        start = match.start()
+        if cursor < start:
+            append(text[cursor:start], cursor)
+        cursor = match.end()
+        token = match.group()
+        if token[0].isspace():
+            append(" ", start)
+            continue
+        for index, char in enumerate(token, start):
+            for piece in _normalize_char(char):
+                append(piece, index)
+    if cursor < len(text):
+        append(text[cursor:], cursor)
+    return NormalizedText("".join(pieces), starts, origins)
+
+
+def normalize_span(text: str) -> str:
+    return normalized_view(text).text.strip()
+
+
+class CitationIndex:
+    """Articles of one trace keyed by id, for verifying many citations.
+
+    Spans are matched verbatim first; a span that differs only in
+    whitespace or Unicode form is matched against a normalized view of
+    the article, built once per article on first need. Matched offsets
+    are stored on the citation.
+    """
+
+    def __init__(self, articles: Iterable[Article]) -> None:
+        self._articles = {article.id: article for article in articles}
+        self._views: dict[str, NormalizedText] = {}
+
+    def _view(self, article: Article) -> NormalizedText:
+        view = self._views.get(article.id)
+        if view is None:
+            view = self._views[article.id] = normalized_view(article.text)
+        return view
+
+    def locate(self, article: Article, span_text: str) -> tuple[int, int] | None:
+        """Character offsets of ``span_text`` in the article's text, or None."""
+
+        start = article.text.find(span_text)
+        if start != -1:
+            return start, start + len(span_text)
+        needle = normalize_span(span_text)
+        if not needle:
+            return None
+        view = self._view(article)
+        position = view.text.find(needle)
+        if position == -1:
+            return None
+        return view.original(position), view.original(position + len(needle) - 1) + 1
+
+    def check(self, citation: Citation) -> str | None:
+        """Like ``verify`` but leaves the citation untouched."""
+
+        return self._check(citation)[0]
+
+    def verify(self, citation: Citation) -> str | None:
+        error, offsets = self._check(citation)
+        citation.start, citation.end = offsets or (None, None)
+        return error
+
+    def _check(self, citation: Citation) -> tuple[str | None, tuple[int, int] | None]:
+        article = self._articles.get(citation.article_id)
+        if article is None:
+            return f"{citation.article_id}: article not found", None
+        offsets = self.locate(article, citation.span_text)
+        if offsets is None:
+            return f"{citation.article_id}: span not found: {citation.span_text!r}", None
+        return None, offsets
+
+
 def verify_citation(citation: Citation, articles: list[Article]) -> str | None:
-    article_by_id = {article.id: article for article in articles}
-    article = article_by_id.get(citation.article_id)
-    if article is None:
-        return f"{citation.article_id}: article not found"
-    if citation.span_text not in article.text:
-        return f"{citation.article_id}: span not found: {citation.span_text!r}"
-    return None
+    return CitationIndex(articles).verify(citation)
 
 
-def verify_citations(trace: PipelineTrace) -> list[str]:
+def trace_citations(trace: PipelineTrace) -> list[Citation]:
     citations: list[Citation] = []
     citations.extend(trace.summary.framing_notes)
     citations.extend(trace.bias_judgment.evidence)
     citations.extend(trace.critique.trigger_phrases)
+    return citations
+
 
+def verify_citations(trace: PipelineTrace) -> list[str]:
+    index = CitationIndex(trace.articles)
     errors = [
         error
-        for citation in citations
-        if (error := verify_citation(citation, trace.articles)) is not None
+        for citation in trace_citations(trace)
+        if (error := index.verify(citation)) is not None
     ]
     return errors
 
@@ -35,3 +191,13 @@ def raise_on_citation_errors(trace: PipelineTrace) -> None:
     errors = verify_citations(trace)
     if errors:
         raise CitationError("; ".join(errors))
+
+
+def highlight_parts(text: str, start: int, end: int, context: int = HIGHLIGHT_CONTEXT_CHARS) -> tuple[str, str, str]:
+    """Split ``text`` into (lead-in, span, trail) around a located span, trimmed to ``context`` chars a side."""
+
+    before = text[max(0, start - context) : start]
+    after = text[end : end + context]
+    lead = "\u2026" if start > context else ""
+    trail = "\u2026" if end + context < len(text) else ""
+    return lead + before, text[start:end], after + trail
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import hashlib
+import re
+
+from core.news_search import canonical_url
+
+
+SIMHASH_BITS = 64
+HIT_DISTANCE = 3
+TEXT_DISTANCE = 6
+MIN_TEXT_CHARS = 200
+SHINGLE_WORDS = 3
+
+
+def _tokens(text: str) -> list[str]:
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+
+def simhash(text: str, *, shingle: int = SHINGLE_WORDS) -> int:
+    """Return a 64-bit SimHash over word shingles.
+
+    Texts that share most of their shingles land a few bits apart, so a
+    small Hamming distance means "same story, minor edits" (syndicated
+    copies with a different dateline, byline, or trailing boilerplate).
+    """
+
+    tokens = _tokens(text)
+    if len(tokens) >= shingle:
+        features = [" ".join(tokens[index : index + shingle]) for index in range(len(tokens) - shingle + 1)]
+    else:
+        features = tokens
+    weights = [0] * SIMHASH_BITS
+    for feature in features:
+        digest = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if digest >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def hamming(left: int, right: int) -> int:
+    return (left ^ right).bit_count()
+
+
+def normalized_title(hit: dict[str, str]) -> str:
+    """Lowercased title with any trailing " - Source" attribution removed.
+
+    Aggregators such as Google News append the publisher to the headline,
+    which would otherwise make copies of one wire story look distinct.
+    """
+
+    title = hit.get("title") or ""
+    source = (hit.get("source") or "").strip()
+    if source and title.lower().endswith(" - " + source.lower()):
+        title = title[: -(len(source) + 3)]
+    return " ".join(_tokens(title))
+
+
+def collapse_duplicate_hits(hits: list[dict[str, str]]) -> tuple[list[dict[str, str]], list[tuple[dict[str, str], dict[str, str]]]]:
+    """Keep the first hit of each duplicate cluster.
+
+    Hits are duplicates when their canonical URLs match, their normalized
+    titles match, or their title + description SimHashes are within
+    ``HIT_DISTANCE`` bits. Returns the kept hits in their original order
+    and ``(duplicate, representative)`` pairs for every collapsed hit.
+    """
+
+    kept: list[dict[str, str]] = []
+    collapsed: list[tuple[dict[str, str], dict[str, str]]] = []
+    by_url: dict[str, dict[str, str]] = {}
+    by_title: dict[str, dict[str, str]] = {}
+    signatures: list[tuple[int, dict[str, str]]] = []
+    for hit in hits:
+        url_key = canonical_url(hit["url"])
+        title_key = normalized_title(hit)
+        representative = by_url.get(url_key) or (by_title.get(title_key) if title_key else None)
+        signature = simhash(f"{title_key} {hit.get('description', '')}")
+        if representative is None and len(_tokens(hit.get("description", ""))) >= SHINGLE_WORDS * 3:
+            representative = next((rep for sig, rep in signatures if hamming(sig, signature) <= HIT_DISTANCE), None)
+        if representative is not None:
+            collapsed.append((hit, representative))
+            continue
+        kept.append(hit)
+        by_url[url_key] = hit
+        if title_key:
+            by_title[title_key] = hit
+        signatures.append((signature, hit))
+    return kept, collapsed
+
+
+class TextDeduplicator:
+    """Track extracted texts and flag near-duplicates of earlier ones."""
+
+    def __init__(self, *, max_distance: int = TEXT_DISTANCE) -> None:
+        self.max_distance = max_distance
+        self._seen: list[tuple[int, str]] = []
+
+    def duplicate_of(self, text: str) -> str | None:
+        if len(text) < MIN_TEXT_CHARS:
+            return None
+        signature = simhash(text)
+        return next((url for seen, url in self._seen if hamming(seen, signature) <= self.max_distance), None)
+
+    def add(self, url: str, text: str) -> None:
+        if len(text) >= MIN_TEXT_CHARS:
+            self._seen.append((simhash(text), url))
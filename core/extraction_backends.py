@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+import importlib.util
+import re
+from dataclasses import dataclass
+from html.parser import HTMLParser
+from typing import Any, Callable, Protocol
+
+
+SKIP_TAGS = {"script", "style", "noscript", "svg", "template", "iframe"}
+BLOCK_TAGS = {
+    "address", "article", "aside", "blockquote", "body", "dd", "div", "dl", "dt", "figcaption", "figure",
+    "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "li", "main", "menu", "nav", "ol", "p",
+    "pre", "section", "table", "td", "th", "tr", "ul",
+}  # fmt: skip
+BOILERPLATE_TAGS = {"aside", "button", "footer", "form", "header", "label", "menu", "nav", "select"}
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr"}
+BOILERPLATE_HINT = re.compile(
+    r"(?:^|[\s_-])(?:nav|navbar|menu|footer|header|sidebar|share|sharing|social|promo|related|recommended|"
+    r"subscribe|newsletter|cookie|banner|advert|ads?|comments?|breadcrumbs?|paywall|popup|modal)(?:$|[\s_-])",
+    re.I,
+)
+MIN_BLOCK_CHARS = 30
+MAX_LINK_DENSITY = 0.5
+MIN_SCORED_CHARS = 200
+
+
+@dataclass(frozen=True)
+class TextBlock:
+    """Text owned directly by one block element, plus the signals used to score it."""
+
+    text: str
+    link_chars: int
+    boilerplate: bool
+
+
+def keep_block(block: TextBlock) -> bool:
+    """Content-density score: drop short, link-heavy, or boilerplate-region blocks.
+
+    The checks are local to one block so they can run while a page is
+    still streaming in.
+    """
+
+    length = len(block.text)
+    if length < MIN_BLOCK_CHARS or block.boilerplate:
+        return False
+    if block.link_chars / length > MAX_LINK_DENSITY:
+        return False
+    words = block.text.count(" ") + 1
+    # Menus and tag lists are many short words with no sentence punctuation.
+    return words >= 6 or any(mark in block.text for mark in ".!?")
+
+
+def _boilerplate_attrs(attrs: list[tuple[str, str | None]] | dict[str, Any]) -> bool:
+    items = attrs.items() if isinstance(attrs, dict) else attrs
+    for name, value in items:
+        if name in {"class", "id", "role"} and value and BOILERPLATE_HINT.search(str(value)):
+            return True
+        if name == "aria-hidden" and value == "true":
+            return True
+    return False
+
+
+def _join(parts: list[str]) -> str:
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(parts)).strip()
+
+
+class ExtractionSession(Protocol):
+    collected: int
+
+    def feed(self, data: str) -> None: ...
+
+    def close(self) -> None: ...
+
+    def text(self) -> str: ...
+
+
+class SimpleTextExtractor(HTMLParser):
+    """Original extractor: every visible text node of at least 30 characters."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._skip_depth = 0
+        self._pending: list[str] = []
+        self.parts: list[str] = []
+        self.collected = 0
+
+    def _flush(self) -> None:
+        # Incremental feeds can split one text node across chunks, so data
+        # is buffered until the next markup boundary.
+        if not self._pending:
+            return
+        cleaned = " ".join("".join(self._pending).split())
+        self._pending.clear()
+        if len(cleaned) >= MIN_BLOCK_CHARS:
+            self.parts.append(cleaned)
+            self.collected += len(cleaned)
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._flush()
+        if tag.lower() in {"script", "style", "noscript", "svg"}:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush()
+        if tag.lower() in {"script", "style", "noscript", "svg"} and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_comment(self, data: str) -> None:
+        self._flush()
+
+    def handle_decl(self, decl: str) -> None:
+        self._flush()
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth:
+            return
+        self._pending.append(data)
+
+    def close(self) -> None:
+        super().close()
+        self._flush()
+
+    def text(self) -> str:
+        return _join(self.parts)
+
+
+@dataclass
+class _OpenBlock:
+    tag: str
+    boilerplate: bool
+    chunks: list[str]
+    inline_depth: int = 0
+    link_chars: int = 0
+
+
+class BlockTextExtractor(HTMLParser):
+    """Pure-Python block extractor with content-density scoring.
+
+    Text is grouped by its nearest block element, each block is scored
+    with ``keep_block`` when it closes, and boilerplate regions (nav,
+    footer, share bars, ...) are dropped. If scoring keeps too little text
+    the session falls back to the simple all-text-nodes output gathered in
+    the same pass.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._stack: list[_OpenBlock] = [_OpenBlock(tag="#root", boilerplate=False, chunks=[])]
+        self._inline: list[tuple[str, bool]] = []
+        self._skip_depth = 0
+        self.parts: list[str] = []
+        self.collected = 0
+        self._fallback = SimpleTextExtractor()
+
+    def _emit(self, block: _OpenBlock) -> None:
+        text = " ".join("".join(block.chunks).split())
+        block.chunks.clear()
+        link_chars, block.link_chars = block.link_chars, 0
+        if text and keep_block(TextBlock(text=text, link_chars=link_chars, boilerplate=block.boilerplate)):
+            self.parts.append(text)
+            self.collected += len(text)
+
+    def _in_boilerplate(self) -> bool:
+        return self._stack[-1].boilerplate or any(flag for _tag, flag in self._inline)
+
+    def _in_link(self) -> bool:
+        return any(tag == "a" for tag, _flag in self._inline)
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._fallback.handle_starttag(tag, attrs)
+        tag = tag.lower()
+        if tag in SKIP_TAGS:
+            self._skip_depth += 1
+            return
+        if tag in VOID_TAGS:
+            if tag == "br":
+                self._stack[-1].chunks.append(" ")
+            return
+        boilerplate = self._in_boilerplate() or tag in BOILERPLATE_TAGS or _boilerplate_attrs(attrs)
+        if tag in BLOCK_TAGS:
+            if tag in {"p", "li"} and self._stack[-1].tag == tag:
+                self._close_block()
+            self._emit(self._stack[-1])
+            self._stack.append(_OpenBlock(tag=tag, boilerplate=boilerplate, chunks=[], inline_depth=len(self._inline)))
+        else:
+            self._inline.append((tag, boilerplate))
+
+    def _close_block(self) -> None:
+        block = self._stack.pop()
+        # Inline tags left unclosed inside the block end with it.
+        del self._inline[block.inline_depth :]
+        self._emit(block)
+
+    def handle_endtag(self, tag: str) -> None:
+        self._fallback.handle_endtag(tag)
+        tag = tag.lower()
+        if tag in SKIP_TAGS:
+            if self._skip_depth:
+                self._skip_depth -= 1
+            return
+        if tag in BLOCK_TAGS:
+            if any(block.tag == tag for block in self._stack[1:]):
+                while self._stack[-1].tag != tag:
+                    self._close_block()
+                self._close_block()
+            return
+        for index in range(len(self._inline) - 1, self._stack[-1].inline_depth - 1, -1):
+            if self._inline[index][0] == tag:
+                del self._inline[index:]
+                break
+
+    def handle_comment(self, data: str) -> None:
+        self._fallback.handle_comment(data)
+
+    def handle_decl(self, decl: str) -> None:
+        self._fallback.handle_decl(decl)
+
+    def handle_data(self, data: str) -> None:
+        self._fallback.handle_data(data)
+        if self._skip_depth:
+            return
+        block = self._stack[-1]
+        if self._in_boilerplate() and not block.boilerplate:
+            # Inline boilerplate (e.g. a share <span>) inside a content block.
+            return
+        block.chunks.append(data)
+        if self._in_link():
+            block.link_chars += len(" ".join(data.split()))
+
+    def close(self) -> None:
+        super().close()
+        while len(self._stack) > 1:
+            self._close_block()
+        self._emit(self._stack[0])
+        self._fallback.close()
+
+    def text(self) -> str:
+        if self.collected >= MIN_SCORED_CHARS or self._fallback.collected <= self.collected:
+            return _join(self.parts)
+        return self._fallback.text()
+
+
+class LxmlTextExtractor:
+    """C-backed block extractor built on ``lxml.etree.HTMLPullParser``.
+
+    Applies the same block scoring as ``BlockTextExtractor``. Each block is
+    scored on its end event and then cleared, so memory stays flat on
+    large pages.
+    """
+
+    def __init__(self) -> None:
+        from lxml import etree
+
+        self._parser = etree.HTMLPullParser(events=("start", "end"), no_network=True, recover=True)
+        self._boilerplate: list[bool] = []
+        self.parts: list[str] = []
+        self.collected = 0
+        self.all_parts: list[str] = []
+        self._all_collected = 0
+
+    def _own_text(self, element: Any, in_link: bool, counts: list[int], out: list[str]) -> None:
+        # Text that belongs to this block: its own text plus inline
+        # descendants, but not nested blocks (they are scored on their own).
+        if element.text:
+            out.append(element.text)
+            if in_link:
+                counts[0] += len(" ".join(element.text.split()))
+        for child in element:
+            tag = child.tag if isinstance(child.tag, str) else ""
+            if tag and tag.lower() not in BLOCK_TAGS and tag.lower() not in SKIP_TAGS:
+                if not _boilerplate_attrs(dict(child.attrib)) and tag.lower() not in BOILERPLATE_TAGS:
+                    self._own_text(child, in_link or tag.lower() == "a", counts, out)
+            if child.tail:
+                out.append(child.tail)
+                if in_link:
+                    counts[0] += len(" ".join(child.tail.split()))
+
+    def _collect_all(self, element: Any) -> None:
+        for piece in (element.text, *(child.tail for child in element)):
+            cleaned = " ".join((piece or "").split())
+            if len(cleaned) >= MIN_BLOCK_CHARS:
+                self.all_parts.append(cleaned)
+                self._all_collected += len(cleaned)
+
+    def _drain(self) -> None:
+        for event, element in self._parser.read_events():
+            tag = element.tag.lower() if isinstance(element.tag, str) else ""
+            if event == "start":
+                parent = self._boilerplate[-1] if self._boilerplate else False
+                self._boilerplate.append(parent or tag in BOILERPLATE_TAGS or _boilerplate_attrs(dict(element.attrib)))
+                continue
+            boilerplate = self._boilerplate.pop() if self._boilerplate else False
+            if tag in SKIP_TAGS:
+                element.text = None
+                continue
+            if tag in BLOCK_TAGS:
+                self._collect_all(element)
+                chunks: list[str] = []
+                counts = [0]
+                self._own_text(element, False, counts, chunks)
+                text = " ".join("".join(chunks).split())
+                if text and keep_block(TextBlock(text=text, link_chars=counts[0], boilerplate=boilerplate)):
+                    self.parts.append(text)
+                    self.collected += len(text)
+                element.clear(keep_tail=True)
+
+    def feed(self, data: str) -> None:
+        self._parser.feed(data)
+        self._drain()
+
+    def close(self) -> None:
+        try:
+            self._parser.close()
+        except Exception:
+            pass
+        self._drain()
+
+    def text(self) -> str:
+        if self.collected >= MIN_SCORED_CHARS or self._all_collected <= self.collected:
+            return _join(self.parts)
+        return _join(self.all_parts)
+
+
+EXTRACTION_BACKENDS: dict[str, Callable[[], ExtractionSession]] = {
+    "simple": SimpleTextExtractor,
+    "htmlparser": BlockTextExtractor,
+    "lxml": LxmlTextExtractor,
+}
+
+
+def available_backends() -> list[str]:
+    names = ["simple", "htmlparser"]
+    if importlib.util.find_spec("lxml") is not None:
+        names.append("lxml")
+    return names
+
+
+def default_backend() -> str:
+    """Prefer the C-backed parser when installed, else the pure-Python scorer."""
+
+    return "lxml" if "lxml" in available_backends() else "htmlparser"
+
+
+def new_session(backend: str | None = None) -> ExtractionSession:
+    name = backend or default_backend()
+    if name not in EXTRACTION_BACKENDS:
+        raise ValueError(f"Unknown extraction backend {name!r}. Choose {', '.join(EXTRACTION_BACKENDS)}.")
+    return EXTRACTION_BACKENDS[name]()
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Callable
+from urllib.parse import urlsplit
+
+from core.text_extraction import CacheStatus, ExtractedText, fetch_article_text
+
+
+FETCH_WORKERS = 8
+FETCH_PER_HOST = 2
+FETCH_DEADLINE_SECONDS = 30.0
+FETCH_TIMEOUT_SECONDS = 25
+
+DEADLINE_ERROR = "deadline"
+
+Extractor = Callable[..., "ExtractedText | str"]
+
+
+@dataclass(frozen=True)
+class FetchOutcome:
+    url: str
+    text: str | None = None
+    error: str | None = None
+    cache_status: CacheStatus = "uncached"
+
+
+def _host(url: str) -> str:
+    return urlsplit(url).netloc.lower()
+
+
+def cache_summary(outcomes: list[FetchOutcome]) -> str | None:
+    counts = {status: 0 for status in ("hit", "revalidated", "miss")}
+    for outcome in outcomes:
+        if outcome.cache_status in counts:
+            counts[outcome.cache_status] += 1
+    if not any(counts.values()):
+        return None
+    return (
+        f"article cache: {counts['hit']} hit(s), {counts['revalidated']} revalidated, "
+        f"{counts['miss']} miss(es)"
+    )
+
+
+def fetch_texts(
+    urls: list[str],
+    *,
+    extract: Extractor | None = None,
+    max_workers: int = FETCH_WORKERS,
+    per_host: int = FETCH_PER_HOST,
+    deadline: float = FETCH_DEADLINE_SECONDS,
+    timeout: int = FETCH_TIMEOUT_SECONDS,
+) -> list[FetchOutcome]:
+    """Fetch article text for many URLs with bounded concurrency.
+
+    At most ``max_workers`` requests run at once and at most ``per_host``
+    of them target the same host. Work still queued or in flight when the
+    overall ``deadline`` passes is reported with ``error="deadline"`` so
+    the caller can fall back to feed metadata. Outcomes are returned in
+    the same order as ``urls`` regardless of completion order.
+    """
+
+    if not urls:
+        return []
+    extract = extract or fetch_article_text
+    outcomes: list[FetchOutcome | None] = [None] * len(urls)
+
+    max_workers = max(1, max_workers)
+    per_host = max(1, per_host)
+    started = time.monotonic()
+    pending = deque(range(len(urls)))
+    in_flight: dict[Future[ExtractedText | str], int] = {}
+    host_load: dict[str, int] = {}
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fetch")
+
+    def remaining() -> float:
+        return deadline - (time.monotonic() - started)
+
+    def dispatch() -> None:
+        skipped: list[int] = []
+        while pending and len(in_flight) < max_workers:
+            index = pending.popleft()
+            host = _host(urls[index])
+            if host_load.get(host, 0) >= per_host:
+                skipped.append(index)
+                continue
+            host_load[host] = host_load.get(host, 0) + 1
+            request_timeout = max(1, min(timeout, int(remaining()) + 1))
+            in_flight[executor.submit(extract, urls[index], timeout=request_timeout)] = index
+        pending.extendleft(reversed(skipped))
+
+    try:
+        dispatch()
+        while in_flight:
+            left = remaining()
+            if left <= 0:
+                break
+            done, _ = wait(list(in_flight), timeout=left, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = in_flight.pop(future)
+                host = _host(urls[index])
+                host_load[host] -= 1
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    outcomes[index] = FetchOutcome(url=urls[index], error=exc.__class__.__name__)
+                    continue
+                if isinstance(result, ExtractedText):
+                    outcomes[index] = FetchOutcome(url=urls[index], text=result.text, cache_status=result.cache_status)
+                else:
+                    outcomes[index] = FetchOutcome(url=urls[index], text=result)
+            if remaining() > 0:
+                dispatch()
+    finally:
+        # Late responses are discarded; their threads finish on their own
+        # request timeout instead of holding up the pipeline.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return [
+        outcome if outcome is not None else FetchOutcome(url=urls[index], error=DEADLINE_ERROR)
+        for index, outcome in enumerate(outcomes)
+    ]
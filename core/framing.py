@@ -1,89 +1,28 @@
 from __future__ import annotations
 
-import re
 from collections import Counter
 
+from core.analysis import analyze
+
+# FRAME_TERMS, SOURCE_CONTEXT, and source_context were defined here before
+# the shared lexicon and source catalog; re-exported for existing imports.
+from core.lexicon import FRAME_TERMS
 from core.schemas import Article, PipelineTrace
+from core.source_catalog import SOURCE_CONTEXT, source_context
 
 
-SOURCE_CONTEXT: dict[str, tuple[str, str]] = {
-    # Conservative, right-leaning, or libertarian policy and media sources.
-    "manhattan institute": ("Conservative / right-leaning policy institute", "right"),
-    "city journal": ("Conservative / right-leaning policy publication", "right"),
-    "heritage foundation": ("Conservative / right-leaning policy institute", "right"),
-    "american enterprise institute": ("Conservative / right-leaning policy institute", "right"),
-    "aei": ("Conservative / right-leaning policy institute", "right"),
-    "hoover institution": ("Conservative / right-leaning policy institute", "right"),
-    "claremont institute": ("Conservative / right-leaning policy institute", "right"),
-    "cato institute": ("Libertarian / right-leaning policy institute", "right"),
-    "reason magazine": ("Libertarian / right-leaning publication", "right"),
-    "reason.com": ("Libertarian / right-leaning publication", "right"),
-    "national review": ("Conservative / right-leaning publication", "right"),
-    "the federalist": ("Conservative / right-leaning publication", "right"),
-    "daily wire": ("Conservative / right-leaning publication", "right"),
-    "washington examiner": ("Conservative / right-leaning publication", "right"),
-    "washington times": ("Conservative / right-leaning publication", "right"),
-    "new york post": ("Conservative / right-leaning tabloid", "right"),
-    "fox news": ("Right-leaning cable/news outlet", "right"),
-    "newsmax": ("Conservative / right-leaning cable/news outlet", "right"),
-    "breitbart": ("Conservative / right-leaning publication", "right"),
-    "townhall": ("Conservative / right-leaning publication", "right"),
-    "commentary magazine": ("Conservative / right-leaning publication", "right"),
-    "the dispatch": ("Center-right publication", "right"),
-    "wall street journal opinion": ("Conservative / right-leaning opinion page", "right"),
-    "wsj opinion": ("Conservative / right-leaning opinion page", "right"),
-    # Progressive, left-leaning, or labor-aligned policy and media sources.
-    "center for american progress": ("Progressive / left-leaning policy institute", "left"),
-    "cap action": ("Progressive / left-leaning policy institute", "left"),
-    "american progress": ("Progressive / left-leaning policy institute", "left"),
-    "economic policy institute": ("Labor-aligned / left-leaning policy institute", "left"),
-    "roosevelt institute": ("Progressive / left-leaning policy institute", "left"),
-    "brennan center": ("Progressive / left-leaning legal policy institute", "left"),
-    "aclu": ("Civil-liberties advocacy group often aligned with progressive policy fights", "left"),
-    "mother jones": ("Progressive / left-leaning publication", "left"),
-    "jacobin": ("Socialist / left-leaning publication", "left"),
-    "the nation": ("Progressive / left-leaning publication", "left"),
-    "democracy now": ("Progressive / left-leaning news program", "left"),
-    "vox": ("Left-leaning explanatory publication", "left"),
-    "msnbc": ("Left-leaning cable/news outlet", "left"),
-    "huffpost": ("Left-leaning publication", "left"),
-    "slate": ("Left-leaning publication", "left"),
-    "the intercept": ("Left-leaning investigative publication", "left"),
-    # Reference and general-news contexts: shown to users, never used as a left/right cue.
-    "associated press": ("Wire service / reference news source", "reference"),
-    "ap news": ("Wire service / reference news source", "reference"),
-    "reuters": ("Wire service / reference news source", "reference"),
-    "bbc": ("Public broadcaster / general news source", "reference"),
-    "pbs": ("Public broadcaster / general news source", "reference"),
-    "npr": ("Public radio / general news source", "reference"),
-    "axios": ("General news / political newsletter source", "reference"),
-    "politico": ("General politics news source", "reference"),
-}
-
-FRAME_TERMS = {
-    "Public investment": ["public investment", "workers", "union", "clean energy", "environmental justice", "equity"],
-    "Cost and taxpayer burden": ["taxpayer", "cost", "price", "burden", "affordability", "mandate"],
-    "Law and order": ["border", "law and order", "illegal immigration", "sheriff", "enforcement"],
-    "Market and business impact": ["small business", "employers", "industry", "data centers", "fossil fuels"],
-    "Institutional process": ["analysts", "committee", "agency", "court", "report", "lawmakers"],
-    "Logistics and schedule": ["schedule", "match", "ticket", "venue", "tournament", "travel"],
-}
-
-
-def source_context(article: Article) -> tuple[str, str] | None:
-    haystack = f"{article.source} {article.title} {article.url}".lower()
-    for name, context in SOURCE_CONTEXT.items():
-        if "." in name:
-            matched = name in haystack
-        else:
-            matched = re.search(rf"(?<![a-z0-9]){re.escape(name)}(?![a-z0-9])", haystack) is not None
-        if matched:
-            return context
-    return None
+# search_fetch notes that report bookkeeping rather than a text fallback.
+INFORMATIONAL_FETCH_NOTES: tuple[str, ...] = (
+    "article cache:",
+    "local index:",
+    "collapsed duplicate",
+    "gnews cache:",
+    "gnews quota:",
+)
 
 
 def source_context_summary(trace: PipelineTrace) -> dict[str, object]:
-    contexts = [source_context(article) for article in trace.articles]
+    contexts = [analyze(article).source_context for article in trace.articles]
     cataloged = [context for context in contexts if context is not None]
     posture_counts = Counter(context[1] for context in cataloged)
     if not trace.articles:
@@ -107,24 +46,19 @@ def source_context_summary(trace: PipelineTrace) -> dict[str, object]:
 
 
 def article_frames(article: Article) -> list[str]:
-    text = f"{article.title} {article.text}".lower()
-    frames = [
-        frame
-        for frame, terms in FRAME_TERMS.items()
-        if any(term in text for term in terms)
-    ]
-    return frames or ["General reporting"]
+    return list(analyze(article).frames)
 
 
 def framing_table(trace: PipelineTrace) -> list[dict[str, str]]:
     rows: list[dict[str, str]] = []
     for article in trace.articles:
+        analysis = analyze(article)
         rows.append(
             {
                 "source": article.source,
                 "article": article.title,
-                "frames": ", ".join(article_frames(article)),
-                "source_context": (source_context(article) or ("Not cataloged", ""))[0],
+                "frames": ", ".join(analysis.frames),
+                "source_context": (analysis.source_context or ("Not cataloged", ""))[0],
             }
         )
     return rows
@@ -199,6 +133,11 @@ def watch_items(trace: PipelineTrace) -> list[str]:
         )
     if trace.provider == "heuristic":
         items.append("Heuristic mode is deterministic and inspectable, but less nuanced than a model-backed run.")
-    if any(stage.notes for stage in trace.stages if stage.name == "search_fetch"):
+    if any(
+        not note.startswith(INFORMATIONAL_FETCH_NOTES)
+        for stage in trace.stages
+        if stage.name == "search_fetch"
+        for note in stage.notes
+    ):
         items.append("Some source text came from metadata fallback, so full-article reading may change the result.")
     return items
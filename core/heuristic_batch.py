@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+
+from core.analysis import ArticleAnalysis, analyze
+from core.lexicon import CHARGED_TERMS, LEFT_TERMS, NON_POLITICAL_TERMS, RIGHT_TERMS
+from core.pipeline import (
+    HEURISTIC_VERDICTS,
+    LEAN_CONFIDENCE_BASE,
+    LEAN_CONFIDENCE_CAP,
+    LEAN_SOURCE_WEIGHT,
+    LEAN_TERM_WEIGHT,
+    METADATA_ONLY_SHARE,
+    VERDICT_CENTER,
+    VERDICT_CHARGED,
+    VERDICT_LEFT,
+    VERDICT_LEFT_SOURCES,
+    VERDICT_METADATA,
+    VERDICT_MIXED,
+    VERDICT_NON_POLITICAL,
+    VERDICT_RIGHT,
+    VERDICT_RIGHT_SOURCES,
+    choose_span,
+    empty_judgment,
+)
+from core.schemas import Article, Citation, StructuredBiasJudgment
+from core.source_catalog import default_source_catalog
+
+
+# Term-matrix columns. The directional block (left, right, charged) comes
+# first, in lexicon order, so a row's nonzero columns are its proxy terms
+# in the order detect_bias lists them.
+TERM_COLUMNS: tuple[str, ...] = (*LEFT_TERMS, *RIGHT_TERMS, *CHARGED_TERMS, *NON_POLITICAL_TERMS)
+_LEFT = slice(0, len(LEFT_TERMS))
+_RIGHT = slice(_LEFT.stop, _LEFT.stop + len(RIGHT_TERMS))
+_CHARGED = slice(_RIGHT.stop, _RIGHT.stop + len(CHARGED_TERMS))
+_NON_POLITICAL = slice(_CHARGED.stop, len(TERM_COLUMNS))
+_DIRECTIONAL = slice(0, _CHARGED.stop)
+
+_COLUMNS: dict[str, list[int]] = {}
+for _column, _term in enumerate(TERM_COLUMNS):
+    _COLUMNS.setdefault(_term, []).append(_column)
+
+_POSTURE_CODES = {"left": 1, "right": 2}
+NO_ARTICLES = -1
+_CONFIDENCES = np.array([confidence for _label, confidence, _rationale in HEURISTIC_VERDICTS])
+
+
+@lru_cache(maxsize=4096)
+def _term_columns(terms: frozenset[str]) -> np.ndarray:
+    return np.array(sorted(column for term in terms for column in _COLUMNS.get(term, ())), dtype=np.int64)
+
+
+def _term_matrix(analyses: Sequence[ArticleAnalysis], owner: np.ndarray, set_count: int) -> np.ndarray:
+    columns = [_term_columns(analysis.terms) for analysis in analyses]
+    rows = np.repeat(np.arange(len(analyses)), [len(article_columns) for article_columns in columns])
+    counts = np.zeros((set_count, len(TERM_COLUMNS)), dtype=np.int32)
+    if columns:
+        np.add.at(counts, (owner[rows], np.concatenate(columns)), 1)
+    return counts
+
+
+def _layout(article_sets: Sequence[Sequence[Article]]) -> tuple[np.ndarray, np.ndarray]:
+    sizes = np.fromiter((len(articles) for articles in article_sets), dtype=np.int64, count=len(article_sets))
+    return sizes, np.repeat(np.arange(len(article_sets)), sizes)
+
+
+@dataclass(frozen=True)
+class BatchScores:
+    """Heuristic bias scores for many article sets, one array entry per set.
+
+    ``verdict`` holds the ``VERDICT_*`` code detect_bias would pick, or
+    ``NO_ARTICLES`` for an empty set; the rest are the inputs it scores
+    from.
+    """
+
+    verdict: np.ndarray
+    confidence: np.ndarray
+    term_counts: np.ndarray
+    left_sources: np.ndarray
+    right_sources: np.ndarray
+
+    @property
+    def labels(self) -> list[str]:
+        return [
+            "Undetermined" if verdict == NO_ARTICLES else HEURISTIC_VERDICTS[verdict][0]
+            for verdict in self.verdict.tolist()
+        ]
+
+
+@dataclass
+class _Batch:
+    sizes: np.ndarray
+    owner: np.ndarray
+    articles: list[Article]
+    analyses: list[ArticleAnalysis]
+    posture: np.ndarray
+
+
+def _prepare(article_sets: Sequence[Sequence[Article]]) -> _Batch:
+    catalog = default_source_catalog()
+    sizes, owner = _layout(article_sets)
+    articles = [article for members in article_sets for article in members]
+    analyses = [analyze(article, catalog) for article in articles]
+    posture = np.fromiter(
+        (_POSTURE_CODES.get(analysis.source_context[1], 0) if analysis.source_context else 0 for analysis in analyses),
+        dtype=np.int8,
+        count=len(analyses),
+    )
+    return _Batch(sizes, owner, articles, analyses, posture)
+
+
+def _score(batch: _Batch) -> BatchScores:
+    set_count = len(batch.sizes)
+    counts = _term_matrix(batch.analyses, batch.owner, set_count)
+    present = counts > 0
+    left = present[:, _LEFT].sum(axis=1)
+    right = present[:, _RIGHT].sum(axis=1)
+    charged = present[:, _CHARGED].sum(axis=1)
+    non_political = present[:, _NON_POLITICAL].any(axis=1)
+    left_sources = np.bincount(batch.owner[batch.posture == 1], minlength=set_count)
+    right_sources = np.bincount(batch.owner[batch.posture == 2], minlength=set_count)
+    thin = np.fromiter((analysis.thin for analysis in batch.analyses), dtype=bool, count=len(batch.analyses))
+    thin_share = np.bincount(batch.owner[thin], minlength=set_count) / np.maximum(batch.sizes, 1)
+
+    leans_left = (left > 0) | (left_sources > 0)
+    leans_right = (right > 0) | (right_sources > 0)
+    verdict = np.select(
+        [
+            non_political & ~leans_left & ~leans_right,
+            leans_left & leans_right,
+            leans_left & (left > 0),
+            leans_left,
+            leans_right & (right > 0),
+            leans_right,
+            charged > 0,
+            thin_share >= METADATA_ONLY_SHARE,
+        ],
+        [
+            VERDICT_NON_POLITICAL,
+            VERDICT_MIXED,
+            VERDICT_LEFT,
+            VERDICT_LEFT_SOURCES,
+            VERDICT_RIGHT,
+            VERDICT_RIGHT_SOURCES,
+            VERDICT_CHARGED,
+            VERDICT_METADATA,
+        ],
+        default=VERDICT_CENTER,
+    )
+    # Same operation order as lean_confidence, so the floats match exactly.
+    lean_left = np.minimum(
+        LEAN_CONFIDENCE_CAP, LEAN_CONFIDENCE_BASE + LEAN_TERM_WEIGHT * left + LEAN_SOURCE_WEIGHT * left_sources
+    )
+    lean_right = np.minimum(
+        LEAN_CONFIDENCE_CAP, LEAN_CONFIDENCE_BASE + LEAN_TERM_WEIGHT * right + LEAN_SOURCE_WEIGHT * right_sources
+    )
+    confidence = np.select(
+        [np.isin(verdict, (VERDICT_LEFT, VERDICT_LEFT_SOURCES)), np.isin(verdict, (VERDICT_RIGHT, VERDICT_RIGHT_SOURCES))],
+        [lean_left, lean_right],
+        default=_CONFIDENCES[verdict],
+    )
+    verdict[batch.sizes == 0] = NO_ARTICLES
+    confidence[batch.sizes == 0] = 0.0
+    return BatchScores(verdict, confidence, counts, left_sources, right_sources)
+
+
+def term_counts(article_sets: Sequence[Sequence[Article]]) -> np.ndarray:
+    """Set-by-term matrix of how many articles in each set use each term of ``TERM_COLUMNS``.
+
+    Built from one sparse (article, term) coordinate list over every
+    article, scattered into the per-set rows in a single ``np.add.at``.
+    """
+
+    batch = _prepare(article_sets)
+    return _term_matrix(batch.analyses, batch.owner, len(batch.sizes))
+
+
+def score_article_sets(article_sets: Sequence[Sequence[Article]]) -> BatchScores:
+    """Array-only heuristic scoring, for backfills that need labels and confidences but no evidence spans."""
+
+    return _score(_prepare(article_sets))
+
+
+def detect_bias_batch(article_sets: Sequence[Sequence[Article]]) -> list[StructuredBiasJudgment]:
+    """Heuristic ``detect_bias`` for many article sets at once.
+
+    Labels, confidences, and proxy terms come from array operations over
+    the term matrix and per-article source postures; only the evidence
+    citations and the result objects are built per set. Each result equals
+    ``detect_bias(summary, articles, heuristic_llm)`` for that set.
+    """
+
+    if not article_sets:
+        return []
+    batch = _prepare(article_sets)
+    scores = _score(batch)
+    set_count = len(article_sets)
+
+    # Proxy terms and source labels per set, split out of flat index arrays.
+    term_rows, term_cols = np.nonzero(scores.term_counts[:, _DIRECTIONAL])
+    term_bounds = np.searchsorted(term_rows, np.arange(set_count + 1)).tolist()
+    proxy_terms = [TERM_COLUMNS[column] for column in term_cols.tolist()]
+    directional = np.nonzero(batch.posture)[0]
+    source_bounds = np.searchsorted(batch.owner[directional], np.arange(set_count + 1)).tolist()
+    directional = directional.tolist()
+    starts = np.concatenate(([0], np.cumsum(batch.sizes))).tolist()
+    postures = batch.posture.tolist()
+    verdicts = scores.verdict.tolist()
+    confidences = scores.confidence.tolist()
+
+    # Articles recur across overlapping sets; pick each evidence span once.
+    spans: dict[tuple[int, tuple[str, ...]], str] = {}
+    judgments: list[StructuredBiasJudgment] = []
+    for index in range(set_count):
+        first, stop = starts[index], starts[index + 1]
+        if first == stop:
+            judgments.append(empty_judgment())
+            continue
+        terms = proxy_terms[term_bounds[index] : term_bounds[index + 1]]
+        sources = directional[source_bounds[index] : source_bounds[index + 1]]
+        contexts = [batch.analyses[position].source_context for position in sources]
+        left_labels = [context[0] for position, context in zip(sources, contexts) if postures[position] == 1]
+        right_labels = [context[0] for position, context in zip(sources, contexts) if postures[position] == 2]
+        evidence = []
+        for position in range(first, min(stop, first + 2)):
+            article = batch.articles[position]
+            key = (id(article), tuple(terms))
+            if key not in spans:
+                spans[key] = choose_span(article, terms or None, batch.analyses[position])
+            evidence.append(Citation(article_id=article.id, span_text=spans[key]))
+        label, _confidence, rationale = HEURISTIC_VERDICTS[verdicts[index]]
+        judgments.append(
+            StructuredBiasJudgment(
+                label=label,
+                confidence=confidences[index],
+                rationale=rationale,
+                evidence=evidence,
+                proxy_features=terms + left_labels + right_labels,
+            )
+        )
+    return judgments
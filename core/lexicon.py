@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+LEFT_TERMS = [
+    "climate",
+    "equity",
+    "workers",
+    "union",
+    "public investment",
+    "reproductive",
+    "discrimination",
+    "corporate greed",
+    "voting rights",
+    "environmental justice",
+]
+
+RIGHT_TERMS = [
+    "border",
+    "taxpayer",
+    "government overreach",
+    "freedom",
+    "law and order",
+    "parental rights",
+    "illegal immigration",
+    "religious liberty",
+    "small business",
+    "woke",
+    "school choice",
+    "free market",
+    "deregulation",
+    "progressive policies",
+]
+
+CHARGED_TERMS = [
+    "reckless",
+    "radical",
+    "slammed",
+    "disaster",
+    "betrayal",
+    "elite",
+    "crackdown",
+    "boondoggle",
+    "attack",
+    "scheme",
+]
+
+NON_POLITICAL_TERMS = ["football", "soccer", "earnings", "match", "tournament", "weather", "product launch"]
+
+FRAME_TERMS = {
+    "Public investment": ["public investment", "workers", "union", "clean energy", "environmental justice", "equity"],
+    "Cost and taxpayer burden": ["taxpayer", "cost", "price", "burden", "affordability", "mandate"],
+    "Law and order": ["border", "law and order", "illegal immigration", "sheriff", "enforcement"],
+    "Market and business impact": ["small business", "employers", "industry", "data centers", "fossil fuels"],
+    "Institutional process": ["analysts", "committee", "agency", "court", "report", "lawmakers"],
+    "Logistics and schedule": ["schedule", "match", "ticket", "venue", "tournament", "travel"],
+}
+
+
+@dataclass(frozen=True)
+class TermHit:
+    term: str
+    start: int
+    end: int
+
+
+class Lexicon:
+    """Aho-Corasick automaton over every term of several named lexicons.
+
+    ``scan`` finds all occurrences of all terms, overlapping ones included,
+    in one pass over the text, so matching cost grows with text length
+    rather than text length times lexicon size. Matching is plain
+    substring matching, exactly like ``term in text``; callers pass
+    lowered text.
+    """
+
+    def __init__(self, lexicons: Mapping[str, Sequence[str]]) -> None:
+        self.lexicons = {name: tuple(terms) for name, terms in lexicons.items()}
+        self.terms = frozenset(term for terms in self.lexicons.values() for term in terms)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[str, ...]] = [()]
+        for terms in self.lexicons.values():
+            for term in terms:
+                self._add(term)
+        self._link()
+
+    def _add(self, term: str) -> None:
+        state = 0
+        for char in term:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        if term not in self._out[state]:
+            self._out[state] = (*self._out[state], term)
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                # A state also ends every term that ends at its fail state.
+                inherited = tuple(term for term in self._out[self._fail[nxt]] if term not in self._out[nxt])
+                self._out[nxt] = self._out[nxt] + inherited
+
+    def _step(self, state: int, char: str) -> int:
+        goto, fail = self._goto, self._fail
+        while state and char not in goto[state]:
+            state = fail[state]
+        return goto[state].get(char, 0)
+
+    def scan(self, text: str) -> list[TermHit]:
+        """Every term occurrence, ordered by end offset."""
+
+        hits: list[TermHit] = []
+        state = 0
+        out = self._out
+        for index, char in enumerate(text):
+            state = self._step(state, char)
+            for term in out[state]:
+                hits.append(TermHit(term, index + 1 - len(term), index + 1))
+        return hits
+
+    def find_terms(self, text: str) -> frozenset[str]:
+        """The set of terms occurring in ``text``."""
+
+        found: set[str] = set()
+        state = 0
+        out = self._out
+        for char in text:
+            state = self._step(state, char)
+            if out[state]:
+                found.update(out[state])
+        return frozenset(found)
+
+
+LEXICON = Lexicon(
+    {
+        "left": LEFT_TERMS,
+        "right": RIGHT_TERMS,
+        "charged": CHARGED_TERMS,
+        "non_political": NON_POLITICAL_TERMS,
+        **{f"frame:{frame}": terms for frame, terms in FRAME_TERMS.items()},
+    }
+)
+
+
+@lru_cache(maxsize=64)
+def _adhoc(terms: tuple[str, ...]) -> Lexicon:
+    return Lexicon({"terms": terms})
+
+
+def matcher_for(terms: Iterable[str]) -> tuple[Lexicon, frozenset[str]]:
+    """The shared automaton when it covers ``terms``, else a cached one built for them."""
+
+    wanted = frozenset(terms)
+    if all(term in LEXICON.terms for term in wanted):
+        return LEXICON, wanted
+    return _adhoc(tuple(sorted(wanted))), wanted
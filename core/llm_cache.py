@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from core.article_cache import CACHE_DIR_ENV, CACHE_DISABLE_ENV
+
+
+LLM_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+LLM_CACHE_MAX_BYTES = 32 * 1024 * 1024
+LLM_CACHE_MEMORY_ENTRIES = 256
+LLM_CACHE_DISABLE_ENV = "NEWS_BIAS_DISABLE_LLM_CACHE"
+
+
+def llm_cache_key(provider: str, model: str, params: dict[str, Any], prompt: str) -> str:
+    """Content address for one generation: provider, model, sampling params, prompt hash."""
+
+    prompt_hash = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    material = json.dumps([provider, model, params, prompt_hash], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Two-tier cache of model responses keyed by ``llm_cache_key``.
+
+    An in-memory LRU of ``memory_entries`` responses sits in front of an
+    optional SQLite file. Entries older than ``ttl_seconds`` are treated as
+    misses, and the disk tier is kept under ``max_bytes`` by evicting the
+    least recently used responses. Pass ``path=None`` for memory only.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        *,
+        ttl_seconds: float = LLM_CACHE_TTL_SECONDS,
+        max_bytes: int = LLM_CACHE_MAX_BYTES,
+        memory_entries: int = LLM_CACHE_MEMORY_ENTRIES,
+    ) -> None:
+        self.path = Path(path) if path is not None else None
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    provider TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL,
+                    size INTEGER NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        assert self.path is not None
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _remember(self, key: str, created_at: float, response: str) -> None:
+        self._memory[key] = (created_at, response)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> str | None:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and now - entry[0] < self.ttl_seconds:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self._memory.pop(key, None)
+            if self.path is not None:
+                with self._connect() as conn:
+                    row = conn.execute("SELECT response, created_at FROM responses WHERE key = ?", (key,)).fetchone()
+                    if row is not None and now - row[1] < self.ttl_seconds:
+                        conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+                        self._remember(key, row[1], row[0])
+                        self.hits += 1
+                        return row[0]
+                    if row is not None:
+                        conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self.misses += 1
+            return None
+
+    def put(self, key: str, response: str, *, provider: str = "", model: str = "") -> None:
+        now = time.time()
+        with self._lock:
+            self._remember(key, now, response)
+            if self.path is None:
+                return
+            with self._connect() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO responses (key, provider, model, response, created_at, accessed_at, size)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    (key, provider, model, response, now, now, len(response.encode("utf-8"))),
+                )
+                self._evict(conn)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self.hits = 0
+            self.misses = 0
+            if self.path is not None:
+                with self._connect() as conn:
+                    conn.execute("DELETE FROM responses")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = int(conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0])
+        if total <= self.max_bytes:
+            return
+        victims: list[str] = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed_at ASC").fetchall():
+            if total <= self.max_bytes:
+                break
+            victims.append(key)
+            total -= size
+        conn.executemany("DELETE FROM responses WHERE key = ?", [(key,) for key in victims])
+        for key in victims:
+            self._memory.pop(key, None)
+
+
+_default_cache: LLMResponseCache | None = None
+_default_lock = threading.Lock()
+
+
+def _disabled(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in {"1", "true", "yes"}
+
+
+def default_llm_cache() -> LLMResponseCache | None:
+    """Return the process-wide LLM response cache, or None when disabled.
+
+    Responses are stored next to the article cache (``NEWS_BIAS_CACHE_DIR``).
+    ``NEWS_BIAS_DISABLE_LLM_CACHE=1`` bypasses this cache alone;
+    ``NEWS_BIAS_DISABLE_CACHE=1`` bypasses every on-disk cache.
+    """
+
+    global _default_cache
+    if _disabled(LLM_CACHE_DISABLE_ENV) or _disabled(CACHE_DISABLE_ENV):
+        return None
+    with _default_lock:
+        if _default_cache is None:
+            root = os.environ.get(CACHE_DIR_ENV) or Path.home() / ".cache" / "news-bias-pipeline"
+            try:
+                _default_cache = LLMResponseCache(Path(root) / "llm_responses.sqlite3")
+            except (OSError, sqlite3.Error):
+                _default_cache = LLMResponseCache()
+        return _default_cache
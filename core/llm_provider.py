@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import json
-from dataclasses import dataclass
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from typing import Any, Callable
 
-import requests
-
+from core.llm_cache import LLMResponseCache, default_llm_cache, llm_cache_key
+from core.resilience import ProviderResilience, provider_resilience
 from core.schemas import LLMKeys
+from core.streaming import iter_ndjson, iter_sse_json
+from core.structured_output import OutputSchema, openapi_schema, parse_model_json
+from core.transport import HttpTransport, get_transport
 
 
 DEFAULT_MODELS = {
@@ -17,12 +26,82 @@ DEFAULT_MODELS = {
     "ollama": "llama3",
 }
 
+TEMPERATURE = 0.1
+MAX_OUTPUT_TOKENS = 1200
+# Every Ollama request sends the same num_ctx: a different value makes the
+# server reload the model.
+OLLAMA_NUM_CTX = 8192
+# Keep the model resident between runs instead of Ollama's 5 minute default.
+OLLAMA_KEEP_ALIVE = "30m"
+OLLAMA_KEEP_ALIVE_ENV = "NEWS_BIAS_OLLAMA_KEEP_ALIVE"
+# The server's own setting for concurrent requests per model; read here so
+# the client never queues more requests on the server than it will run.
+OLLAMA_PARALLEL_ENV = "OLLAMA_NUM_PARALLEL"
+OLLAMA_DEFAULT_SLOTS = 4
+OLLAMA_LOAD_TIMEOUT_SECONDS = 300
+
+ANTHROPIC_API = "https://api.anthropic.com"
+OPENAI_API = "https://api.openai.com"
+
 
 @dataclass(frozen=True)
 class LLMClient:
     provider: str
     model: str
-    generate: Callable[[str], str]
+    generate: Callable[..., str]
+    # Yields text deltas as they arrive; None when the provider cannot stream.
+    stream: Callable[..., Iterator[str]] | None = None
+    # True when generate/stream take ``prefix=``, a leading part of the
+    # prompt to mark cacheable. Providers that cache prefixes implicitly
+    # (OpenAI, Gemini) only need the prompt laid out prefix-first.
+    prefix_cache: bool = False
+    # True when generate/stream take ``schema=`` (an OutputSchema) and pass
+    # it to the provider as a native structured-output constraint.
+    structured: bool = False
+    # Requests the backend runs at once (Ollama's parallel slots); None for
+    # hosted APIs.
+    max_concurrency: int | None = None
+    # Per-call metrics appended by the pipeline and drained into StageRecords.
+    calls: list[dict[str, Any]] = field(default_factory=list, compare=False, repr=False)
+
+    async def agenerate(self, prompt: str, **options: Any) -> str:
+        """Awaitable ``generate``.
+
+        Provider calls go through the shared pooled ``requests`` transport,
+        so the blocking request runs in a worker thread; many calls can be
+        awaited together on one event loop.
+        """
+
+        return await asyncio.to_thread(self.generate, prompt, **options)
+
+    def drain_calls(self) -> list[dict[str, Any]]:
+        drained = list(self.calls)
+        del self.calls[: len(drained)]
+        return drained
+
+
+_usage: ContextVar[dict[str, float] | None] = ContextVar("llm_usage", default=None)
+
+
+@contextmanager
+def collect_usage() -> Iterator[dict[str, float]]:
+    """Collect provider-reported token usage and timings for calls made in this context."""
+
+    usage: dict[str, float] = {}
+    token = _usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _usage.reset(token)
+
+
+def _record_usage(**counts: Any) -> None:
+    usage = _usage.get()
+    if usage is None:
+        return
+    for name, value in counts.items():
+        if isinstance(value, (int, float)):
+            usage[name] = usage.get(name, 0) + value
 
 
 def _missing(provider: str, key_name: str) -> ValueError:
@@ -32,19 +111,279 @@ def _missing(provider: str, key_name: str) -> ValueError:
     )
 
 
-def _post_json(url: str, headers: dict[str, str], payload: dict[str, Any], timeout: int = 90) -> dict[str, Any]:
-    response = requests.post(url, headers=headers, json=payload, timeout=timeout)
+def _post_json(
+    url: str,
+    headers: dict[str, str],
+    payload: dict[str, Any],
+    timeout: int = 90,
+    transport: HttpTransport | None = None,
+    resilience: ProviderResilience | None = None,
+) -> dict[str, Any]:
+    def send() -> Any:
+        return (transport or get_transport()).post(url, headers=headers, json=payload, timeout=timeout)
+
+    response = resilience.call(send) if resilience is not None else send()
     response.raise_for_status()
     return response.json()
 
 
-def get_llm(provider: str = "heuristic", model: str | None = None, keys: LLMKeys | None = None) -> LLMClient:
+def _post_stream(
+    url: str,
+    headers: dict[str, str],
+    payload: dict[str, Any],
+    timeout: int = 90,
+    transport: HttpTransport | None = None,
+    resilience: ProviderResilience | None = None,
+) -> Any:
+    def send() -> Any:
+        return (transport or get_transport()).post(url, headers=headers, json=payload, timeout=timeout, stream=True)
+
+    # Retries cover connecting and the status line; a stream that breaks
+    # midway is not replayed. Streams are never hedged.
+    response = resilience.call(send, hedge=False) if resilience is not None else send()
+    try:
+        response.raise_for_status()
+    except Exception:
+        response.close()
+        raise
+    return response
+
+
+def _key_params(params: dict[str, Any], kwargs: dict[str, Any]) -> dict[str, Any]:
+    schema = kwargs.get("schema")
+    return {**params, "schema": schema.name} if schema is not None else params
+
+
+def _cached_stream(
+    stream: Callable[..., Iterator[str]],
+    cache: LLMResponseCache,
+    provider: str,
+    model: str,
+    params: dict[str, Any],
+) -> Callable[..., Iterator[str]]:
+    def cached_stream(prompt: str, **kwargs: Any) -> Iterator[str]:
+        key = llm_cache_key(provider, model, _key_params(params, kwargs), prompt)
+        response = cache.get(key)
+        if response is not None:
+            yield response
+            return
+        chunks: list[str] = []
+        for chunk in stream(prompt, **kwargs):
+            chunks.append(chunk)
+            yield chunk
+        if text := "".join(chunks).strip():
+            cache.put(key, text, provider=provider, model=model)
+
+    return cached_stream
+
+
+def _cached(
+    generate: Callable[..., str],
+    cache: LLMResponseCache,
+    provider: str,
+    model: str,
+    params: dict[str, Any],
+) -> Callable[..., str]:
+    # The prefix only marks what the provider may cache; the full prompt
+    # alone determines the response, so it is not part of the key.
+    def cached_generate(prompt: str, **kwargs: Any) -> str:
+        key = llm_cache_key(provider, model, _key_params(params, kwargs), prompt)
+        response = cache.get(key)
+        if response is not None:
+            return response
+        response = generate(prompt, **kwargs)
+        # Empty output usually means a refusal or a transient upstream
+        # problem; leave it uncached so the next run tries again.
+        if response:
+            cache.put(key, response, provider=provider, model=model)
+        return response
+
+    return cached_generate
+
+
+# Request bodies and response parsing shared by direct calls and the
+# batch APIs (core.batch_api).
+
+
+def anthropic_headers(token: str | None) -> dict[str, str]:
+    return {"x-api-key": token or "", "anthropic-version": "2023-06-01", "Content-Type": "application/json"}
+
+
+def anthropic_request(model: str, prompt: str, prefix: str = "", schema: OutputSchema | None = None) -> dict[str, Any]:
+    content: str | list[dict[str, Any]] = prompt
+    if prefix and prompt.startswith(prefix) and len(prompt) > len(prefix):
+        content = [
+            {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": prompt[len(prefix) :]},
+        ]
+    request: dict[str, Any] = {
+        "model": model,
+        "max_tokens": MAX_OUTPUT_TOKENS,
+        "temperature": TEMPERATURE,
+        "messages": [{"role": "user", "content": content}],
+    }
+    if schema is not None:
+        # A forced tool call is Anthropic's schema constraint; its input is the JSON answer.
+        request["tools"] = [{"name": schema.name, "description": "Record the answer.", "input_schema": schema.schema}]
+        request["tool_choice"] = {"type": "tool", "name": schema.name}
+    return request
+
+
+def _anthropic_usage(usage: dict[str, Any]) -> None:
+    # input_tokens excludes cache reads and writes; report the whole prompt.
+    read = usage.get("cache_read_input_tokens") or 0
+    written = usage.get("cache_creation_input_tokens") or 0
+    _record_usage(
+        input_tokens=(usage.get("input_tokens") or 0) + read + written,
+        cached_tokens=read,
+        cache_write_tokens=written,
+    )
+
+
+def anthropic_text(data: dict[str, Any]) -> str:
+    for block in data.get("content", []):
+        if block.get("type") == "tool_use":
+            return json.dumps(block.get("input", {}))
+    return "\n".join(block.get("text", "") for block in data.get("content", []) if block.get("type") == "text").strip()
+
+
+def openai_headers(token: str | None) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
+
+
+def openai_request(model: str, prompt: str, schema: OutputSchema | None = None) -> dict[str, Any]:
+    request: dict[str, Any] = {
+        "model": model,
+        "input": prompt,
+        "temperature": TEMPERATURE,
+        "max_output_tokens": MAX_OUTPUT_TOKENS,
+    }
+    if schema is not None:
+        request["text"] = {
+            "format": {"type": "json_schema", "name": schema.name, "schema": schema.schema, "strict": True}
+        }
+    return request
+
+
+def _openai_usage(usage: dict[str, Any]) -> None:
+    _record_usage(
+        input_tokens=usage.get("input_tokens"),
+        cached_tokens=(usage.get("input_tokens_details") or {}).get("cached_tokens", 0),
+    )
+
+
+def openai_text(data: dict[str, Any]) -> str:
+    if data.get("output_text"):
+        return str(data["output_text"]).strip()
+    chunks: list[str] = []
+    for item in data.get("output", []):
+        for content in item.get("content", []):
+            if content.get("type") in {"output_text", "text"}:
+                chunks.append(content.get("text", ""))
+    return "\n".join(chunks).strip()
+
+
+def ollama_keep_alive() -> str:
+    return os.environ.get(OLLAMA_KEEP_ALIVE_ENV, "").strip() or OLLAMA_KEEP_ALIVE
+
+
+def ollama_slots() -> int:
+    try:
+        return max(1, int(os.environ.get(OLLAMA_PARALLEL_ENV, "")))
+    except ValueError:
+        return OLLAMA_DEFAULT_SLOTS
+
+
+class SlotGate(threading.BoundedSemaphore):
+    """Semaphore that remembers its size, so clients can report it."""
+
+    def __init__(self, slots: int) -> None:
+        super().__init__(slots)
+        self.slots = slots
+
+
+_ollama_gates: dict[str, SlotGate] = {}
+_ollama_gates_lock = threading.Lock()
+
+
+def _ollama_gate(host: str) -> SlotGate:
+    """One slot-sized gate per Ollama server, shared by every client in the process."""
+
+    with _ollama_gates_lock:
+        if host not in _ollama_gates:
+            _ollama_gates[host] = SlotGate(ollama_slots())
+        return _ollama_gates[host]
+
+
+def _ollama_timings(data: dict[str, Any]) -> dict[str, float]:
+    # Ollama reports durations in nanoseconds.
+    timings = {
+        "load_seconds": data.get("load_duration"),
+        "prompt_eval_seconds": data.get("prompt_eval_duration"),
+        "eval_seconds": data.get("eval_duration"),
+    }
+    return {name: value / 1e9 for name, value in timings.items() if isinstance(value, (int, float))}
+
+
+def _ollama_usage(data: dict[str, Any]) -> None:
+    _record_usage(
+        prompt_eval_tokens=data.get("prompt_eval_count"),
+        eval_tokens=data.get("eval_count"),
+        **_ollama_timings(data),
+    )
+
+
+def prewarm_ollama(
+    host: str,
+    model: str | None = None,
+    *,
+    transport: HttpTransport | None = None,
+) -> dict[str, float]:
+    """Load the model and keep it resident so the first stage skips the load.
+
+    A generate request without a prompt only loads the model. It uses the
+    stage calls' num_ctx, or they would reload it. Returns Ollama's load
+    timing, or {} when the server is unreachable.
+    """
+
+    request = {
+        "model": model or DEFAULT_MODELS["ollama"],
+        "keep_alive": ollama_keep_alive(),
+        "options": {"num_ctx": OLLAMA_NUM_CTX},
+    }
+    try:
+        data = _post_json(
+            f"{host.rstrip('/')}/api/generate",
+            {"Content-Type": "application/json"},
+            request,
+            timeout=OLLAMA_LOAD_TIMEOUT_SECONDS,
+            transport=transport,
+        )
+    except Exception:
+        return {}
+    return _ollama_timings(data)
+
+
+def get_llm(
+    provider: str = "heuristic",
+    model: str | None = None,
+    keys: LLMKeys | None = None,
+    *,
+    transport: HttpTransport | None = None,
+    cache: LLMResponseCache | None = None,
+    use_cache: bool = True,
+) -> LLMClient:
     """Return a provider-neutral text-generation client.
 
     The provider-specific API calls live here so agents and
     implementations never read environment variables or import vendor SDKs.
     The direct HTTP approach keeps Streamlit Cloud setup small and makes
-    BYOK explicit.
+    BYOK explicit. All providers share one pooled transport so the four
+    stage calls of a run reuse the same connection.
+
+    Responses are cached by provider, model, sampling parameters, and
+    prompt hash (``default_llm_cache`` unless ``cache`` is given). Pass
+    ``use_cache=False`` to always call the provider.
     """
 
     keys = keys or LLMKeys()
@@ -54,120 +393,170 @@ def get_llm(provider: str = "heuristic", model: str | None = None, keys: LLMKeys
     if provider == "heuristic":
         return LLMClient(provider=provider, model=model, generate=lambda prompt: "")
 
+    client = _provider_client(provider, model, keys, transport)
+    cache = cache or (default_llm_cache() if use_cache else None)
+    if cache is None or not use_cache:
+        return client
+    params: dict[str, Any] = {"temperature": TEMPERATURE, "max_output_tokens": MAX_OUTPUT_TOKENS}
+    if provider == "ollama":
+        params.update(num_ctx=OLLAMA_NUM_CTX, host=keys.ollama_host.rstrip("/"))
+    return LLMClient(
+        provider=provider,
+        model=model,
+        generate=_cached(client.generate, cache, provider, model, params),
+        stream=_cached_stream(client.stream, cache, provider, model, params) if client.stream else None,
+        prefix_cache=client.prefix_cache,
+        structured=client.structured,
+        max_concurrency=client.max_concurrency,
+    )
+
+
+def _provider_client(provider: str, model: str, keys: LLMKeys, transport: HttpTransport | None) -> LLMClient:
+    resilience = provider_resilience(provider)
     if provider == "anthropic":
         if not keys.anthropic_token:
             raise _missing("anthropic", "ANTHROPIC_API_KEY")
-
-        def generate(prompt: str) -> str:
-            data = _post_json(
-                "https://api.anthropic.com/v1/messages",
-                {
-                    "x-api-key": keys.anthropic_token or "",
-                    "anthropic-version": "2023-06-01",
-                    "Content-Type": "application/json",
-                },
-                {
-                    "model": model,
-                    "max_tokens": 1200,
-                    "temperature": 0.1,
-                    "messages": [{"role": "user", "content": prompt}],
-                },
-            )
-            return "\n".join(
-                block.get("text", "")
-                for block in data.get("content", [])
-                if block.get("type") == "text"
-            ).strip()
-
-        return LLMClient(provider=provider, model=model, generate=generate)
+        url = f"{ANTHROPIC_API}/v1/messages"
+        headers = anthropic_headers(keys.anthropic_token)
+
+        def generate(prompt: str, prefix: str = "", schema: OutputSchema | None = None) -> str:
+            request = anthropic_request(model, prompt, prefix, schema)
+            data = _post_json(url, headers, request, transport=transport, resilience=resilience)
+            _anthropic_usage(data.get("usage") or {})
+            return anthropic_text(data)
+
+        def stream(prompt: str, prefix: str = "", schema: OutputSchema | None = None) -> Iterator[str]:
+            request = {**anthropic_request(model, prompt, prefix, schema), "stream": True}
+            with _post_stream(url, headers, request, transport=transport, resilience=resilience) as response:
+                for event in iter_sse_json(response):
+                    delta = event.get("delta", {})
+                    if event.get("type") == "message_start":
+                        _anthropic_usage(event.get("message", {}).get("usage") or {})
+                    elif event.get("type") == "content_block_delta" and delta.get("text"):
+                        yield delta["text"]
+                    elif event.get("type") == "content_block_delta" and delta.get("partial_json"):
+                        yield delta["partial_json"]
+
+        return LLMClient(
+            provider=provider, model=model, generate=generate, stream=stream, prefix_cache=True, structured=True
+        )
 
     if provider == "openai":
         if not keys.openai_token:
             raise _missing("openai", "OPENAI_API_KEY")
-
-        def generate(prompt: str) -> str:
-            data = _post_json(
-                "https://api.openai.com/v1/responses",
-                {
-                    "Authorization": f"Bearer {keys.openai_token}",
-                    "Content-Type": "application/json",
-                },
-                {
-                    "model": model,
-                    "input": prompt,
-                    "temperature": 0.1,
-                    "max_output_tokens": 1200,
-                },
-            )
-            if data.get("output_text"):
-                return str(data["output_text"]).strip()
-            chunks: list[str] = []
-            for item in data.get("output", []):
-                for content in item.get("content", []):
-                    if content.get("type") in {"output_text", "text"}:
-                        chunks.append(content.get("text", ""))
-            return "\n".join(chunks).strip()
-
-        return LLMClient(provider=provider, model=model, generate=generate)
+        url = f"{OPENAI_API}/v1/responses"
+        headers = openai_headers(keys.openai_token)
+
+        def generate(prompt: str, schema: OutputSchema | None = None) -> str:
+            request = openai_request(model, prompt, schema)
+            data = _post_json(url, headers, request, transport=transport, resilience=resilience)
+            _openai_usage(data.get("usage") or {})
+            return openai_text(data)
+
+        def stream(prompt: str, schema: OutputSchema | None = None) -> Iterator[str]:
+            request = {**openai_request(model, prompt, schema), "stream": True}
+            with _post_stream(url, headers, request, transport=transport, resilience=resilience) as response:
+                for event in iter_sse_json(response):
+                    if event.get("type") == "response.output_text.delta" and event.get("delta"):
+                        yield str(event["delta"])
+                    elif event.get("type") == "response.completed":
+                        _openai_usage(event.get("response", {}).get("usage") or {})
+
+        return LLMClient(provider=provider, model=model, generate=generate, stream=stream, structured=True)
 
     if provider == "google":
         if not keys.google_token:
             raise _missing("google", "GOOGLE_API_KEY")
-
-        def generate(prompt: str) -> str:
-            url = (
-                "https://generativelanguage.googleapis.com/v1beta/models/"
-                f"{model}:generateContent?key={keys.google_token}"
+        base = f"https://generativelanguage.googleapis.com/v1beta/models/{model}"
+        headers = {"Content-Type": "application/json"}
+
+        def payload(prompt: str, schema: OutputSchema | None = None) -> dict[str, Any]:
+            config: dict[str, Any] = {"temperature": TEMPERATURE, "maxOutputTokens": MAX_OUTPUT_TOKENS}
+            if schema is not None:
+                config.update(responseMimeType="application/json", responseSchema=openapi_schema(schema.schema))
+            return {"contents": [{"parts": [{"text": prompt}]}], "generationConfig": config}
+
+        def _parts(data: dict[str, Any]) -> list[str]:
+            return [
+                part["text"]
+                for candidate in data.get("candidates", [])
+                for part in candidate.get("content", {}).get("parts", [])
+                if "text" in part
+            ]
+
+        def _usage_metadata(data: dict[str, Any]) -> None:
+            usage = data.get("usageMetadata") or {}
+            _record_usage(
+                input_tokens=usage.get("promptTokenCount"),
+                cached_tokens=usage.get("cachedContentTokenCount", 0),
             )
-            data = _post_json(
-                url,
-                {"Content-Type": "application/json"},
-                {
-                    "contents": [{"parts": [{"text": prompt}]}],
-                    "generationConfig": {"temperature": 0.1, "maxOutputTokens": 1200},
-                },
-            )
-            parts: list[str] = []
-            for candidate in data.get("candidates", []):
-                for part in candidate.get("content", {}).get("parts", []):
-                    if "text" in part:
-                        parts.append(part["text"])
-            return "\n".join(parts).strip()
 
-        return LLMClient(provider=provider, model=model, generate=generate)
+        def generate(prompt: str, schema: OutputSchema | None = None) -> str:
+            url = f"{base}:generateContent?key={keys.google_token}"
+            data = _post_json(url, headers, payload(prompt, schema), transport=transport, resilience=resilience)
+            _usage_metadata(data)
+            return "\n".join(_parts(data)).strip()
+
+        def stream(prompt: str, schema: OutputSchema | None = None) -> Iterator[str]:
+            url = f"{base}:streamGenerateContent?alt=sse&key={keys.google_token}"
+            request = payload(prompt, schema)
+            last: dict[str, Any] = {}
+            with _post_stream(url, headers, request, transport=transport, resilience=resilience) as response:
+                for event in iter_sse_json(response):
+                    # Every chunk repeats the running usage; keep the last.
+                    last = event if "usageMetadata" in event else last
+                    yield from _parts(event)
+            _usage_metadata(last)
+
+        return LLMClient(provider=provider, model=model, generate=generate, stream=stream, structured=True)
 
     if provider == "ollama":
         host = keys.ollama_host.rstrip("/")
-
-        def generate(prompt: str) -> str:
-            data = _post_json(
-                f"{host}/api/generate",
-                {"Content-Type": "application/json"},
-                {
-                    "model": model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {"temperature": 0.1, "num_ctx": 8192},
-                },
-            )
+        url = f"{host}/api/generate"
+        headers = {"Content-Type": "application/json"}
+        gate = _ollama_gate(host)
+
+        def payload(prompt: str, schema: OutputSchema | None = None, streaming: bool = False) -> dict[str, Any]:
+            request: dict[str, Any] = {
+                "model": model,
+                "prompt": prompt,
+                "stream": streaming,
+                "keep_alive": ollama_keep_alive(),
+                "options": {"temperature": TEMPERATURE, "num_ctx": OLLAMA_NUM_CTX},
+            }
+            if schema is not None:
+                request["format"] = schema.schema
+            return request
+
+        def generate(prompt: str, schema: OutputSchema | None = None) -> str:
+            with gate:
+                data = _post_json(url, headers, payload(prompt, schema), transport=transport, resilience=resilience)
+            _ollama_usage(data)
             return str(data.get("response", "")).strip()
 
-        return LLMClient(provider=provider, model=model, generate=generate)
+        def stream(prompt: str, schema: OutputSchema | None = None) -> Iterator[str]:
+            request = payload(prompt, schema, streaming=True)
+            with gate, _post_stream(url, headers, request, transport=transport, resilience=resilience) as response:
+                for event in iter_ndjson(response):
+                    if event.get("response"):
+                        yield str(event["response"])
+                    if event.get("done"):
+                        _ollama_usage(event)
+                        break
+
+        return LLMClient(
+            provider=provider,
+            model=model,
+            generate=generate,
+            stream=stream,
+            structured=True,
+            max_concurrency=gate.slots,
+        )
 
     raise ValueError(f"Unknown LLM provider {provider!r}. Choose heuristic, anthropic, openai, google, or ollama.")
 
 
 def extract_json_object(text: str) -> dict[str, Any] | None:
-    """Parse the first JSON object in a model response."""
-
-    if not text.strip():
-        return None
-    start = text.find("{")
-    end = text.rfind("}")
-    if start == -1 or end == -1 or end <= start:
-        return None
-    try:
-        parsed = json.loads(text[start : end + 1])
-    except json.JSONDecodeError:
-        return None
-    return parsed if isinstance(parsed, dict) else None
+    """Parse the first JSON object in a model response, repairing sloppy or truncated output."""
+
+    return parse_model_json(text)[0]
@@ -0,0 +1,243 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from core.news_search import (
+    FALLBACK_FEEDS,
+    FEED_CACHE,
+    FEED_WORKERS,
+    FeedCache,
+    canonical_url,
+    clean_feed_text,
+    hit_from_entry,
+    query_terms,
+)
+from core.schemas import StructuredQuery
+
+
+INDEX_PATH_ENV = "NEWS_BIAS_INDEX_PATH"
+INGEST_INTERVAL_SECONDS = 300
+RETENTION_DAYS = 30
+
+
+def _published_date(entry: Any) -> str | None:
+    parsed = getattr(entry, "published_parsed", None) or getattr(entry, "updated_parsed", None)
+    if not parsed:
+        return None
+    try:
+        return date(parsed[0], parsed[1], parsed[2]).isoformat()
+    except (TypeError, ValueError):
+        return None
+
+
+def _entry_text(entry: Any) -> str:
+    content = getattr(entry, "content", None) or []
+    if content:
+        first = content[0]
+        value = first.get("value", "") if isinstance(first, dict) else getattr(first, "value", "")
+        return clean_feed_text(value)
+    return ""
+
+
+class NewsIndex:
+    """Local article store with an inverted index over title, description, and text.
+
+    Documents are keyed by canonical URL. ``postings`` maps each indexed
+    term to the documents containing it, so a query touches only the
+    posting lists for its own terms instead of scanning every stored hit.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS documents (
+                    doc_id INTEGER PRIMARY KEY,
+                    url TEXT NOT NULL UNIQUE,
+                    link TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    description TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    published TEXT,
+                    ingested_at REAL NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS documents_published ON documents (published);
+                CREATE TABLE IF NOT EXISTS postings (
+                    term TEXT NOT NULL,
+                    doc_id INTEGER NOT NULL,
+                    PRIMARY KEY (term, doc_id)
+                ) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS postings_doc ON postings (doc_id);
+                """
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def add(self, hit: dict[str, str], *, published: str | None = None, text: str = "") -> bool:
+        """Store one hit. Returns False when the canonical URL is already indexed."""
+
+        key = canonical_url(hit["url"])
+        terms = set(query_terms(f"{hit.get('title', '')} {hit.get('description', '')} {text}"))
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(
+                """
+                INSERT OR IGNORE INTO documents (url, link, title, source, description, text, published, ingested_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    key,
+                    hit["url"],
+                    hit.get("title") or "Untitled",
+                    hit.get("source") or "unknown",
+                    hit.get("description") or "",
+                    text,
+                    published,
+                    time.time(),
+                ),
+            )
+            if cursor.rowcount == 0:
+                return False
+            doc_id = cursor.lastrowid
+            conn.executemany("INSERT OR IGNORE INTO postings (term, doc_id) VALUES (?, ?)", [(term, doc_id) for term in terms])
+        return True
+
+    def search(self, structured_query: StructuredQuery, *, max_articles: int = 5) -> list[dict[str, str]]:
+        """Rank stored documents by matched query terms inside the date window."""
+
+        terms = sorted(set(query_terms(structured_query.query)))
+        if not terms:
+            return []
+        where = ["p.term IN (%s)" % ",".join("?" * len(terms))]
+        params: list[Any] = list(terms)
+        if structured_query.date_from:
+            where.append("d.published >= ?")
+            params.append(structured_query.date_from)
+        if structured_query.date_to:
+            where.append("d.published <= ?")
+            params.append(structured_query.date_to)
+        params.append(max_articles)
+        with self._lock, self._connect() as conn:
+            rows = conn.execute(
+                f"""
+                SELECT d.link, d.title, d.source, d.description, COUNT(*) AS score
+                FROM postings AS p JOIN documents AS d ON d.doc_id = p.doc_id
+                WHERE {" AND ".join(where)}
+                GROUP BY d.doc_id
+                ORDER BY score DESC, d.published DESC, d.doc_id ASC
+                LIMIT ?
+                """,
+                params,
+            ).fetchall()
+        return [
+            {"title": title, "url": link, "source": source, "description": description}
+            for link, title, source, description, _score in rows
+        ]
+
+    def prune(self, *, older_than_days: int = RETENTION_DAYS) -> int:
+        cutoff = (datetime.now(timezone.utc).date() - timedelta(days=older_than_days)).isoformat()
+        with self._lock, self._connect() as conn:
+            doc_ids = [row[0] for row in conn.execute("SELECT doc_id FROM documents WHERE published < ?", (cutoff,))]
+            conn.executemany("DELETE FROM postings WHERE doc_id = ?", [(doc_id,) for doc_id in doc_ids])
+            conn.executemany("DELETE FROM documents WHERE doc_id = ?", [(doc_id,) for doc_id in doc_ids])
+        return len(doc_ids)
+
+    def count(self) -> int:
+        with self._lock, self._connect() as conn:
+            return int(conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0])
+
+
+class NewsIngester:
+    """Pull configured feeds into a NewsIndex on a background thread."""
+
+    def __init__(
+        self,
+        index: NewsIndex,
+        *,
+        feeds: list[str] | None = None,
+        interval_seconds: float = INGEST_INTERVAL_SECONDS,
+        feed_cache: FeedCache | None = None,
+    ) -> None:
+        self.index = index
+        self.feeds = list(feeds or FALLBACK_FEEDS)
+        self.interval_seconds = interval_seconds
+        self.feed_cache = feed_cache or FEED_CACHE
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def ingest_once(self) -> int:
+        """Fetch every feed once and return the number of new documents."""
+
+        with ThreadPoolExecutor(max_workers=min(FEED_WORKERS, max(1, len(self.feeds))), thread_name_prefix="ingest") as executor:
+            parsed_feeds = list(executor.map(self.feed_cache.parse, self.feeds))
+        added = 0
+        for parsed in parsed_feeds:
+            if parsed is None:
+                continue
+            source = getattr(parsed.feed, "title", "RSS")
+            for entry in parsed.entries:
+                hit = hit_from_entry(entry, source)
+                if hit is not None and self.index.add(hit, published=_published_date(entry), text=_entry_text(entry)):
+                    added += 1
+        return added
+
+    def run_forever(self) -> None:
+        """Ingest on the calling thread until ``stop`` is called."""
+
+        while not self._stop.is_set():
+            try:
+                self.ingest_once()
+                self.index.prune()
+            except Exception:
+                # A bad feed cycle should not kill the daemon; the next
+                # interval retries every feed.
+                pass
+            self._stop.wait(self.interval_seconds)
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, name="news-ingester", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+_default_index: NewsIndex | None = None
+_default_lock = threading.Lock()
+
+
+def default_news_index() -> NewsIndex | None:
+    """Return the index at ``NEWS_BIAS_INDEX_PATH`` when one has been built."""
+
+    global _default_index
+    path = os.environ.get(INDEX_PATH_ENV)
+    if not path or not Path(path).is_file():
+        return None
+    with _default_lock:
+        if _default_index is None or _default_index.path != Path(path):
+            _default_index = NewsIndex(path)
+        return _default_index
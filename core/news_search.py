@@ -2,15 +2,35 @@ from __future__ import annotations
 
 import hashlib
 import html
+import os
 import re
-from typing import Any
-from urllib.parse import quote_plus
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qsl, quote_plus, urlencode, urlsplit, urlunsplit
 
 import feedparser
-import requests
 
+from core.rate_limit import TokenBucket
 from core.schemas import Article, StructuredQuery
+from core.transport import HttpTransport, get_transport
 
+if TYPE_CHECKING:
+    from core.news_index import NewsIndex
+
+
+GNEWS_SEARCH_URL = "https://gnews.io/api/v4/search"
+FEED_WORKERS = 4
+FEED_TTL_SECONDS = 300
+FEED_CACHE_SIZE = 256
+GNEWS_TTL_SECONDS = 900
+GNEWS_CACHE_SIZE = 256
+GNEWS_DAILY_QUOTA = 100
+GNEWS_QUOTA_RESERVE = 5
+GNEWS_MAX_WAIT_SECONDS = 2.0
 
 FALLBACK_FEEDS = [
     "https://feeds.bbci.co.uk/news/world/rss.xml",
@@ -18,6 +38,8 @@ FALLBACK_FEEDS = [
     "https://rss.cnn.com/rss/edition_world.rss",
 ]
 
+TRACKING_PARAMS = {"fbclid", "gclid", "ocid", "cmpid", "mc_cid", "mc_eid", "smid", "taid", "ref", "ref_src"}
+
 STOPWORDS = {
     "about",
     "after",
@@ -37,9 +59,34 @@ def article_id_for(value: str) -> str:
     return "a-" + hashlib.sha1(value.encode("utf-8")).hexdigest()[:10]
 
 
+def canonical_url(url: str) -> str:
+    """Normalize a URL so trivially different links share one identity.
+
+    Lowercases the scheme and host, drops default ports, fragments, and
+    tracking parameters, sorts the remaining query, and trims a trailing
+    slash from non-root paths.
+    """
+
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and (scheme, parts.port) not in {("http", 80), ("https", 443)}:
+        host = f"{host}:{parts.port}"
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
 def clean_feed_text(value: str) -> str:
-    text = html.unescape(value or "")
-    text = re.sub(r"<[^>]+>", " ", text)
+    text = html.unescape(value) if value and "&" in value else value or ""
+    if "<" in text:
+        text = re.sub(r"<[^>]+>", " ", text)
     text = text.replace("\xa0", " ")
     return " ".join(text.split())
 
@@ -50,14 +97,81 @@ def search_articles(
     max_articles: int = 5,
     gnews_token: str | None = None,
     timeout: int = 20,
+    transport: HttpTransport | None = None,
+    index: NewsIndex | None = None,
+    notes: list[str] | None = None,
 ) -> list[dict[str, str]]:
-    """Return lightweight article hits from GNews or RSS fallback.
+    """Return lightweight article hits from the local index, GNews, or RSS.
 
-    GNews is primary when a key is supplied. If no key is supplied, or if
-    the request fails, RSS fallback keeps the demo usable without secrets.
+    A locally ingested news index answers first when one is configured.
+    Live search runs only when the index has fewer than ``max_articles``
+    matches. GNews is primary when a key is supplied. If no key is
+    supplied, or if the request fails, RSS fallback keeps the demo usable
+    without secrets. GNews results are cached and rate limited per key; a
+    key near its quota degrades to RSS. Bookkeeping lines are appended to
+    ``notes``.
     """
 
+    if index is None:
+        from core.news_index import default_news_index
+
+        index = default_news_index()
+    local_hits: list[dict[str, str]] = []
+    if index is not None:
+        local_hits = index.search(structured_query, max_articles=max_articles)
+        if len(local_hits) >= max_articles:
+            _note(notes, f"local index: {len(local_hits)} hit(s)")
+            return local_hits
+        _note(notes, f"local index: {len(local_hits)} hit(s); coverage thin, used live search")
+
+    live_hits = _live_search(
+        structured_query,
+        max_articles=max_articles,
+        gnews_token=gnews_token,
+        timeout=timeout,
+        transport=transport,
+        notes=notes,
+    )
+    return _merge_hits(local_hits, live_hits, max_articles)
+
+
+def _note(notes: list[str] | None, message: str) -> None:
+    if notes is not None:
+        notes.append(message)
+
+
+def _merge_hits(first: list[dict[str, str]], second: list[dict[str, str]], max_articles: int) -> list[dict[str, str]]:
+    merged: list[dict[str, str]] = []
+    seen: set[str] = set()
+    for hit in [*first, *second]:
+        key = canonical_url(hit["url"])
+        if key not in seen:
+            seen.add(key)
+            merged.append(hit)
+    return merged[:max_articles]
+
+
+def _live_search(
+    structured_query: StructuredQuery,
+    *,
+    max_articles: int,
+    gnews_token: str | None,
+    timeout: int,
+    transport: HttpTransport | None,
+    notes: list[str] | None = None,
+) -> list[dict[str, str]]:
     if gnews_token:
+        key = (structured_query.query, structured_query.date_from, structured_query.date_to, max_articles)
+        cached = GNEWS_CACHE.get(key)
+        if cached is not None:
+            _note(notes, f"gnews cache: hit ({GNEWS_CACHE.summary()})")
+            return cached
+        limiter = gnews_limiter(gnews_token)
+        if not limiter.acquire(max_wait=GNEWS_MAX_WAIT_SECONDS):
+            _note(notes, f"gnews quota: near limit ({limiter.available():.0f} left), used RSS fallback")
+            return fallback_rss(structured_query, max_articles=max_articles)
+        _note(notes, f"gnews cache: miss ({GNEWS_CACHE.summary()})")
+        _note(notes, f"gnews quota: {limiter.consumed} request(s) used, {limiter.available():.0f} left")
         params: dict[str, Any] = {
             "q": structured_query.query,
             "lang": "en",
@@ -69,7 +183,11 @@ def search_articles(
         if structured_query.date_to:
             params["to"] = structured_query.date_to
         try:
-            response = requests.get("https://gnews.io/api/v4/search", params=params, timeout=timeout)
+            response = (transport or get_transport()).get(GNEWS_SEARCH_URL, params=params, timeout=timeout)
+            if response.status_code in {403, 429}:
+                # GNews answers quota exhaustion with 403/429; stop spending
+                # requests until the bucket refills.
+                limiter.drain()
             response.raise_for_status()
             data = response.json()
             hits = []
@@ -86,6 +204,7 @@ def search_articles(
                     }
                 )
             if hits:
+                GNEWS_CACHE.put(key, hits[:max_articles])
                 return hits[:max_articles]
         except Exception:
             pass
@@ -93,7 +212,89 @@ def search_articles(
     return fallback_rss(structured_query, max_articles=max_articles)
 
 
-def _query_terms(query: str) -> list[str]:
+class GNewsCache:
+    """TTL + LRU cache of GNews hits keyed by (query, date_from, date_to, max).
+
+    Repeated searches inside ``ttl_seconds`` are answered from memory and
+    do not spend quota. Hit and miss counts are kept for stage notes.
+    """
+
+    def __init__(self, *, ttl_seconds: float = GNEWS_TTL_SECONDS, max_entries: int = GNEWS_CACHE_SIZE) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[Any, ...], tuple[float, list[dict[str, str]]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[Any, ...]) -> list[dict[str, str]] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return [dict(hit) for hit in entry[1]]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: tuple[Any, ...], hits: list[dict[str, str]]) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), [dict(hit) for hit in hits])
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def summary(self) -> str:
+        with self._lock:
+            lookups = self.hits + self.misses
+            rate = self.hits / lookups if lookups else 0.0
+            return f"{self.hits} of {lookups} lookup(s), {rate:.0%} hit rate"
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+GNEWS_CACHE = GNewsCache()
+_GNEWS_LIMITERS: dict[str, TokenBucket] = {}
+_GNEWS_LIMITERS_LOCK = threading.Lock()
+
+
+def gnews_limiter(token: str) -> TokenBucket:
+    """Return the process-wide quota bucket for one GNews API key.
+
+    The bucket holds a day's quota (``GNEWS_DAILY_QUOTA``, overridable for
+    paid plans) and refills evenly over 24 hours. ``GNEWS_QUOTA_RESERVE``
+    requests are held back so searches degrade to RSS before the key is
+    fully exhausted.
+    """
+
+    name = hashlib.sha1(token.encode("utf-8")).hexdigest()
+    with _GNEWS_LIMITERS_LOCK:
+        limiter = _GNEWS_LIMITERS.get(name)
+        if limiter is None:
+            quota = float(os.getenv("GNEWS_DAILY_QUOTA") or GNEWS_DAILY_QUOTA)
+            limiter = TokenBucket(
+                capacity=quota,
+                refill_per_second=quota / 86_400,
+                reserve=min(GNEWS_QUOTA_RESERVE, quota - 1),
+            )
+            _GNEWS_LIMITERS[name] = limiter
+        return limiter
+
+
+def reset_gnews_limiters() -> None:
+    with _GNEWS_LIMITERS_LOCK:
+        _GNEWS_LIMITERS.clear()
+
+
+def query_terms(query: str) -> list[str]:
+    """Lowercased content words of ``query`` (three or more characters, no stopwords)."""
+
     return [
         token
         for token in re.findall(r"[a-z0-9]+", query.lower())
@@ -101,7 +302,9 @@ def _query_terms(query: str) -> list[str]:
     ]
 
 
-def _hit_from_entry(entry: Any, default_source: str) -> dict[str, str] | None:
+def hit_from_entry(entry: Any, default_source: str) -> dict[str, str] | None:
+    """A search hit from one feed entry, or None when the entry has no link."""
+
     link = getattr(entry, "link", "")
     if not link:
         return None
@@ -134,44 +337,166 @@ def _google_news_query(structured_query: StructuredQuery) -> str:
     return " ".join(pieces)
 
 
-def fallback_rss(structured_query: StructuredQuery | None = None, max_articles: int = 5) -> list[dict[str, str]]:
-    terms = _query_terms(structured_query.query if structured_query else "")
-    hits: list[dict[str, str]] = []
+@dataclass
+class _CachedFeed:
+    parsed: Any
+    etag: str | None
+    modified: str | None
+    fetched_at: float
+
+
+class FeedCache:
+    """In-memory cache of parsed feeds with conditional-GET revalidation.
+
+    Inside ``ttl_seconds`` a feed is served from memory. After that it is
+    re-requested with the stored ETag / Last-Modified, and a 304 keeps the
+    cached entries, as does a failed request (a bozo result with no HTTP
+    status, or an error status, and no entries). A per-feed lock means
+    concurrent callers asking for the same stale feed trigger one upstream
+    request, not one each.
+    """
+
+    def __init__(self, *, ttl_seconds: float = FEED_TTL_SECONDS, max_feeds: int = FEED_CACHE_SIZE) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_feeds = max_feeds
+        self._feeds: OrderedDict[str, _CachedFeed] = OrderedDict()
+        self._locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _feed_lock(self, url: str) -> threading.Lock:
+        with self._lock:
+            return self._locks.setdefault(url, threading.Lock())
+
+    def _cached(self, url: str) -> _CachedFeed | None:
+        with self._lock:
+            cached = self._feeds.get(url)
+            if cached is not None:
+                self._feeds.move_to_end(url)
+            return cached
+
+    def _store(self, url: str, cached: _CachedFeed) -> None:
+        with self._lock:
+            self._feeds[url] = cached
+            self._feeds.move_to_end(url)
+            while len(self._feeds) > self.max_feeds:
+                evicted, _feed = self._feeds.popitem(last=False)
+                self._locks.pop(evicted, None)
 
+    def parse(self, url: str) -> Any:
+        with self._feed_lock(url):
+            now = time.monotonic()
+            cached = self._cached(url)
+            if cached is not None and now - cached.fetched_at < self.ttl_seconds:
+                return cached.parsed
+            kwargs: dict[str, str] = {}
+            if cached is not None and cached.etag:
+                kwargs["etag"] = cached.etag
+            if cached is not None and cached.modified:
+                kwargs["modified"] = cached.modified
+            try:
+                parsed = feedparser.parse(url, **kwargs)
+            except Exception:
+                if cached is None:
+                    return None
+                parsed = None
+            status = getattr(parsed, "status", None)
+            # feedparser reports network errors and error pages as a bozo
+            # result with no entries; that must not replace a good copy.
+            failed = parsed is None or (
+                getattr(parsed, "bozo", False)
+                and not getattr(parsed, "entries", None)
+                and (status is None or status >= 400)
+            )
+            if cached is not None and (failed or status == 304):
+                cached.fetched_at = now
+                return cached.parsed
+            if failed:
+                return parsed
+            self._store(
+                url,
+                _CachedFeed(
+                    parsed=parsed,
+                    etag=getattr(parsed, "etag", None),
+                    modified=getattr(parsed, "modified", None),
+                    fetched_at=now,
+                ),
+            )
+            return parsed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._feeds.clear()
+            self._locks.clear()
+
+
+FEED_CACHE = FeedCache()
+
+
+def fallback_rss(
+    structured_query: StructuredQuery | None = None,
+    max_articles: int = 5,
+    *,
+    feed_cache: FeedCache | None = None,
+) -> list[dict[str, str]]:
+    """Fan out to the search feed and every fallback feed at once.
+
+    All feeds are fetched concurrently through the feed cache, then every
+    relevant entry is ranked together by ``_score_hit``. Ties keep feed
+    order (search feed first) and entry order, so identical feed payloads
+    always give identical hits.
+    """
+
+    feed_cache = feed_cache or FEED_CACHE
+    terms = query_terms(structured_query.query if structured_query else "")
+    # (feed url, source label override, entry limit)
+    sources: list[tuple[str, str | None, int | None]] = []
     if structured_query is not None:
         search_url = (
             "https://news.google.com/rss/search?q="
             + quote_plus(_google_news_query(structured_query))
             + "&hl=en-US&gl=US&ceid=US:en"
         )
-        parsed = feedparser.parse(search_url)
-        for entry in parsed.entries:
-            hit = _hit_from_entry(entry, "Google News search")
-            if hit and _score_hit(hit, terms) > 0:
-                hits.append(hit)
-            if len(hits) >= max_articles:
-                return hits
-
-    for feed_url in FALLBACK_FEEDS:
-        parsed = feedparser.parse(feed_url)
-        for entry in parsed.entries[: max(1, max_articles * 2)]:
-            hit = _hit_from_entry(entry, getattr(parsed.feed, "title", "RSS"))
-            if hit and _score_hit(hit, terms) > 0:
-                hits.append(hit)
-            if len(hits) >= max_articles:
-                return hits
-    return hits[:max_articles]
+        sources.append((search_url, "Google News search", None))
+    sources.extend((feed_url, None, max(1, max_articles * 2)) for feed_url in FALLBACK_FEEDS)
+
+    with ThreadPoolExecutor(max_workers=min(FEED_WORKERS, len(sources)), thread_name_prefix="feed") as executor:
+        parsed_feeds = list(executor.map(feed_cache.parse, [url for url, _label, _limit in sources]))
+
+    ranked: list[tuple[int, int, int, dict[str, str]]] = []
+    seen: set[str] = set()
+    for feed_index, ((_url, label, limit), parsed) in enumerate(zip(sources, parsed_feeds, strict=True)):
+        if parsed is None:
+            continue
+        source = label or getattr(parsed.feed, "title", "RSS")
+        entries = parsed.entries if limit is None else parsed.entries[:limit]
+        for entry_index, entry in enumerate(entries):
+            hit = hit_from_entry(entry, source)
+            if hit is None:
+                continue
+            score = _score_hit(hit, terms)
+            key = canonical_url(hit["url"])
+            if score <= 0 or key in seen:
+                continue
+            seen.add(key)
+            ranked.append((-score, feed_index, entry_index, hit))
+    ranked.sort(key=lambda item: item[:3])
+    return [hit for *_order, hit in ranked[:max_articles]]
 
 
 def hits_to_articles(hits: list[dict[str, str]], texts: list[str]) -> list[Article]:
     articles: list[Article] = []
+    seen_ids: set[str] = set()
     for index, hit in enumerate(hits):
         title = hit.get("title") or f"Article {index + 1}"
         url = hit.get("url") or f"fixture://article-{index + 1}"
         text = texts[index] if index < len(texts) and texts[index].strip() else hit.get("description") or title
+        article_id = article_id_for(canonical_url(url) if hit.get("url") else title)
+        if article_id in seen_ids:
+            continue
+        seen_ids.add(article_id)
         articles.append(
             Article(
-                id=article_id_for(url or title),
+                id=article_id,
                 title=clean_feed_text(title),
                 url=url,
                 source=hit.get("source") or "unknown",
@@ -2,16 +2,25 @@ from __future__ import annotations
 
 import json
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
-from typing import Any
-
-from core.citation import verify_citations
-from core.framing import source_context
-from core.llm_provider import LLMClient, extract_json_object, get_llm
-from core.news_search import hits_to_articles, search_articles
+from typing import Any, Callable
+
+from core.analysis import ArticleAnalysis, analyze, lead_sentence
+from core.citation import CitationIndex, verify_citations
+from core.dedup import TextDeduplicator, collapse_duplicate_hits
+from core.fetching import DEADLINE_ERROR, FETCH_DEADLINE_SECONDS, FetchOutcome, cache_summary, fetch_texts
+from core.lexicon import CHARGED_TERMS, LEFT_TERMS, LEXICON, NON_POLITICAL_TERMS, RIGHT_TERMS, matcher_for
+from core.llm_provider import LLMClient, collect_usage, extract_json_object, get_llm
+from core.news_search import hits_to_articles, query_terms, search_articles
+from core.prompt_budget import article_prefix, assemble_prompt, estimate_tokens
+from core.resilience import ProviderUnavailable
+from core.structured_output import PARSE_STATS, STAGE_SCHEMAS, OutputSchema, parse_model_json
 from core.prompts import load_prompt
 from core.schemas import (
     Article,
+    ArticleDigest,
     Citation,
     LLMKeys,
     PipelineTrace,
@@ -22,60 +31,65 @@ from core.schemas import (
     StructuredQuery,
     StructuredSummary,
 )
-from core.text_extraction import extract_article_text
-
-
-LEFT_TERMS = [
-    "climate",
-    "equity",
-    "workers",
-    "union",
-    "public investment",
-    "reproductive",
-    "discrimination",
-    "corporate greed",
-    "voting rights",
-    "environmental justice",
-]
-
-RIGHT_TERMS = [
-    "border",
-    "taxpayer",
-    "government overreach",
-    "freedom",
-    "law and order",
-    "parental rights",
-    "illegal immigration",
-    "religious liberty",
-    "small business",
-    "woke",
-    "school choice",
-    "free market",
-    "deregulation",
-    "progressive policies",
-]
-
-CHARGED_TERMS = [
-    "reckless",
-    "radical",
-    "slammed",
-    "disaster",
-    "betrayal",
-    "elite",
-    "crackdown",
-    "boondoggle",
-    "attack",
-    "scheme",
-]
-
-NON_POLITICAL_TERMS = ["football", "soccer", "earnings", "match", "tournament", "weather", "product launch"]
+from core.streaming import IncrementalJSONParser
+
+
+# Search over-fetches so collapsed duplicates can be backfilled.
+SEARCH_HEADROOM = 2
+
+# Receives top-level JSON fields of a stage's response as they stream in.
+PartialCallback = Callable[[dict[str, Any]], None]
+
+# Above this many articles, model-backed runs digest each article in its
+# own prompt and the stage prompts see the digests instead of raw text.
+MAP_REDUCE_MIN_ARTICLES = 8
+MAP_WORKERS = 6
+# Per-call server timings and token counts Ollama reports; summed per stage.
+OLLAMA_TIMING_KEYS = ("load_seconds", "prompt_eval_seconds", "eval_seconds", "prompt_eval_tokens", "eval_tokens")
+
+
+# Heuristic detect_bias verdicts as (label, confidence, rationale), indexed
+# by the VERDICT_* codes in the order detect_bias tests them. Lean verdicts
+# replace the confidence with lean_confidence().
+_SOURCE_ONLY = "The directional signal comes from cataloged source context, not article-language evidence alone."
+HEURISTIC_VERDICTS: tuple[tuple[str, float, str], ...] = (
+    ("Center", 0.72, "The article set appears non-political or lacks ideological policy framing."),
+    ("Mixed", 0.64, "The article set contains cues associated with both left-leaning and right-leaning frames."),
+    ("Lean Left", 0.55, "The article set includes policy language often associated with left-leaning framing."),
+    ("Lean Left", 0.55, _SOURCE_ONLY),
+    ("Lean Right", 0.55, "The article set includes policy language often associated with right-leaning framing."),
+    ("Lean Right", 0.55, _SOURCE_ONLY),
+    ("Undetermined", 0.45, "The article set contains charged language, but the direction of political framing is unclear."),
+    ("Undetermined", 0.35, "The run mostly has headline or metadata text, so the app should not infer a center frame."),
+    ("Center", 0.58, "The article set contains limited ideological framing in the inspected text."),
+)
+(
+    VERDICT_NON_POLITICAL,
+    VERDICT_MIXED,
+    VERDICT_LEFT,
+    VERDICT_LEFT_SOURCES,
+    VERDICT_RIGHT,
+    VERDICT_RIGHT_SOURCES,
+    VERDICT_CHARGED,
+    VERDICT_METADATA,
+    VERDICT_CENTER,
+) = range(len(HEURISTIC_VERDICTS))
+LEAN_CONFIDENCE_BASE = 0.55
+LEAN_CONFIDENCE_CAP = 0.88
+LEAN_TERM_WEIGHT = 0.08
+LEAN_SOURCE_WEIGHT = 0.06
+METADATA_ONLY_SHARE = 0.6
+
+
+def lean_confidence(term_hits: int, source_hits: int) -> float:
+    return min(LEAN_CONFIDENCE_CAP, LEAN_CONFIDENCE_BASE + LEAN_TERM_WEIGHT * term_hits + LEAN_SOURCE_WEIGHT * source_hits)
 
 
 def _metadata_only(articles: list[Article]) -> bool:
     if not articles:
         return False
-    thin_count = sum(1 for article in articles if len(article.text) < 240 and article.text.count(".") <= 1)
-    return thin_count / len(articles) >= 0.6
+    thin_count = sum(1 for article in articles if analyze(article).thin)
+    return thin_count / len(articles) >= METADATA_ONLY_SHARE
 
 
 def preprocess_subject(subject: str, today: date | None = None) -> StructuredQuery:
@@ -96,22 +110,28 @@ def preprocess_subject(subject: str, today: date | None = None) -> StructuredQue
 
 
 def _first_sentence(text: str, fallback: str) -> str:
-    match = re.search(r"(.{40,220}?[.!?])(?:\s|$)", text.strip())
-    if not match:
-        return fallback
-    sentence = match.group(1).strip()
-    if len(sentence) < 80 and len(text.strip()) > len(sentence) + 20:
-        return fallback
-    return sentence
+    return lead_sentence(text) or fallback
+
 
+def _lead(article: Article) -> str:
+    return analyze(article).lead or article.title
 
-def _choose_span(article: Article, terms: list[str] | None = None) -> str:
-    sentences = re.split(r"(?<=[.!?])\s+", article.text.strip())
+
+def choose_span(article: Article, terms: list[str] | None = None, analysis: ArticleAnalysis | None = None) -> str:
+    """A verbatim sentence of ``article`` to cite, preferring one that uses ``terms``."""
+
+    analysis = analysis or analyze(article)
+    sentences = analysis.sentences
     if terms:
-        for sentence in sentences:
-            low = sentence.lower()
-            if any(term in low for term in terms) and len(sentence) >= 8:
-                return sentence.strip()
+        matcher, wanted = matcher_for(terms)
+        if matcher is LEXICON:
+            for sentence, found in zip(sentences, analysis.sentence_terms, strict=True):
+                if len(sentence) >= 8 and not wanted.isdisjoint(found):
+                    return sentence.strip()
+        else:
+            for sentence in sentences:
+                if len(sentence) >= 8 and not wanted.isdisjoint(matcher.find_terms(sentence.lower())):
+                    return sentence.strip()
     for sentence in sentences:
         if len(sentence) >= 40:
             return sentence.strip()
@@ -119,7 +139,7 @@ def _choose_span(article: Article, terms: list[str] | None = None) -> str:
 
 
 def _citation(article: Article, terms: list[str] | None = None) -> Citation:
-    return Citation(article_id=article.id, span_text=_choose_span(article, terms))
+    return Citation(article_id=article.id, span_text=choose_span(article, terms))
 
 
 def _safe_float(value: Any, fallback: float) -> float:
@@ -129,35 +149,396 @@ def _safe_float(value: Any, fallback: float) -> float:
         return fallback
 
 
+def _fetched_text(hit: dict[str, str], outcome: FetchOutcome, notes: list[str]) -> str:
+    if outcome.error == DEADLINE_ERROR:
+        notes.append(f"fetch deadline reached for {hit['url']}; used metadata text")
+        return hit.get("description") or hit["title"]
+    if outcome.error is not None:
+        notes.append(f"fetch fallback for {hit['url']}: {outcome.error}")
+        return hit.get("description") or hit["title"]
+    if len(outcome.text or "") < 120:
+        notes.append(f"used metadata text for {hit['url']}")
+        return hit.get("description") or hit["title"]
+    return outcome.text or ""
+
+
+def _analyzed(articles: list[Article]) -> list[Article]:
+    """Analyze each article as it arrives; the stages and renderers read the memoized result."""
+
+    for article in articles:
+        analyze(article)
+    return articles
+
+
 def fetch_articles(
     query: StructuredQuery,
     *,
     keys: LLMKeys,
     max_articles: int,
     fixture_articles: list[Article] | None = None,
+    fetch_deadline: float = FETCH_DEADLINE_SECONDS,
 ) -> tuple[list[Article], list[str]]:
+    """Search, drop syndicated duplicates, and fetch text for up to ``max_articles`` hits.
+
+    Search asks for extra hits so that duplicates collapsed by URL, title,
+    or extracted-text similarity can be backfilled from further down the
+    hit list.
+    """
+
     if fixture_articles is not None:
-        return fixture_articles[:max_articles], ["fixture articles supplied"]
+        return _analyzed(fixture_articles[:max_articles]), ["fixture articles supplied"]
 
-    hits = search_articles(query, max_articles=max_articles, gnews_token=keys.gnews_token)
+    started = time.monotonic()
+    notes: list[str] = []
+    hits = search_articles(
+        query,
+        max_articles=max_articles * SEARCH_HEADROOM,
+        gnews_token=keys.gnews_token,
+        notes=notes,
+    )
     if not hits:
-        return [], [f"no matching articles found for query {query.query!r}"]
+        return [], [*notes, f"no matching articles found for query {query.query!r}"]
+
+    queue, collapsed = collapse_duplicate_hits(hits)
+    for duplicate, representative in collapsed:
+        notes.append(f"collapsed duplicate {duplicate['url']} into {representative['url']}")
+
+    accepted_hits: list[dict[str, str]] = []
     texts: list[str] = []
-    notes: list[str] = []
-    for hit in hits:
+    outcomes: list[FetchOutcome] = []
+    seen_texts = TextDeduplicator()
+    while queue and len(accepted_hits) < max_articles:
+        remaining = fetch_deadline - (time.monotonic() - started)
+        if remaining <= 0 and accepted_hits:
+            break
+        batch, queue = queue[: max_articles - len(accepted_hits)], queue[max_articles - len(accepted_hits) :]
+        batch_outcomes = fetch_texts([hit["url"] for hit in batch], deadline=max(remaining, 0.0))
+        outcomes.extend(batch_outcomes)
+        for hit, outcome in zip(batch, batch_outcomes, strict=True):
+            text = _fetched_text(hit, outcome, notes)
+            if (original := seen_texts.duplicate_of(text)) is not None:
+                notes.append(f"collapsed duplicate {hit['url']} into {original}")
+                continue
+            seen_texts.add(hit["url"], text)
+            accepted_hits.append(hit)
+            texts.append(text)
+    if summary := cache_summary(outcomes):
+        notes.append(summary)
+    return _analyzed(hits_to_articles(accepted_hits, texts)), notes
+
+
+def llm_options(llm: LLMClient, *, prefix: str = "", schema: OutputSchema | None = None) -> dict[str, Any]:
+    """Keyword arguments for ``llm.generate`` / ``llm.stream`` the client supports."""
+
+    options: dict[str, Any] = {}
+    if prefix and llm.prefix_cache:
+        options["prefix"] = prefix
+    if schema is not None and llm.structured:
+        options["schema"] = schema
+    return options
+
+
+def _complete(
+    llm: LLMClient,
+    prompt: str,
+    on_partial: PartialCallback | None = None,
+    *,
+    prefix: str = "",
+    schema: OutputSchema | None = None,
+) -> tuple[str, dict[str, Any]]:
+    call: dict[str, Any] = {"prompt_tokens": estimate_tokens(prompt, llm.provider, llm.model)}
+    llm.calls.append(call)
+    options = llm_options(llm, prefix=prefix, schema=schema)
+    started = time.perf_counter()
+    with collect_usage() as usage:
         try:
-            text = extract_article_text(hit["url"])
-            if len(text) < 120:
-                text = hit.get("description") or hit["title"]
-                notes.append(f"used metadata text for {hit['url']}")
-        except Exception as exc:
-            text = hit.get("description") or hit["title"]
-            notes.append(f"fetch fallback for {hit['url']}: {exc.__class__.__name__}")
-        texts.append(text)
-    return hits_to_articles(hits, texts), notes
-
-
-def summarize(articles: list[Article], llm: LLMClient) -> StructuredSummary:
+            if on_partial is None or llm.stream is None:
+                text = llm.generate(prompt, **options)
+            else:
+                parser = IncrementalJSONParser()
+                chunks: list[str] = []
+                for chunk in llm.stream(prompt, **options):
+                    if not chunks:
+                        call["ttft_seconds"] = round(time.perf_counter() - started, 3)
+                    chunks.append(chunk)
+                    if fields := parser.feed(chunk):
+                        on_partial(fields)
+                text = "".join(chunks).strip()
+        except ProviderUnavailable as exc:
+            # Empty output sends the stage down its heuristic path; the error
+            # surfaces as a stage note via stage_metrics.
+            call["error"] = str(exc)
+            text = ""
+    call.update(usage)
+    call["seconds"] = round(time.perf_counter() - started, 3)
+    return text, call
+
+
+def _ask(
+    llm: LLMClient,
+    prompt: str,
+    on_partial: PartialCallback | None = None,
+    *,
+    prefix: str = "",
+    schema: OutputSchema | None = None,
+) -> str:
+    """Run one stage prompt, streaming when a partial-result callback is given.
+
+    ``prefix`` is the leading part of ``prompt`` shared with other stages;
+    clients with ``prefix_cache`` mark it cacheable. ``schema`` constrains
+    the output on clients that support structured output.
+    """
+
+    return _complete(llm, prompt, on_partial, prefix=prefix, schema=schema)[0]
+
+
+def _ask_json(
+    llm: LLMClient,
+    prompt: str,
+    on_partial: PartialCallback | None = None,
+    *,
+    prefix: str = "",
+    schema: OutputSchema | None = None,
+) -> dict[str, Any] | None:
+    """``_ask`` plus tolerant JSON parsing; repairs and failures are counted per provider."""
+
+    text, call = _complete(llm, prompt, on_partial, prefix=prefix, schema=schema)
+    parsed, outcome = parse_model_json(text)
+    PARSE_STATS.record(llm.provider, outcome)
+    if outcome in {"repaired", "failed"}:
+        call["parse"] = outcome
+    return parsed
+
+
+def stage_metrics(llm: LLMClient) -> dict[str, Any]:
+    """Drain the client's call log into StageRecord metrics."""
+
+    calls = llm.drain_calls()
+    if not calls:
+        return {}
+    per_call = [call["prompt_tokens"] for call in calls]
+    metrics: dict[str, Any] = {
+        "llm_calls": len(calls),
+        "prompt_tokens": sum(per_call),
+        "prompt_tokens_per_call": per_call,
+        "llm_seconds": round(sum(call.get("seconds", 0.0) for call in calls), 3),
+    }
+    if ttft := [call["ttft_seconds"] for call in calls if "ttft_seconds" in call]:
+        metrics["ttft_seconds"] = ttft[0]
+    if any("input_tokens" in call for call in calls):
+        # Provider-reported counts; cached tokens are billed and processed
+        # at the provider's discounted prefix-cache rate.
+        metrics["input_tokens"] = sum(call.get("input_tokens", 0) for call in calls)
+        metrics["cached_tokens"] = sum(call.get("cached_tokens", 0) for call in calls)
+        if written := sum(call.get("cache_write_tokens", 0) for call in calls):
+            metrics["cache_write_tokens"] = written
+    for name in OLLAMA_TIMING_KEYS:
+        if any(name in call for call in calls):
+            metrics[name] = round(sum(call.get(name, 0) for call in calls), 3)
+    if errors := [call["error"] for call in calls if "error" in call]:
+        metrics["provider_errors"] = errors
+    for outcome in ("repaired", "failed"):
+        if count := sum(1 for call in calls if call.get("parse") == outcome):
+            metrics[f"parse_{outcome}"] = count
+    return metrics
+
+
+def fallback_notes(metrics: dict[str, Any]) -> list[str]:
+    notes = []
+    if errors := metrics.get("provider_errors", []):
+        notes.append(
+            f"provider unavailable for {len(errors)} of {metrics['llm_calls']} call(s) ({errors[-1]}); used heuristic fallback"
+        )
+    if failed := metrics.get("parse_failed"):
+        notes.append(f"{failed} model response(s) were not parseable JSON; used heuristic fallback")
+    if repaired := metrics.get("parse_repaired"):
+        notes.append(f"repaired {repaired} malformed JSON response(s)")
+    return notes
+
+
+def stage_status(metrics: dict[str, Any]) -> str:
+    return "warning" if metrics.get("provider_errors") or metrics.get("parse_failed") else "ok"
+
+
+def _verified(citations: list[Citation], articles: list[Article]) -> list[Citation]:
+    # check, not verify: offsets are recorded once on the final trace, and
+    # these citations still feed later stage prompts.
+    index = CitationIndex(articles)
+    return [citation for citation in citations if index.check(citation) is None]
+
+
+def _digest_checked(
+    citations: list[Citation], articles: list[Article], digests: list[ArticleDigest] | None, limit: int
+) -> list[Citation]:
+    # A reduce-side prompt only saw digests, so its model may quote a gist
+    # instead of the article; keep spans that still verify, else fall back
+    # to the digests' verified spans.
+    if digests is None:
+        return citations
+    return _verified(citations, articles) or [span for digest in digests for span in digest.framing_spans][:limit]
+
+
+def _heuristic_digest(article: Article) -> ArticleDigest:
+    spans = [_citation(article, CHARGED_TERMS)] if analyze(article).has("charged") else []
+    return ArticleDigest(
+        article_id=article.id,
+        gist=_lead(article),
+        framing_spans=spans,
+    )
+
+
+def _digest_prompt(article: Article, llm: LLMClient, terms: list[str]) -> str:
+    return _prompt(llm, [load_prompt("digest")], [article], terms=terms, titles=True, heading="ARTICLE")
+
+
+def digest_prompts(articles: list[Article], llm: LLMClient, query: str = "") -> list[str]:
+    """The map step's per-article digest prompts, in article order."""
+
+    terms = query_terms(query)
+    return [_digest_prompt(article, llm, terms) for article in articles]
+
+
+def _parse_digest(article: Article, response: str | None) -> tuple[ArticleDigest, int, bool]:
+    """Map step result for one article: the digest, dropped span count, and whether it fell back."""
+
+    parsed = extract_json_object(response or "")
+    if not parsed:
+        return _heuristic_digest(article), 0, True
+    try:
+        quoted = [str(item.get("span_text", "") if isinstance(item, dict) else item) for item in parsed.get("framing_spans", [])[:3]]
+        spans = [Citation(article_id=article.id, span_text=text) for text in quoted if len(text) >= 8]
+        verified = _verified(spans, [article])
+        digest = ArticleDigest(
+            article_id=article.id,
+            gist=str(parsed.get("gist") or _lead(article)),
+            key_points=[str(item) for item in parsed.get("key_points", [])][:3],
+            framing_spans=verified,
+            stance_cues=[str(item) for item in parsed.get("stance_cues", [])][:5],
+        )
+    except Exception:
+        return _heuristic_digest(article), 0, True
+    return digest, len(spans) - len(verified), False
+
+
+def digest_response(llm: LLMClient, prompt: str) -> str | None:
+    """One map-step call with the stage bookkeeping of ``_ask``; None when it fails."""
+
+    try:
+        return _ask(llm, prompt, schema=STAGE_SCHEMAS["digest"])
+    except Exception:
+        return None
+
+
+def uses_map_reduce(articles: list[Article], llm: LLMClient, mode: str = "auto") -> bool:
+    if llm.provider == "heuristic" or not articles or mode == "single":
+        return False
+    return mode == "map_reduce" or len(articles) > MAP_REDUCE_MIN_ARTICLES
+
+
+def parse_digests(
+    articles: list[Article], responses: list[str | None], workers: int, notes: list[str] | None = None
+) -> list[ArticleDigest]:
+    """Digests from the map step's responses (None for a failed call), with bookkeeping notes."""
+
+    results = [_parse_digest(article, response) for article, response in zip(articles, responses, strict=True)]
+    digests = [digest for digest, _dropped, _fallback in results]
+    if notes is not None:
+        dropped = sum(count for _digest, count, _fallback in results)
+        fallbacks = sum(1 for *_rest, fallback in results if fallback)
+        notes.append(f"map-reduce: {len(digests)} article digest(s) from {workers} concurrent worker(s)")
+        if dropped:
+            notes.append(f"map-reduce: dropped {dropped} span(s) not found verbatim in article text")
+        if fallbacks:
+            notes.append(f"map-reduce: {fallbacks} digest(s) used heuristic fallback")
+    return digests
+
+
+def digest_articles(
+    articles: list[Article],
+    llm: LLMClient,
+    *,
+    mode: str = "auto",
+    query: str = "",
+    notes: list[str] | None = None,
+) -> list[ArticleDigest] | None:
+    """Map step of map-reduce summarization, or None for single-prompt mode.
+
+    ``mode`` is ``"single"``, ``"map_reduce"``, or ``"auto"`` (map-reduce
+    once a model-backed run has more than ``MAP_REDUCE_MIN_ARTICLES``
+    articles). Each article is digested by its own prompt, concurrently;
+    framing spans that do not occur verbatim in the article are dropped.
+    """
+
+    if not uses_map_reduce(articles, llm, mode):
+        return None
+    workers = min(MAP_WORKERS, llm.max_concurrency or MAP_WORKERS, len(articles))
+    prompts = digest_prompts(articles, llm, query)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="digest") as executor:
+        responses = list(executor.map(lambda prompt: digest_response(llm, prompt), prompts))
+    return parse_digests(articles, responses, workers, notes)
+
+
+def _digest_block(digests: list[ArticleDigest]) -> str:
+    return "\n".join(digest.model_dump_json() for digest in digests)
+
+
+def _prompt(
+    llm: LLMClient,
+    sections: list[str],
+    articles: list[Article] | None = None,
+    *,
+    terms: list[str] | None = None,
+    titles: bool = False,
+    heading: str = "ARTICLES",
+) -> str:
+    """Instructions-first prompt through the token-budgeted assembler (digest map step, reconcile)."""
+
+    return assemble_prompt(
+        sections,
+        articles,
+        provider=llm.provider,
+        model=llm.model,
+        terms=terms or [],
+        titles=titles,
+        heading=heading,
+    )
+
+
+def _shared_prompt(
+    llm: LLMClient,
+    sections: list[str],
+    articles: list[Article],
+    *,
+    digests: list[ArticleDigest] | None = None,
+    query: str = "",
+) -> tuple[str, str]:
+    """``(prefix, prompt)`` for the article-reading stages.
+
+    The article (or digest) block comes first and is packed the same way
+    for summarize, bias, and critique, so it is a byte-identical prefix
+    the provider can cache; the stage instructions follow it.
+    """
+
+    if digests is not None:
+        prefix = "ARTICLE DIGESTS:\n" + _digest_block(digests) + "\n\n"
+    else:
+        prefix = article_prefix(
+            articles,
+            provider=llm.provider,
+            model=llm.model,
+            terms=[*query_terms(query), *LEFT_TERMS, *RIGHT_TERMS, *CHARGED_TERMS],
+        )
+    return prefix, prefix + "".join(sections)
+
+
+def summarize(
+    articles: list[Article],
+    llm: LLMClient,
+    *,
+    digests: list[ArticleDigest] | None = None,
+    query: str = "",
+    on_partial: PartialCallback | None = None,
+) -> StructuredSummary:
     if not articles:
         return StructuredSummary(
             headline="No articles found",
@@ -167,12 +548,14 @@ def summarize(articles: list[Article], llm: LLMClient) -> StructuredSummary:
         )
 
     if llm.provider != "heuristic":
-        prompt = (
-            load_prompt("summarize")
-            + "\n\nARTICLES:\n"
-            + "\n\n".join(f"[{a.id}] {a.title}\n{a.text[:2400]}" for a in articles)
+        prefix, prompt = _shared_prompt(
+            llm,
+            [load_prompt("summarize" if digests is None else "summarize_reduce")],
+            articles,
+            digests=digests,
+            query=query,
         )
-        parsed = extract_json_object(llm.generate(prompt))
+        parsed = _ask_json(llm, prompt, on_partial, prefix=prefix, schema=STAGE_SCHEMAS["summarize"])
         if parsed:
             try:
                 spans = []
@@ -181,21 +564,18 @@ def summarize(articles: list[Article], llm: LLMClient) -> StructuredSummary:
                         spans.append(Citation(article_id=item["article_id"], span_text=item["span_text"]))
                     elif articles:
                         spans.append(_citation(articles[0]))
+                spans = _digest_checked(spans, articles, digests, 4)
                 return StructuredSummary(
                     headline=str(parsed.get("headline") or articles[0].title),
-                    neutral_summary=str(parsed.get("neutral_summary") or _first_sentence(articles[0].text, articles[0].title)),
+                    neutral_summary=str(parsed.get("neutral_summary") or _lead(articles[0])),
                     key_points=[str(item) for item in parsed.get("key_points", [])][:8],
                     framing_notes=spans or [_citation(articles[0])],
                 )
             except Exception:
                 pass
 
-    key_points = [_first_sentence(article.text, article.title) for article in articles[:5]]
-    framing_notes = [
-        _citation(article, CHARGED_TERMS)
-        for article in articles[:3]
-        if any(term in article.text.lower() for term in CHARGED_TERMS)
-    ]
+    key_points = [_lead(article) for article in articles[:5]]
+    framing_notes = [_citation(article, CHARGED_TERMS) for article in articles[:3] if analyze(article).has("charged")]
     if not framing_notes:
         framing_notes = [_citation(articles[0])]
     return StructuredSummary(
@@ -206,34 +586,48 @@ def summarize(articles: list[Article], llm: LLMClient) -> StructuredSummary:
     )
 
 
-def detect_bias(summary: StructuredSummary, articles: list[Article], llm: LLMClient) -> StructuredBiasJudgment:
-    if not articles:
-        return StructuredBiasJudgment(
-            label="Undetermined",
-            confidence=0.0,
-            rationale="No article text was available for this query.",
-            evidence=[],
-            proxy_features=[],
-        )
+def empty_judgment() -> StructuredBiasJudgment:
+    return StructuredBiasJudgment(
+        label="Undetermined",
+        confidence=0.0,
+        rationale="No article text was available for this query.",
+        evidence=[],
+        proxy_features=[],
+    )
 
-    combined = "\n".join(article.text.lower() for article in articles)
-    left_hits = [term for term in LEFT_TERMS if term in combined]
-    right_hits = [term for term in RIGHT_TERMS if term in combined]
-    charged_hits = [term for term in CHARGED_TERMS if term in combined]
-    non_political = any(term in combined for term in NON_POLITICAL_TERMS)
-    source_contexts = [source_context(article) for article in articles]
+
+def detect_bias(
+    summary: StructuredSummary,
+    articles: list[Article],
+    llm: LLMClient,
+    *,
+    digests: list[ArticleDigest] | None = None,
+    query: str = "",
+    on_partial: PartialCallback | None = None,
+) -> StructuredBiasJudgment:
+    if not articles:
+        return empty_judgment()
+
+    # No term spans a newline, so per-article scans match the joined text.
+    analyses = [analyze(article) for article in articles]
+    found = frozenset().union(*(analysis.terms for analysis in analyses))
+    left_hits = [term for term in LEFT_TERMS if term in found]
+    right_hits = [term for term in RIGHT_TERMS if term in found]
+    charged_hits = [term for term in CHARGED_TERMS if term in found]
+    non_political = any(term in found for term in NON_POLITICAL_TERMS)
+    source_contexts = [analysis.source_context for analysis in analyses]
     left_source_hits = [context[0] for context in source_contexts if context and context[1] == "left"]
     right_source_hits = [context[0] for context in source_contexts if context and context[1] == "right"]
 
     if llm.provider != "heuristic":
-        prompt = (
-            load_prompt("bias_detect")
-            + "\n\nSUMMARY:\n"
-            + summary.model_dump_json(indent=2)
-            + "\n\nARTICLES:\n"
-            + "\n\n".join(f"[{a.id}] {a.text[:2400]}" for a in articles)
+        prefix, prompt = _shared_prompt(
+            llm,
+            [load_prompt("bias_detect"), "\n\nSUMMARY:\n", summary.model_dump_json(indent=2)],
+            articles,
+            digests=digests,
+            query=query,
         )
-        parsed = extract_json_object(llm.generate(prompt))
+        parsed = _ask_json(llm, prompt, on_partial, prefix=prefix, schema=STAGE_SCHEMAS["bias_detect"])
         if parsed:
             try:
                 evidence = [
@@ -241,6 +635,7 @@ def detect_bias(summary: StructuredSummary, articles: list[Article], llm: LLMCli
                     for item in parsed.get("evidence", [])
                     if isinstance(item, dict)
                 ]
+                evidence = _digest_checked(evidence, articles, digests, 4)
                 return StructuredBiasJudgment(
                     label=parsed.get("label", "Undetermined"),
                     confidence=_safe_float(parsed.get("confidence"), 0.5),
@@ -252,39 +647,24 @@ def detect_bias(summary: StructuredSummary, articles: list[Article], llm: LLMCli
                 pass
 
     if non_political and not left_hits and not right_hits and not left_source_hits and not right_source_hits:
-        label = "Center"
-        confidence = 0.72
-        rationale = "The article set appears non-political or lacks ideological policy framing."
+        verdict = VERDICT_NON_POLITICAL
     elif (left_hits or left_source_hits) and (right_hits or right_source_hits):
-        label = "Mixed"
-        confidence = 0.64
-        rationale = "The article set contains cues associated with both left-leaning and right-leaning frames."
+        verdict = VERDICT_MIXED
     elif left_hits or left_source_hits:
-        label = "Lean Left"
-        confidence = min(0.88, 0.55 + 0.08 * len(left_hits) + 0.06 * len(left_source_hits))
-        if left_hits:
-            rationale = "The article set includes policy language often associated with left-leaning framing."
-        else:
-            rationale = "The directional signal comes from cataloged source context, not article-language evidence alone."
+        verdict = VERDICT_LEFT if left_hits else VERDICT_LEFT_SOURCES
     elif right_hits or right_source_hits:
-        label = "Lean Right"
-        confidence = min(0.88, 0.55 + 0.08 * len(right_hits) + 0.06 * len(right_source_hits))
-        if right_hits:
-            rationale = "The article set includes policy language often associated with right-leaning framing."
-        else:
-            rationale = "The directional signal comes from cataloged source context, not article-language evidence alone."
+        verdict = VERDICT_RIGHT if right_hits else VERDICT_RIGHT_SOURCES
     elif charged_hits:
-        label = "Undetermined"
-        confidence = 0.45
-        rationale = "The article set contains charged language, but the direction of political framing is unclear."
+        verdict = VERDICT_CHARGED
     elif _metadata_only(articles):
-        label = "Undetermined"
-        confidence = 0.35
-        rationale = "The run mostly has headline or metadata text, so the app should not infer a center frame."
+        verdict = VERDICT_METADATA
     else:
-        label = "Center"
-        confidence = 0.58
-        rationale = "The article set contains limited ideological framing in the inspected text."
+        verdict = VERDICT_CENTER
+    label, confidence, rationale = HEURISTIC_VERDICTS[verdict]
+    if verdict in (VERDICT_LEFT, VERDICT_LEFT_SOURCES):
+        confidence = lean_confidence(len(left_hits), len(left_source_hits))
+    elif verdict in (VERDICT_RIGHT, VERDICT_RIGHT_SOURCES):
+        confidence = lean_confidence(len(right_hits), len(right_source_hits))
 
     evidence_terms = left_hits + right_hits + charged_hits
     evidence_articles = articles[:2] or [Article(id="none", title="none", url="none", text="No article text available.")]
@@ -298,18 +678,31 @@ def detect_bias(summary: StructuredSummary, articles: list[Article], llm: LLMCli
     )
 
 
-def critique(summary: StructuredSummary, judgment: StructuredBiasJudgment, articles: list[Article], llm: LLMClient) -> StructuredCritique:
+def critique(
+    summary: StructuredSummary,
+    judgment: StructuredBiasJudgment,
+    articles: list[Article],
+    llm: LLMClient,
+    *,
+    digests: list[ArticleDigest] | None = None,
+    query: str = "",
+    on_partial: PartialCallback | None = None,
+) -> StructuredCritique:
     if llm.provider != "heuristic":
-        prompt = (
-            load_prompt("critique")
-            + "\n\nSUMMARY:\n"
-            + summary.model_dump_json(indent=2)
-            + "\n\nDETECTOR_OUTPUT:\n"
-            + judgment.model_dump_json(indent=2)
-            + "\n\nARTICLES:\n"
-            + "\n\n".join(f"[{a.id}] {a.text[:2200]}" for a in articles)
+        prefix, prompt = _shared_prompt(
+            llm,
+            [
+                load_prompt("critique"),
+                "\n\nSUMMARY:\n",
+                summary.model_dump_json(indent=2),
+                "\n\nDETECTOR_OUTPUT:\n",
+                judgment.model_dump_json(indent=2),
+            ],
+            articles,
+            digests=digests,
+            query=query,
         )
-        parsed = extract_json_object(llm.generate(prompt))
+        parsed = _ask_json(llm, prompt, on_partial, prefix=prefix, schema=STAGE_SCHEMAS["critique"])
         if parsed:
             try:
                 phrases = [
@@ -317,6 +710,7 @@ def critique(summary: StructuredSummary, judgment: StructuredBiasJudgment, artic
                     for item in parsed.get("trigger_phrases", [])
                     if isinstance(item, dict)
                 ]
+                phrases = _digest_checked(phrases, articles, digests, 3)
                 return StructuredCritique(
                     refined_label=parsed.get("refined_label", judgment.label),
                     agree_with_detector=bool(parsed.get("agree_with_detector", True)),
@@ -347,18 +741,29 @@ def critique(summary: StructuredSummary, judgment: StructuredBiasJudgment, artic
     )
 
 
-def reconcile(summary: StructuredSummary, judgment: StructuredBiasJudgment, critique_result: StructuredCritique, articles: list[Article], llm: LLMClient) -> ReconciledReport:
+def reconcile(
+    summary: StructuredSummary,
+    judgment: StructuredBiasJudgment,
+    critique_result: StructuredCritique,
+    articles: list[Article],
+    llm: LLMClient,
+    *,
+    on_partial: PartialCallback | None = None,
+) -> ReconciledReport:
     if llm.provider != "heuristic":
-        prompt = (
-            load_prompt("reconcile")
-            + "\n\nSUMMARY:\n"
-            + summary.model_dump_json(indent=2)
-            + "\n\nBIAS:\n"
-            + judgment.model_dump_json(indent=2)
-            + "\n\nCRITIQUE:\n"
-            + critique_result.model_dump_json(indent=2)
+        prompt = _prompt(
+            llm,
+            [
+                load_prompt("reconcile"),
+                "\n\nSUMMARY:\n",
+                summary.model_dump_json(indent=2),
+                "\n\nBIAS:\n",
+                judgment.model_dump_json(indent=2),
+                "\n\nCRITIQUE:\n",
+                critique_result.model_dump_json(indent=2),
+            ],
         )
-        parsed = extract_json_object(llm.generate(prompt))
+        parsed = _ask_json(llm, prompt, on_partial, schema=STAGE_SCHEMAS["reconcile"])
         if parsed:
             try:
                 return ReconciledReport(
@@ -387,8 +792,107 @@ def reconcile(summary: StructuredSummary, judgment: StructuredBiasJudgment, crit
     )
 
 
-def _stage(name: str, implementation: str, output: dict[str, Any], notes: list[str] | None = None) -> StageRecord:
-    return StageRecord(name=name, implementation=implementation, output=output, notes=notes or [])
+def stage_partial(
+    on_partial: Callable[[str, dict[str, Any]], None] | None, stage: str
+) -> PartialCallback | None:
+    if on_partial is None:
+        return None
+    return lambda fields: on_partial(stage, fields)
+
+
+def _stage(
+    name: str,
+    implementation: str,
+    output: dict[str, Any],
+    notes: list[str] | None = None,
+    metrics: dict[str, Any] | None = None,
+) -> StageRecord:
+    metrics = metrics or {}
+    return StageRecord(
+        name=name,
+        implementation=implementation,
+        status=stage_status(metrics),
+        output=output,
+        notes=[*(notes or []), *fallback_notes(metrics)],
+        metrics=metrics,
+    )
+
+
+def _verified_trace(trace: PipelineTrace) -> PipelineTrace:
+    trace.citation_errors = verify_citations(trace)
+    if trace.citation_errors:
+        raise ValueError("Citation verifier failed: " + "; ".join(trace.citation_errors))
+    return trace
+
+
+def run_stages(
+    subject: str,
+    query: StructuredQuery,
+    articles: list[Article],
+    llm: LLMClient,
+    *,
+    implementation: str,
+    fetch_notes: list[str] | None = None,
+    digests: list[ArticleDigest] | None = None,
+    summary_notes: list[str] | None = None,
+    framework_notes: list[str] | None = None,
+    on_partial: Callable[[str, dict[str, Any]], None] | None = None,
+) -> PipelineTrace:
+    """Record the preprocess and fetch stages, run summarize through reconcile, and return the verified trace.
+
+    The stage sequence shared by ``run_pipeline``, ``arun_pipeline``, and
+    batch replay; each produces the map-step ``digests`` (and their
+    ``summary_notes``) its own way first.
+    """
+
+    stages = [
+        _stage("preprocess", implementation, query.model_dump()),
+        _stage(
+            "search_fetch",
+            implementation,
+            {"article_count": len(articles), "article_ids": [a.id for a in articles]},
+            fetch_notes,
+        ),
+    ]
+
+    summary = summarize(articles, llm, digests=digests, query=query.query, on_partial=stage_partial(on_partial, "summarize"))
+    stages.append(_stage("summarize", implementation, summary.model_dump(), summary_notes, stage_metrics(llm)))
+
+    judgment = detect_bias(
+        summary, articles, llm, digests=digests, query=query.query, on_partial=stage_partial(on_partial, "bias_detect")
+    )
+    stages.append(_stage("bias_detect", implementation, judgment.model_dump(), metrics=stage_metrics(llm)))
+
+    critique_result = critique(
+        summary,
+        judgment,
+        articles,
+        llm,
+        digests=digests,
+        query=query.query,
+        on_partial=stage_partial(on_partial, "critique"),
+    )
+    stages.append(_stage("critique", implementation, critique_result.model_dump(), metrics=stage_metrics(llm)))
+
+    report = reconcile(summary, judgment, critique_result, articles, llm, on_partial=stage_partial(on_partial, "reconcile"))
+    stages.append(_stage("reconcile", implementation, report.model_dump(), metrics=stage_metrics(llm)))
+
+    return _verified_trace(
+        PipelineTrace(
+            subject=subject,
+            implementation=implementation,
+            provider=llm.provider,
+            model=llm.model,
+            structured_query=query,
+            articles=articles,
+            summary=summary,
+            bias_judgment=judgment,
+            critique=critique_result,
+            report=report,
+            stages=stages,
+            framework_notes=framework_notes or [],
+        )
+    )
 
 
 def run_pipeline(
@@ -401,54 +905,35 @@ def run_pipeline(
     max_articles: int = 5,
     fixture_articles: list[Article] | None = None,
     framework_notes: list[str] | None = None,
+    summary_mode: str = "auto",
+    on_partial: Callable[[str, dict[str, Any]], None] | None = None,
 ) -> PipelineTrace:
+    """Run every stage in order and return a citation-verified trace.
+
+    ``on_partial(stage_name, fields)`` switches model-backed stages to
+    streaming and receives top-level response fields as they arrive.
+    """
+
     keys = keys or LLMKeys()
     llm = get_llm(provider, model, keys)
     query = preprocess_subject(subject)
-    stages = [_stage("preprocess", implementation, query.model_dump())]
-
     articles, fetch_notes = fetch_articles(
         query,
         keys=keys,
         max_articles=max_articles,
         fixture_articles=fixture_articles,
     )
-    stages.append(
-        _stage(
-            "search_fetch",
-            implementation,
-            {"article_count": len(articles), "article_ids": [a.id for a in articles]},
-            fetch_notes,
-        )
-    )
-
-    summary = summarize(articles, llm)
-    stages.append(_stage("summarize", implementation, summary.model_dump()))
-
-    judgment = detect_bias(summary, articles, llm)
-    stages.append(_stage("bias_detect", implementation, judgment.model_dump()))
-
-    critique_result = critique(summary, judgment, articles, llm)
-    stages.append(_stage("critique", implementation, critique_result.model_dump()))
-
-    report = reconcile(summary, judgment, critique_result, articles, llm)
-    stages.append(_stage("reconcile", implementation, report.model_dump()))
-
-    trace = PipelineTrace(
-        subject=subject,
+    summary_notes: list[str] = []
+    digests = digest_articles(articles, llm, mode=summary_mode, query=query.query, notes=summary_notes)
+    return run_stages(
+        subject,
+        query,
+        articles,
+        llm,
         implementation=implementation,
-        provider=llm.provider,
-        model=llm.model,
-        structured_query=query,
-        articles=articles,
-        summary=summary,
-        bias_judgment=judgment,
-        critique=critique_result,
-        report=report,
-        stages=stages,
-        framework_notes=framework_notes or [],
+        fetch_notes=fetch_notes,
+        digests=digests,
+        summary_notes=summary_notes,
+        framework_notes=framework_notes,
+        on_partial=on_partial,
     )
-    trace.citation_errors = verify_citations(trace)
-    if trace.citation_errors:
-        raise ValueError("Citation verifier failed: " + "; ".join(trace.citation_errors))
-    return trace
@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import math
+import re
+from collections.abc import Sequence
+
+from core.llm_provider import MAX_OUTPUT_TOKENS, OLLAMA_NUM_CTX
+from core.schemas import Article
+
+
+# Rough characters-per-token for each provider's tokenizer on English news
+# prose. Estimates only need to be close enough to keep prompts in budget.
+CHARS_PER_TOKEN = {
+    "anthropic": 3.5,
+    "openai": 4.0,
+    "google": 4.0,
+    "ollama": 3.6,
+}
+DEFAULT_CHARS_PER_TOKEN = 4.0
+
+CONTEXT_TOKENS = {
+    "anthropic": 200_000,
+    "openai": 128_000,
+    "google": 1_000_000,
+    "ollama": OLLAMA_NUM_CTX,
+}
+MODEL_CONTEXT_TOKENS = {
+    "gpt-3.5-turbo": 16_385,
+    "gpt-4": 8_192,
+    "gemini-1.0-pro": 32_760,
+}
+DEFAULT_CONTEXT_TOKENS = 8_192
+
+# Large-context models could take whole article sets; this keeps one
+# stage prompt's article section to a sane cost.
+MAX_ARTICLE_SECTION_TOKENS = 32_000
+PROMPT_MARGIN_TOKENS = 256
+# Room after the shared article prefix for stage instructions and the
+# summary / detector JSON that bias and critique append.
+PREFIX_SUFFIX_RESERVE_TOKENS = 2_048
+ELISION = " [...] "
+
+
+def estimate_tokens(text: str, provider: str = "", model: str | None = None) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN.get(provider, DEFAULT_CHARS_PER_TOKEN))
+
+
+def context_tokens(provider: str, model: str | None = None) -> int:
+    if model and model in MODEL_CONTEXT_TOKENS:
+        return MODEL_CONTEXT_TOKENS[model]
+    return CONTEXT_TOKENS.get(provider, DEFAULT_CONTEXT_TOKENS)
+
+
+def article_budget(fixed_prompt: str, provider: str, model: str | None = None, *, reserve_tokens: int = 0) -> int:
+    """Tokens left for article text after the fixed prompt and the reply."""
+
+    available = context_tokens(provider, model) - MAX_OUTPUT_TOKENS - PROMPT_MARGIN_TOKENS - reserve_tokens
+    available -= estimate_tokens(fixed_prompt, provider, model)
+    return max(0, min(available, MAX_ARTICLE_SECTION_TOKENS))
+
+
+def _sentences(text: str) -> list[str]:
+    return [sentence for sentence in re.split(r"(?<=[.!?])\s+", text.strip()) if sentence]
+
+
+def _hits(text: str, terms: Sequence[str]) -> int:
+    low = text.lower()
+    return sum(low.count(term) for term in terms)
+
+
+def allocate(needs: list[int], weights: list[float], budget: int) -> list[int]:
+    """Split ``budget`` across items in proportion to ``weights``.
+
+    Items that need less than their share take only what they need and the
+    surplus is shared among the rest (water filling).
+    """
+
+    allocation = [0] * len(needs)
+    pending = [index for index, need in enumerate(needs) if need > 0]
+    remaining = budget
+    while pending and remaining > 0:
+        total = sum(weights[index] for index in pending)
+        shares = {index: remaining * weights[index] / total for index in pending}
+        satisfied = [index for index in pending if needs[index] <= shares[index]]
+        if not satisfied:
+            for index in pending:
+                allocation[index] = int(shares[index])
+            break
+        for index in satisfied:
+            allocation[index] = needs[index]
+            remaining -= needs[index]
+            pending.remove(index)
+    return allocation
+
+
+def pack_text(text: str, budget_tokens: int, terms: Sequence[str], provider: str = "", model: str | None = None) -> str:
+    """Return ``text`` whole if it fits, else its highest-value sentences.
+
+    Sentences are ranked by term hits, with the lede as a tie-breaker, and
+    emitted in their original order. Gaps are marked with ``ELISION`` so a
+    model does not quote across them; every kept sentence is verbatim. When
+    no sentence fits, the top-ranked one is clipped to the budget.
+    """
+
+    if estimate_tokens(text, provider, model) <= budget_tokens:
+        return text
+    sentences = _sentences(text)
+    ranked = sorted(range(len(sentences)), key=lambda index: (-_hits(sentences[index], terms), index != 0, index))
+    chosen: set[int] = set()
+    used = 0
+    for index in ranked:
+        cost = estimate_tokens(sentences[index] + " ", provider, model)
+        if used + cost > budget_tokens:
+            continue
+        chosen.add(index)
+        used += cost
+    if not chosen and ranked:
+        # No whole sentence fits (unpunctuated scrape, long lede): send the
+        # start of the best one rather than an empty block.
+        limit = int(budget_tokens * CHARS_PER_TOKEN.get(provider, DEFAULT_CHARS_PER_TOKEN))
+        return sentences[ranked[0]][:limit].rstrip()
+    pieces: list[str] = []
+    previous = -1
+    for index in sorted(chosen):
+        if pieces and index != previous + 1:
+            pieces.append(ELISION)
+        elif pieces:
+            pieces.append(" ")
+        pieces.append(sentences[index])
+        previous = index
+    return "".join(pieces)
+
+
+def pack_articles(
+    articles: list[Article],
+    budget_tokens: int,
+    *,
+    terms: Sequence[str] = (),
+    titles: bool = False,
+    provider: str = "",
+    model: str | None = None,
+) -> str:
+    """Render ``[id] text`` blocks for every article within ``budget_tokens``.
+
+    Articles with more term hits get a larger share of the budget.
+    """
+
+    headers = [f"[{a.id}] {a.title}\n" if titles else f"[{a.id}] " for a in articles]
+    overhead = sum(estimate_tokens(header + "\n\n", provider, model) for header in headers)
+    needs = [estimate_tokens(a.text, provider, model) for a in articles]
+    weights = [1.0 + _hits(a.text, terms) for a in articles]
+    shares = allocate(needs, weights, max(0, budget_tokens - overhead))
+    return "\n\n".join(
+        header + pack_text(a.text, share, terms, provider, model)
+        for header, a, share in zip(headers, articles, shares, strict=True)
+    )
+
+
+def assemble_prompt(
+    sections: Sequence[str],
+    articles: list[Article] | None = None,
+    *,
+    provider: str,
+    model: str | None = None,
+    terms: Sequence[str] = (),
+    titles: bool = False,
+    heading: str = "ARTICLES",
+) -> str:
+    """Join fixed prompt sections, then pack articles into the remaining budget."""
+
+    prompt = "".join(sections)
+    if not articles:
+        return prompt
+    budget = article_budget(prompt, provider, model)
+    return (
+        prompt
+        + f"\n\n{heading}:\n"
+        + pack_articles(articles, budget, terms=terms, titles=titles, provider=provider, model=model)
+    )
+
+
+def article_prefix(
+    articles: list[Article],
+    *,
+    provider: str,
+    model: str | None = None,
+    terms: Sequence[str] = (),
+    heading: str = "ARTICLES",
+) -> str:
+    """The article block that leads every article-reading stage prompt.
+
+    It is packed against a fixed reserve rather than each stage's own
+    instructions, so summarize, bias, and critique send byte-identical
+    leading text and provider prefix caches can hit from the second stage on.
+    """
+
+    header = f"{heading}:\n"
+    budget = article_budget(header, provider, model, reserve_tokens=PREFIX_SUFFIX_RESERVE_TOKENS)
+    return header + pack_articles(articles, budget, terms=terms, titles=True, provider=provider, model=model) + "\n\n"
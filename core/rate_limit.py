@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """Thread-safe token bucket.
+
+    Holds up to ``capacity`` tokens and refills at ``refill_per_second``.
+    ``acquire`` can wait briefly for a token; ``reserve`` tokens are held
+    back so callers can degrade before the upstream quota is exhausted.
+    """
+
+    def __init__(
+        self,
+        *,
+        capacity: float,
+        refill_per_second: float,
+        reserve: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.reserve = reserve
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+        self.consumed = 0
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_second)
+        self._updated = now
+
+    def available(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        with self._lock:
+            self._refill()
+            if self._tokens - tokens < self.reserve:
+                return False
+            self._tokens -= tokens
+            self.consumed += 1
+            return True
+
+    def acquire(self, tokens: float = 1.0, *, max_wait: float = 0.0) -> bool:
+        """Take tokens, waiting up to ``max_wait`` seconds for a refill."""
+
+        deadline = self._clock() + max_wait
+        while True:
+            if self.try_acquire(tokens):
+                return True
+            with self._lock:
+                shortfall = tokens + self.reserve - self._tokens
+            wait = shortfall / self.refill_per_second if self.refill_per_second > 0 else float("inf")
+            remaining = deadline - self._clock()
+            if wait > remaining:
+                return False
+            time.sleep(max(wait, 0.001))
+
+    def drain(self) -> None:
+        """Empty the bucket, e.g. after the upstream reports quota exhaustion."""
+
+        with self._lock:
+            self._refill()
+            self._tokens = 0.0
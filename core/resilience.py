@@ -0,0 +1,272 @@
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable
+
+import requests
+
+
+# 529 is Anthropic's "overloaded".
+RETRY_STATUSES = {408, 425, 429, 500, 502, 503, 504, 529}
+MAX_ATTEMPTS = 3
+BACKOFF_BASE_SECONDS = 0.5
+BACKOFF_MAX_SECONDS = 8.0
+MAX_RETRY_AFTER_SECONDS = 30.0
+BREAKER_FAILURES = 3
+BREAKER_RESET_SECONDS = 30.0
+LATENCY_WINDOW = 200
+HEDGE_MIN_SAMPLES = 20
+HEDGE_WORKERS = 8
+HEDGE_ENV = "NEWS_BIAS_LLM_HEDGE_PERCENTILE"
+
+
+class ProviderUnavailable(RuntimeError):
+    """A provider call failed after retries; callers fall back to heuristics."""
+
+
+class CircuitOpen(ProviderUnavailable):
+    pass
+
+
+def retry_after_seconds(response: Any) -> float | None:
+    """Parse a Retry-After header given as seconds or an HTTP date."""
+
+    value = (getattr(response, "headers", None) or {}).get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(
+    attempt: int,
+    *,
+    base: float = BACKOFF_BASE_SECONDS,
+    cap: float = BACKOFF_MAX_SECONDS,
+    rng: Callable[[], float] = random.random,
+) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base * 2**attempt))."""
+
+    return rng() * min(cap, base * 2**attempt)
+
+
+class CircuitBreaker:
+    """Open after ``failures`` consecutive failed calls; allow one trial after ``reset_seconds``."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        failures: int = BREAKER_FAILURES,
+        reset_seconds: float = BREAKER_RESET_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.failures = failures
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self._consecutive = 0
+        self._opened_at: float | None = None
+        self._trial = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            return "half-open" if self._clock() - self._opened_at >= self.reset_seconds else "open"
+
+    def allow(self) -> None:
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if self._clock() - self._opened_at < self.reset_seconds or self._trial:
+                raise CircuitOpen(f"{self.name} circuit open")
+            self._trial = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive = 0
+            self._opened_at = None
+            self._trial = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive += 1
+            self._trial = False
+            if self._opened_at is not None or self._consecutive >= self.failures:
+                self._opened_at = self._clock()
+
+
+class LatencyTracker:
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, fraction: float, *, min_samples: int = HEDGE_MIN_SAMPLES) -> float | None:
+        with self._lock:
+            if len(self._samples) < min_samples:
+                return None
+            ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+@dataclass(frozen=True)
+class ResiliencePolicy:
+    max_attempts: int = MAX_ATTEMPTS
+    base_delay: float = BACKOFF_BASE_SECONDS
+    max_delay: float = BACKOFF_MAX_SECONDS
+    # Send a duplicate request once the first has run longer than this
+    # latency percentile (e.g. 0.95). None disables hedging.
+    hedge_percentile: float | None = None
+
+
+_hedge_executor: ThreadPoolExecutor | None = None
+_hedge_lock = threading.Lock()
+
+
+def _hedge_pool() -> ThreadPoolExecutor:
+    global _hedge_executor
+    with _hedge_lock:
+        if _hedge_executor is None:
+            _hedge_executor = ThreadPoolExecutor(max_workers=HEDGE_WORKERS, thread_name_prefix="hedge")
+        return _hedge_executor
+
+
+def _close_later(future: Future[Any]) -> None:
+    def close(done: Future[Any]) -> None:
+        if not done.cancelled() and done.exception() is None:
+            done.result().close()
+
+    future.add_done_callback(close)
+
+
+class ProviderResilience:
+    """Retries, optional hedging, and a circuit breaker for one provider.
+
+    ``call`` takes a zero-argument ``send`` returning a ``requests``
+    response. Connection errors, timeouts, and retryable statuses are
+    retried with jittered exponential backoff, honouring Retry-After. When
+    every attempt fails the breaker records a failure and
+    ``ProviderUnavailable`` is raised; once the breaker is open, calls fail
+    immediately with ``CircuitOpen``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        policy: ResiliencePolicy | None = None,
+        *,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.name = name
+        self.policy = policy or ResiliencePolicy()
+        self.breaker = CircuitBreaker(name, clock=clock)
+        self.latencies = LatencyTracker()
+        self.hedged = 0
+        self._sleep = sleep
+
+    def _timed(self, send: Callable[[], Any]) -> Any:
+        started = time.perf_counter()
+        response = send()
+        if getattr(response, "status_code", 200) < 400:
+            self.latencies.record(time.perf_counter() - started)
+        return response
+
+    def _send(self, send: Callable[[], Any], hedge: bool) -> Any:
+        threshold = (
+            self.latencies.percentile(self.policy.hedge_percentile)
+            if hedge and self.policy.hedge_percentile is not None
+            else None
+        )
+        if threshold is None:
+            return self._timed(send)
+        pool = _hedge_pool()
+        primary = pool.submit(self._timed, send)
+        done, _pending = wait([primary], timeout=threshold)
+        if done:
+            return primary.result()
+        self.hedged += 1
+        backup = pool.submit(self._timed, send)
+        done, pending = wait([primary, backup], return_when=FIRST_COMPLETED)
+        winner = done.pop()
+        if winner.exception() is not None and pending:
+            # The faster request failed; wait for the slower one instead.
+            return pending.pop().result()
+        _close_later(backup if winner is primary else primary)
+        return winner.result()
+
+    def _attempts(self, send: Callable[[], Any], hedge: bool) -> tuple[Any | None, str]:
+        error = "no attempt made"
+        for attempt in range(self.policy.max_attempts):
+            delay = backoff_delay(attempt, base=self.policy.base_delay, cap=self.policy.max_delay)
+            try:
+                response = self._send(send, hedge)
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                error = type(exc).__name__
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    return response, ""
+                error = f"HTTP {response.status_code}"
+                delay = retry_after_seconds(response) or delay
+                response.close()
+            if attempt + 1 < self.policy.max_attempts:
+                self._sleep(min(delay, MAX_RETRY_AFTER_SECONDS))
+        return None, error
+
+    def call(self, send: Callable[[], Any], *, hedge: bool = True) -> Any:
+        self.breaker.allow()
+        try:
+            response, error = self._attempts(send, hedge)
+        except BaseException:
+            # Any other error (a decoding error, a failed hedge) still has to
+            # end a half-open trial, or the breaker stays open for good.
+            self.breaker.record_failure()
+            raise
+        if response is not None:
+            self.breaker.record_success()
+            return response
+        self.breaker.record_failure()
+        raise ProviderUnavailable(f"{self.name}: {error} after {self.policy.max_attempts} attempt(s)")
+
+
+_registry: dict[str, ProviderResilience] = {}
+_registry_lock = threading.Lock()
+
+
+def provider_resilience(name: str) -> ProviderResilience:
+    """Process-wide resilience state (breaker, latency window) for one provider.
+
+    Set ``NEWS_BIAS_LLM_HEDGE_PERCENTILE`` (e.g. ``0.95``) to hedge slow
+    requests.
+    """
+
+    with _registry_lock:
+        if name not in _registry:
+            hedge = os.environ.get(HEDGE_ENV, "").strip()
+            _registry[name] = ProviderResilience(name, ResiliencePolicy(hedge_percentile=float(hedge) if hedge else None))
+        return _registry[name]
+
+
+def reset_resilience() -> None:
+    with _registry_lock:
+        _registry.clear()
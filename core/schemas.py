@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, SerializerFunctionWrapHandler, field_validator, model_serializer
 
 
 BiasLabel = Literal["Left", "Lean Left", "Center", "Lean Right", "Right", "Mixed", "Undetermined"]
@@ -47,6 +47,30 @@ class Article(BaseModel):
 class Citation(BaseModel):
     article_id: str
     span_text: str = Field(min_length=8)
+    # Offsets of the span in the article text, set by the citation verifier.
+    # Read-only for models: they are left out of stage output schemas.
+    start: int | None = Field(default=None, json_schema_extra={"readOnly": True})
+    end: int | None = Field(default=None, json_schema_extra={"readOnly": True})
+
+    @model_serializer(mode="wrap")
+    def _omit_unset_offsets(self, handler: SerializerFunctionWrapHandler) -> dict[str, Any]:
+        # Unverified citations serialize as before, so stage prompts that
+        # embed them (and their LLM cache keys) do not change.
+        data = handler(self)
+        if self.start is None:
+            data.pop("start", None)
+            data.pop("end", None)
+        return data
+
+
+class ArticleDigest(BaseModel):
+    """Compact per-article result of the map step in map-reduce summarization."""
+
+    article_id: str
+    gist: str
+    key_points: list[str] = Field(default_factory=list)
+    framing_spans: list[Citation] = Field(default_factory=list)
+    stance_cues: list[str] = Field(default_factory=list)
 
 
 class StructuredSummary(BaseModel):
@@ -87,6 +111,7 @@ class StageRecord(BaseModel):
     status: Literal["ok", "warning", "error"] = "ok"
     output: dict[str, Any] = Field(default_factory=dict)
     notes: list[str] = Field(default_factory=list)
+    metrics: dict[str, Any] = Field(default_factory=dict)
 
 
 class PipelineTrace(BaseModel):
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+
+from core.lexicon import Lexicon
+from core.schemas import Article
+
+
+SOURCE_CONTEXT: dict[str, tuple[str, str]] = {
+    # Conservative, right-leaning, or libertarian policy and media sources.
+    "manhattan institute": ("Conservative / right-leaning policy institute", "right"),
+    "city journal": ("Conservative / right-leaning policy publication", "right"),
+    "heritage foundation": ("Conservative / right-leaning policy institute", "right"),
+    "american enterprise institute": ("Conservative / right-leaning policy institute", "right"),
+    "aei": ("Conservative / right-leaning policy institute", "right"),
+    "hoover institution": ("Conservative / right-leaning policy institute", "right"),
+    "claremont institute": ("Conservative / right-leaning policy institute", "right"),
+    "cato institute": ("Libertarian / right-leaning policy institute", "right"),
+    "reason magazine": ("Libertarian / right-leaning publication", "right"),
+    "reason.com": ("Libertarian / right-leaning publication", "right"),
+    "national review": ("Conservative / right-leaning publication", "right"),
+    "the federalist": ("Conservative / right-leaning publication", "right"),
+    "daily wire": ("Conservative / right-leaning publication", "right"),
+    "washington examiner": ("Conservative / right-leaning publication", "right"),
+    "washington times": ("Conservative / right-leaning publication", "right"),
+    "new york post": ("Conservative / right-leaning tabloid", "right"),
+    "fox news": ("Right-leaning cable/news outlet", "right"),
+    "newsmax": ("Conservative / right-leaning cable/news outlet", "right"),
+    "breitbart": ("Conservative / right-leaning publication", "right"),
+    "townhall": ("Conservative / right-leaning publication", "right"),
+    "commentary magazine": ("Conservative / right-leaning publication", "right"),
+    "the dispatch": ("Center-right publication", "right"),
+    "wall street journal opinion": ("Conservative / right-leaning opinion page", "right"),
+    "wsj opinion": ("Conservative / right-leaning opinion page", "right"),
+    # Progressive, left-leaning, or labor-aligned policy and media sources.
+    "center for american progress": ("Progressive / left-leaning policy institute", "left"),
+    "cap action": ("Progressive / left-leaning policy institute", "left"),
+    "american progress": ("Progressive / left-leaning policy institute", "left"),
+    "economic policy institute": ("Labor-aligned / left-leaning policy institute", "left"),
+    "roosevelt institute": ("Progressive / left-leaning policy institute", "left"),
+    "brennan center": ("Progressive / left-leaning legal policy institute", "left"),
+    "aclu": ("Civil-liberties advocacy group often aligned with progressive policy fights", "left"),
+    "mother jones": ("Progressive / left-leaning publication", "left"),
+    "jacobin": ("Socialist / left-leaning publication", "left"),
+    "the nation": ("Progressive / left-leaning publication", "left"),
+    "democracy now": ("Progressive / left-leaning news program", "left"),
+    "vox": ("Left-leaning explanatory publication", "left"),
+    "msnbc": ("Left-leaning cable/news outlet", "left"),
+    "huffpost": ("Left-leaning publication", "left"),
+    "slate": ("Left-leaning publication", "left"),
+    "the intercept": ("Left-leaning investigative publication", "left"),
+    # Reference and general-news contexts: shown to users, never used as a left/right cue.
+    "associated press": ("Wire service / reference news source", "reference"),
+    "ap news": ("Wire service / reference news source", "reference"),
+    "reuters": ("Wire service / reference news source", "reference"),
+    "bbc": ("Public broadcaster / general news source", "reference"),
+    "pbs": ("Public broadcaster / general news source", "reference"),
+    "npr": ("Public radio / general news source", "reference"),
+    "axios": ("General news / political newsletter source", "reference"),
+    "politico": ("General politics news source", "reference"),
+}
+
+SOURCE_CATALOG_ENV = "NEWS_BIAS_SOURCE_CATALOG"
+
+_DOMAIN = re.compile(r"[a-z0-9-]+(?:\.[a-z0-9-]+)+")
+_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+
+
+class SourceCatalog:
+    """Precompiled index over source-context entries.
+
+    Bare domains (``reason.com``) go in a hash table probed with every
+    suffix of each domain-like token in the article's source, title, and
+    URL. Other names share one Aho-Corasick automaton; name hits must sit
+    on word boundaries, dotted non-domain names match anywhere. Lookup
+    cost grows with the article's text, not the catalog, and the earliest
+    catalog entry that matches wins.
+    """
+
+    def __init__(self, entries: Mapping[str, tuple[str, str]]) -> None:
+        self.entries = {name.lower(): (str(label), str(posture)) for name, (label, posture) in entries.items()}
+        self._order = list(self.entries)
+        self._rank = {name: rank for rank, name in enumerate(self._order)}
+        self._domains = {name for name in self.entries if _DOMAIN.fullmatch(name)}
+        self._bounded = frozenset(name for name in self.entries if "." not in name)
+        names = [name for name in self.entries if name not in self._domains]
+        self._names = Lexicon({"names": names})
+        self.path: Path | None = None
+
+    @classmethod
+    def from_file(cls, path: str | Path, *, base: Mapping[str, tuple[str, str]] | None = None) -> SourceCatalog:
+        """Load ``{"name": ["label", "posture"], ...}`` JSON, after ``base`` entries when given."""
+
+        loaded = json.loads(Path(path).read_text(encoding="utf-8"))
+        catalog = cls({**(base or {}), **{name: tuple(value) for name, value in loaded.items()}})
+        catalog.path = Path(path)
+        return catalog
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _match(self, haystack: str) -> tuple[str, str] | None:
+        best: int | None = None
+        for hit in self._names.scan(haystack):
+            if hit.term in self._bounded and (
+                (hit.start and haystack[hit.start - 1] in _WORD_CHARS)
+                or (hit.end < len(haystack) and haystack[hit.end] in _WORD_CHARS)
+            ):
+                continue
+            rank = self._rank[hit.term]
+            best = rank if best is None else min(best, rank)
+        if self._domains:
+            for token in _DOMAIN.findall(haystack):
+                labels = token.split(".")
+                for index in range(len(labels) - 1):
+                    suffix = ".".join(labels[index:])
+                    if suffix in self._domains:
+                        rank = self._rank[suffix]
+                        best = rank if best is None else min(best, rank)
+        return None if best is None else self.entries[self._order[best]]
+
+    def context_for(self, source: str, title: str, url: str) -> tuple[str, str] | None:
+        return self._match(f"{source} {title} {url}".lower())
+
+    def lookup(self, article: Article) -> tuple[str, str] | None:
+        return self.context_for(article.source, article.title, article.url)
+
+
+SOURCE_CATALOG = SourceCatalog(SOURCE_CONTEXT)
+
+# (NEWS_BIAS_SOURCE_CATALOG value, catalog it resolved to).
+_default_catalog: tuple[str, SourceCatalog] | None = None
+_default_lock = threading.Lock()
+
+
+def default_source_catalog() -> SourceCatalog:
+    """The seed catalog, extended by the JSON file at ``NEWS_BIAS_SOURCE_CATALOG`` when set.
+
+    The file is resolved once per path, so per-article lookups cost an
+    environment read rather than a filesystem stat; set the variable to a
+    new path to load a new catalog.
+    """
+
+    global _default_catalog
+    path = os.environ.get(SOURCE_CATALOG_ENV)
+    if not path:
+        return SOURCE_CATALOG
+    resolved = _default_catalog
+    if resolved is not None and resolved[0] == path:
+        return resolved[1]
+    with _default_lock:
+        if _default_catalog is None or _default_catalog[0] != path:
+            catalog = SourceCatalog.from_file(path, base=SOURCE_CONTEXT) if Path(path).is_file() else SOURCE_CATALOG
+            _default_catalog = (path, catalog)
+        return _default_catalog[1]
+
+
+def source_context(article: Article, catalog: SourceCatalog | None = None) -> tuple[str, str] | None:
+    return (catalog if catalog is not None else default_source_catalog()).lookup(article)
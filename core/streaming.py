@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from typing import Any
+
+
+def iter_sse_data(response: Any) -> Iterator[str]:
+    """Yield the ``data:`` payloads of a server-sent-events response.
+
+    Multi-line data fields are joined per the SSE spec; ``[DONE]`` ends
+    the stream (OpenAI-style terminator).
+    """
+
+    data: list[str] = []
+    for raw in response.iter_lines(decode_unicode=True):
+        line = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+        if not line:
+            if data:
+                payload = "\n".join(data)
+                data.clear()
+                if payload == "[DONE]":
+                    return
+                yield payload
+            continue
+        if line.startswith("data:"):
+            data.append(line[5:].lstrip(" "))
+    if data and "\n".join(data) != "[DONE]":
+        yield "\n".join(data)
+
+
+def iter_sse_json(response: Any) -> Iterator[dict[str, Any]]:
+    for payload in iter_sse_data(response):
+        try:
+            event = json.loads(payload)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(event, dict):
+            yield event
+
+
+def iter_ndjson(response: Any) -> Iterator[dict[str, Any]]:
+    for raw in response.iter_lines(decode_unicode=True):
+        line = raw.decode("utf-8") if isinstance(raw, bytes) else raw
+        if not line.strip():
+            continue
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(event, dict):
+            yield event
+
+
+class IncrementalJSONParser:
+    """Surface top-level fields of a JSON object while it is still streaming.
+
+    Feed text chunks as they arrive; ``feed`` returns the top-level fields
+    whose values completed in that chunk (``headline`` or ``label`` long
+    before the closing brace). Any prose or code fence before the first
+    ``{`` is skipped, matching ``extract_json_object``.
+    """
+
+    def __init__(self) -> None:
+        self.text = ""
+        self.fields: dict[str, Any] = {}
+        self.done = False
+        self._pos = 0
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start = 0
+        self._expect = "key"
+        self._key: str | None = None
+        self._value_start: int | None = None
+
+    def _emit(self, raw: str, found: dict[str, Any]) -> None:
+        if self._key is None:
+            return
+        try:
+            value = json.loads(raw)
+        except json.JSONDecodeError:
+            return
+        self.fields[self._key] = value
+        found[self._key] = value
+
+    def feed(self, chunk: str) -> dict[str, Any]:
+        found: dict[str, Any] = {}
+        self.text += chunk
+        text = self.text
+        while self._pos < len(text) and not self.done:
+            index = self._pos
+            char = text[index]
+            self._pos += 1
+            if not self._started:
+                if char == "{":
+                    self._started, self._depth, self._expect = True, 1, "key"
+                continue
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._depth == 1 and self._expect == "key":
+                        self._key = json.loads(text[self._string_start : index + 1])
+                        self._expect = "colon"
+                    elif self._depth == 1 and self._expect == "value":
+                        self._emit(text[self._string_start : index + 1], found)
+                        self._expect = "comma"
+                continue
+            if char == '"':
+                self._in_string = True
+                if self._depth == 1:
+                    self._string_start = index
+            elif char in "{[":
+                if self._depth == 1 and self._expect == "value":
+                    self._value_start = index
+                self._depth += 1
+            elif char in "}]":
+                if self._depth == 1 and self._expect == "value" and self._value_start is not None:
+                    self._emit(text[self._value_start : index].strip(), found)
+                self._depth -= 1
+                if self._depth == 1 and self._expect == "value" and self._value_start is not None:
+                    self._emit(text[self._value_start : index + 1], found)
+                    self._expect, self._value_start = "comma", None
+                if self._depth == 0:
+                    self.done = True
+            elif self._depth == 1:
+                if char == ":":
+                    self._expect, self._value_start = "value", None
+                elif char == ",":
+                    if self._expect == "value" and self._value_start is not None:
+                        self._emit(text[self._value_start : index].strip(), found)
+                    self._expect, self._value_start = "key", None
+                elif not char.isspace() and self._expect == "value" and self._value_start is None:
+                    # Start of a bare literal: number, true, false, null.
+                    self._value_start = index
+        return found
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import json
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel
+
+from core.schemas import (
+    ArticleDigest,
+    ReconciledReport,
+    StructuredBiasJudgment,
+    StructuredCritique,
+    StructuredSummary,
+)
+
+
+# Keys kept when a schema is sent to a provider. Length and range
+# constraints are dropped: OpenAI strict mode and Gemini reject several of
+# them, and the stage parsers clamp values anyway.
+SCHEMA_KEYS = {"type", "properties", "items", "enum", "required", "additionalProperties", "description"}
+
+
+@dataclass(frozen=True)
+class OutputSchema:
+    """JSON schema for one stage's model output, sent as the provider's native constraint."""
+
+    name: str
+    schema: dict[str, Any]
+
+
+def _inline(node: Any, defs: dict[str, Any]) -> Any:
+    if isinstance(node, list):
+        return [_inline(item, defs) for item in node]
+    if not isinstance(node, dict):
+        return node
+    if "$ref" in node:
+        return _inline(defs[node["$ref"].rsplit("/", 1)[1]], defs)
+    if "const" in node:
+        node = {**node, "enum": [node["const"]]}
+    out = {key: _inline(value, defs) for key, value in node.items() if key in SCHEMA_KEYS}
+    if "properties" in node:
+        # readOnly fields are filled in after parsing, never by the model.
+        out["properties"] = {
+            name: _inline(value, defs) for name, value in node["properties"].items() if not value.get("readOnly")
+        }
+    if out.get("type") == "object":
+        # Strict mode: every property required, nothing extra.
+        out["required"] = list(out.get("properties", {}))
+        out["additionalProperties"] = False
+    return out
+
+
+def output_schema(
+    model: type[BaseModel],
+    name: str,
+    *,
+    omit: tuple[str, ...] = (),
+    rename: dict[str, str] | None = None,
+) -> OutputSchema:
+    """Flatten a pydantic model into a self-contained strict JSON schema.
+
+    ``omit`` drops fields the stage fills in itself; ``rename`` maps model
+    fields to the keys the stage prompt asks for.
+    """
+
+    raw = model.model_json_schema()
+    defs = raw.get("$defs", {})
+    properties = {
+        (rename or {}).get(field, field): value for field, value in raw["properties"].items() if field not in omit
+    }
+    return OutputSchema(name=name, schema=_inline({"type": "object", "properties": properties}, defs))
+
+
+def openapi_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """Gemini's responseSchema dialect: OpenAPI subset, upper-case types, no additionalProperties."""
+
+    out: dict[str, Any] = {}
+    for key, value in schema.items():
+        if key == "additionalProperties":
+            continue
+        if key == "type":
+            out[key] = str(value).upper()
+        elif key == "properties":
+            out[key] = {name: openapi_schema(child) for name, child in value.items()}
+        elif key == "items":
+            out[key] = openapi_schema(value)
+        else:
+            out[key] = value
+    return out
+
+
+STAGE_SCHEMAS = {
+    "digest": output_schema(ArticleDigest, "article_digest", omit=("article_id",)),
+    "summarize": output_schema(StructuredSummary, "structured_summary", rename={"framing_notes": "framing_spans"}),
+    "bias_detect": output_schema(StructuredBiasJudgment, "bias_judgment"),
+    "critique": output_schema(StructuredCritique, "critique"),
+    "reconcile": output_schema(ReconciledReport, "reconciled_report", omit=("article_count",)),
+}
+
+
+_FENCE = re.compile(r"^\s*```(?:json)?\s*|\s*```\s*$", re.IGNORECASE)
+_TRAILING_COMMA = re.compile(r",(\s*[}\]])")
+
+
+def _without_trailing_commas(text: str) -> str:
+    """Drop commas directly before a closing bracket, outside strings."""
+
+    pieces: list[str] = []
+    start = 0
+    in_string = escape = False
+    for index, char in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+                pieces.append(text[start : index + 1])
+                start = index + 1
+            continue
+        if char == '"':
+            pieces.append(_TRAILING_COMMA.sub(r"\1", text[start:index]))
+            start = index
+            in_string = True
+    tail = text[start:]
+    pieces.append(tail if in_string else _TRAILING_COMMA.sub(r"\1", tail))
+    return "".join(pieces)
+
+
+def repair_json_object(text: str) -> dict[str, Any] | None:
+    """Recover the first JSON object from sloppy or truncated model output.
+
+    Handles code fences, prose around the object, trailing commas, and
+    output cut off mid-object (e.g. at the token limit): open strings and
+    brackets are closed, and an incomplete trailing member is dropped.
+    """
+
+    text = _FENCE.sub("", text)
+    start = text.find("{")
+    if start == -1:
+        return None
+    stack: list[str] = []
+    # Comma positions with the bracket stack at that point; cutting there
+    # leaves only complete members.
+    cuts: list[tuple[int, list[str]]] = []
+    in_string = escape = False
+    end = len(text)
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escape:
+                escape = False
+            elif char == "\\":
+                escape = True
+            elif char == '"':
+                in_string = False
+            continue
+        if char == '"':
+            in_string = True
+        elif char in "{[":
+            stack.append("}" if char == "{" else "]")
+        elif char in "}]":
+            if not stack:
+                break
+            stack.pop()
+            if not stack:
+                end = index + 1
+                break
+        elif char == ",":
+            cuts.append((index, list(stack)))
+    body = text[start:end]
+    candidates = [body]
+    if stack:
+        tail = body + ('"' if in_string else "")
+        candidates.append(tail + "".join(reversed(stack)))
+        candidates.append(re.sub(r",?\s*\"[^\"]*\"\s*:?\s*$", "", tail) + "".join(reversed(stack)))
+        candidates.extend(text[start:cut] + "".join(reversed(closers)) for cut, closers in reversed(cuts))
+    for candidate in candidates:
+        try:
+            parsed = json.loads(_without_trailing_commas(candidate))
+        except json.JSONDecodeError:
+            continue
+        if isinstance(parsed, dict):
+            return parsed
+    return None
+
+
+def parse_model_json(text: str) -> tuple[dict[str, Any] | None, str]:
+    """Parse stage output; the outcome is ``"json"``, ``"repaired"``, ``"failed"``, or ``"empty"``."""
+
+    if not text.strip():
+        return None, "empty"
+    try:
+        parsed = json.loads(text)
+    except json.JSONDecodeError:
+        parsed = None
+    if isinstance(parsed, dict):
+        return parsed, "json"
+    repaired = repair_json_object(text)
+    return repaired, "repaired" if repaired is not None else "failed"
+
+
+class ParseStats:
+    """Process-wide count of stage-output parse outcomes per provider."""
+
+    def __init__(self) -> None:
+        self._counts: dict[str, Counter[str]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, provider: str, outcome: str) -> None:
+        if outcome == "empty":
+            return
+        with self._lock:
+            self._counts.setdefault(provider, Counter())[outcome] += 1
+
+    def failure_rate(self, provider: str) -> float:
+        with self._lock:
+            counts = self._counts.get(provider, Counter())
+            total = sum(counts.values())
+            return counts["failed"] / total if total else 0.0
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        with self._lock:
+            return {provider: dict(counts) for provider, counts in self._counts.items()}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+
+PARSE_STATS = ParseStats()
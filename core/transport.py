@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import importlib.util
+import threading
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+USER_AGENT = "news-bias-multi-agent-demo/2026"
+CONNECT_TIMEOUT_SECONDS = 5.0
+READ_TIMEOUT_SECONDS = 30.0
+POOL_HOSTS = 16
+POOL_PER_HOST = 8
+
+
+def accept_encoding() -> str:
+    """Advertise brotli only when urllib3 can actually decode it."""
+
+    encodings = ["gzip", "deflate"]
+    if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi"):
+        encodings.append("br")
+    return ", ".join(encodings)
+
+
+class HttpTransport:
+    """Keep-alive HTTP transport shared by search, extraction, and providers.
+
+    One ``requests.Session`` holds a connection pool per host, so repeated
+    calls to the same model API or news site reuse TCP and TLS sessions.
+    ``per_host`` caps open connections to any one host; callers beyond the
+    cap wait for a free connection instead of opening new ones.
+    """
+
+    def __init__(
+        self,
+        *,
+        pool_hosts: int = POOL_HOSTS,
+        per_host: int = POOL_PER_HOST,
+        connect_timeout: float = CONNECT_TIMEOUT_SECONDS,
+        read_timeout: float = READ_TIMEOUT_SECONDS,
+        user_agent: str = USER_AGENT,
+    ) -> None:
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_hosts, pool_maxsize=per_host, pool_block=True)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"User-Agent": user_agent, "Accept-Encoding": accept_encoding()})
+
+    def _timeout(self, timeout: float | None) -> tuple[float, float]:
+        return (self.connect_timeout, timeout if timeout is not None else self.read_timeout)
+
+    def get(self, url: str, *, timeout: float | None = None, **kwargs: Any) -> requests.Response:
+        return self.session.get(url, timeout=self._timeout(timeout), **kwargs)
+
+    def post(self, url: str, *, timeout: float | None = None, **kwargs: Any) -> requests.Response:
+        return self.session.post(url, timeout=self._timeout(timeout), **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+_default_transport: HttpTransport | None = None
+_default_lock = threading.Lock()
+
+
+def get_transport() -> HttpTransport:
+    global _default_transport
+    with _default_lock:
+        if _default_transport is None:
+            _default_transport = HttpTransport()
+        return _default_transport
+
+
+def set_transport(transport: HttpTransport | None) -> None:
+    """Replace the process-wide transport, e.g. with tuned pool limits."""
+
+    global _default_transport
+    with _default_lock:
+        _default_transport = transport
@@ -20,7 +20,7 @@ How it differs from siblings:
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
 from core.pipeline import run_pipeline
 from core.schemas import Article, LLMKeys, PipelineTrace
@@ -34,6 +34,7 @@ def run(
     keys: LLMKeys | None = None,
     max_articles: int = 5,
     fixture_articles: list[Article] | None = None,
+    on_partial: Callable[[str, dict[str, Any]], None] | None = None,
 ) -> PipelineTrace:
     def _invoke(payload: dict[str, Any]) -> PipelineTrace:
         return run_pipeline(
@@ -44,6 +45,7 @@ def run(
             keys=payload.get("keys"),
             max_articles=payload["max_articles"],
             fixture_articles=payload.get("fixture_articles"),
+            on_partial=on_partial,
             framework_notes=[
                 "LangChain Runnable wraps the shared pipeline contract.",
                 "Bounded chain used instead of an unconstrained ReAct loop.",
@@ -21,16 +21,21 @@ How it differs from siblings:
 
 from __future__ import annotations
 
-from typing import Any, TypedDict
+from typing import Any, Callable, TypedDict
 
 from core.citation import verify_citations
 from core.llm_provider import get_llm
 from core.pipeline import (
     critique,
     detect_bias,
+    digest_articles,
+    fallback_notes,
+    stage_status,
     fetch_articles,
     preprocess_subject,
     reconcile,
+    stage_metrics,
+    stage_partial,
     summarize,
 )
 from core.schemas import Article, LLMKeys, PipelineTrace, StageRecord
@@ -43,9 +48,11 @@ class GraphState(TypedDict, total=False):
     keys: LLMKeys
     max_articles: int
     fixture_articles: list[Article] | None
+    on_partial: Callable[[str, dict[str, Any]], None] | None
     stages: list[StageRecord]
     query: Any
     articles: list[Article]
+    digests: Any
     summary: Any
     bias_judgment: Any
     critique: Any
@@ -53,9 +60,25 @@ class GraphState(TypedDict, total=False):
     fetch_notes: list[str]
 
 
-def _record(state: GraphState, name: str, output: dict[str, Any], notes: list[str] | None = None) -> GraphState:
+def _record(
+    state: GraphState,
+    name: str,
+    output: dict[str, Any],
+    notes: list[str] | None = None,
+    metrics: dict[str, Any] | None = None,
+) -> GraphState:
     stages = list(state.get("stages", []))
-    stages.append(StageRecord(name=name, implementation="langgraph", output=output, notes=notes or []))
+    metrics = metrics or {}
+    stages.append(
+        StageRecord(
+            name=name,
+            implementation="langgraph",
+            status=stage_status(metrics),
+            output=output,
+            notes=[*(notes or []), *fallback_notes(metrics)],
+            metrics=metrics,
+        )
+    )
     return {**state, "stages": stages}
 
 
@@ -81,26 +104,65 @@ def _search_fetch(state: GraphState) -> GraphState:
 
 def _summarize(state: GraphState) -> GraphState:
     llm = get_llm(state["provider"], state.get("model"), state["keys"])
-    summary = summarize(state["articles"], llm)
-    return _record({**state, "summary": summary}, "summarize", summary.model_dump())
+    notes: list[str] = []
+    query = state["query"].query
+    digests = digest_articles(state["articles"], llm, query=query, notes=notes)
+    summary = summarize(
+        state["articles"],
+        llm,
+        digests=digests,
+        query=query,
+        on_partial=stage_partial(state.get("on_partial"), "summarize"),
+    )
+    return _record(
+        {**state, "digests": digests, "summary": summary},
+        "summarize",
+        summary.model_dump(),
+        notes,
+        stage_metrics(llm),
+    )
 
 
 def _bias_detect(state: GraphState) -> GraphState:
     llm = get_llm(state["provider"], state.get("model"), state["keys"])
-    judgment = detect_bias(state["summary"], state["articles"], llm)
-    return _record({**state, "bias_judgment": judgment}, "bias_detect", judgment.model_dump())
+    judgment = detect_bias(
+        state["summary"],
+        state["articles"],
+        llm,
+        digests=state.get("digests"),
+        query=state["query"].query,
+        on_partial=stage_partial(state.get("on_partial"), "bias_detect"),
+    )
+    return _record(
+        {**state, "bias_judgment": judgment}, "bias_detect", judgment.model_dump(), metrics=stage_metrics(llm)
+    )
 
 
 def _critique(state: GraphState) -> GraphState:
     llm = get_llm(state["provider"], state.get("model"), state["keys"])
-    result = critique(state["summary"], state["bias_judgment"], state["articles"], llm)
-    return _record({**state, "critique": result}, "critique", result.model_dump())
+    result = critique(
+        state["summary"],
+        state["bias_judgment"],
+        state["articles"],
+        llm,
+        digests=state.get("digests"),
+        query=state["query"].query,
+        on_partial=stage_partial(state.get("on_partial"), "critique"),
+    )
+    return _record({**state, "critique": result}, "critique", result.model_dump(), metrics=stage_metrics(llm))
 
 
 def _reconcile(state: GraphState) -> GraphState:
     llm = get_llm(state["provider"], state.get("model"), state["keys"])
-    report = reconcile(state["summary"], state["bias_judgment"], state["critique"], state["articles"], llm)
-    return _record({**state, "report": report}, "reconcile", report.model_dump())
+    report = reconcile(
+        state["summary"],
+        state["bias_judgment"],
+        state["critique"],
+        state["articles"],
+        llm,
+        on_partial=stage_partial(state.get("on_partial"), "reconcile"),
+    )
+    return _record({**state, "report": report}, "reconcile", report.model_dump(), metrics=stage_metrics(llm))
 
 
 def _run_graph(initial: GraphState) -> GraphState:
@@ -141,6 +203,7 @@ def run(
     keys: LLMKeys | None = None,
     max_articles: int = 5,
     fixture_articles: list[Article] | None = None,
+    on_partial: Callable[[str, dict[str, Any]], None] | None = None,
 ) -> PipelineTrace:
     keys = keys or LLMKeys()
     out = _run_graph(
@@ -151,6 +214,7 @@ def run(
             "keys": keys,
             "max_articles": max_articles,
             "fixture_articles": fixture_articles,
+            "on_partial": on_partial,
             "stages": [],
         }
     )
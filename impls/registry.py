@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import Callable
+import asyncio
+from typing import Any, Callable
 
+from core.async_pipeline import ASYNC_CONCURRENCY, arun_pipeline, semaphore_for
 from core.schemas import Article, LLMKeys, PipelineTrace
 
 
@@ -26,3 +28,35 @@ def get_runner(name: str) -> PipelineRunner:
 
 
 IMPLEMENTATIONS = ["static", "langchain", "langgraph"]
+
+
+async def arun(name: str, subject: str, *, concurrency: int | asyncio.Semaphore = ASYNC_CONCURRENCY, **kwargs: Any) -> PipelineTrace:
+    """Run one implementation on the event loop.
+
+    The static implementation uses the asyncio-native pipeline; framework
+    runners keep their own orchestration and run in a worker thread under
+    the same concurrency limit.
+    """
+
+    semaphore = semaphore_for(concurrency)
+    if name.lower().strip() == "static":
+        from impls.static.pipeline import FRAMEWORK_NOTES
+
+        return await arun_pipeline(
+            subject, implementation="static", framework_notes=FRAMEWORK_NOTES, concurrency=semaphore, **kwargs
+        )
+    runner = get_runner(name)
+    async with semaphore:
+        return await asyncio.to_thread(runner, subject, **kwargs)
+
+
+async def arun_many(
+    jobs: list[tuple[str, str]],
+    *,
+    concurrency: int | asyncio.Semaphore = ASYNC_CONCURRENCY,
+    **kwargs: Any,
+) -> list[PipelineTrace]:
+    """Run ``(implementation, subject)`` jobs concurrently; results keep job order."""
+
+    semaphore = semaphore_for(concurrency)
+    return list(await asyncio.gather(*(arun(name, subject, concurrency=semaphore, **kwargs) for name, subject in jobs)))
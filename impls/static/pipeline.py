@@ -18,10 +18,18 @@ How it differs from siblings:
 
 from __future__ import annotations
 
+from typing import Any, Callable
+
 from core.pipeline import run_pipeline
 from core.schemas import Article, LLMKeys, PipelineTrace
 
 
+FRAMEWORK_NOTES = [
+    "Sequential Python calls; no orchestration framework.",
+    "Best baseline for inspecting typed stage outputs.",
+]
+
+
 def run(
     subject: str,
     *,
@@ -30,6 +38,7 @@ def run(
     keys: LLMKeys | None = None,
     max_articles: int = 5,
     fixture_articles: list[Article] | None = None,
+    on_partial: Callable[[str, dict[str, Any]], None] | None = None,
 ) -> PipelineTrace:
     return run_pipeline(
         subject,
@@ -39,8 +48,6 @@ def run(
         keys=keys,
         max_articles=max_articles,
         fixture_articles=fixture_articles,
-        framework_notes=[
-            "Sequential Python calls; no orchestration framework.",
-            "Best baseline for inspecting typed stage outputs.",
-        ],
+        on_partial=on_partial,
+        framework_notes=FRAMEWORK_NOTES,
     )
@@ -4,7 +4,10 @@ import argparse
 import json
 import os
 import sys
+import threading
+from typing import Any
 
+from core.llm_provider import prewarm_ollama
 from core.schemas import LLMKeys
 from impls.registry import IMPLEMENTATIONS, get_runner
 
@@ -14,6 +17,11 @@ def _write_utf8(text: str) -> None:
     sys.stdout.buffer.write(b"\n")
 
 
+def _print_partial(stage: str, fields: dict[str, Any]) -> None:
+    for key, value in fields.items():
+        print(f"[{stage}] {key}: {json.dumps(value, ensure_ascii=False)}", file=sys.stderr, flush=True)
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Run the news-bias pipeline.")
     parser.add_argument("subject", nargs="?", default="AI regulation last week")
@@ -22,6 +30,7 @@ def main() -> int:
     parser.add_argument("--model", default=None)
     parser.add_argument("--max-articles", type=int, default=5)
     parser.add_argument("--json", action="store_true", help="print full PipelineTrace JSON")
+    parser.add_argument("--stream", action="store_true", help="stream model responses and print fields to stderr as they arrive")
     args = parser.parse_args()
 
     keys = LLMKeys(
@@ -31,12 +40,16 @@ def main() -> int:
         gnews_token=os.environ.get("GNEWS_API_KEY"),
         ollama_host=os.environ.get("OLLAMA_HOST", "http://localhost:11434"),
     )
+    if args.provider == "ollama":
+        # Load the model while the fetch stage runs.
+        threading.Thread(target=prewarm_ollama, args=(keys.ollama_host, args.model), daemon=True).start()
     trace = get_runner(args.impl)(
         args.subject,
         provider=args.provider,
         model=args.model,
         keys=keys,
         max_articles=args.max_articles,
+        on_partial=_print_partial if args.stream else None,
     )
     if args.json:
         _write_utf8(trace.model_dump_json(indent=2))
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.batch_api import BATCH_POLL_SECONDS, run_batch
+from core.schemas import LLMKeys
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Analyze many subjects through the provider's batch API.")
+    parser.add_argument("subjects", nargs="*", help="subjects to analyze")
+    parser.add_argument("--subjects-file", help="file with one subject per line")
+    parser.add_argument("--provider", default=os.environ.get("LLM_PROVIDER", "anthropic"))
+    parser.add_argument("--model")
+    parser.add_argument("--max-articles", type=int, default=5)
+    parser.add_argument("--poll", type=float, default=BATCH_POLL_SECONDS, help="seconds between batch status polls")
+    parser.add_argument("--out", required=True, help="JSONL file to write one trace per line")
+    args = parser.parse_args(argv)
+
+    subjects = list(args.subjects)
+    if args.subjects_file:
+        subjects += [line.strip() for line in Path(args.subjects_file).read_text(encoding="utf-8").splitlines() if line.strip()]
+    if not subjects:
+        parser.error("give subjects as arguments or with --subjects-file")
+
+    traces = run_batch(
+        subjects,
+        provider=args.provider,
+        model=args.model,
+        keys=LLMKeys(
+            anthropic_token=os.environ.get("ANTHROPIC_API_KEY"),
+            openai_token=os.environ.get("OPENAI_API_KEY"),
+            google_token=os.environ.get("GOOGLE_API_KEY"),
+            gnews_token=os.environ.get("GNEWS_API_KEY"),
+            ollama_host=os.environ.get("OLLAMA_HOST", "http://localhost:11434"),
+        ),
+        max_articles=args.max_articles,
+        poll_seconds=args.poll,
+    )
+    with Path(args.out).open("w", encoding="utf-8") as handle:
+        for trace in traces:
+            handle.write(trace.model_dump_json() + "\n")
+    print(f"batch_sweep: wrote {len(traces)} trace(s) to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
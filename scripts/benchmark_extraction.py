@@ -0,0 +1,115 @@
+"""Compare HTML extraction backends on a saved corpus of news pages.
+
+Corpus layout: ``<name>.html`` pages, each optionally paired with a
+hand-checked ``<name>.txt`` holding the article body. Pages with a gold
+file are scored by token precision / recall / F1; every page counts
+toward throughput.
+
+    python scripts/benchmark_extraction.py --save URL [URL ...] --corpus bench/extraction_corpus
+    python scripts/benchmark_extraction.py --corpus bench/extraction_corpus --repeat 5
+
+Saved pages are third-party content. Keep the corpus local; do not commit it.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import re
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.extraction_backends import available_backends
+from core.text_extraction import html_to_text
+from core.transport import get_transport
+
+
+DEFAULT_CORPUS = ROOT / "bench" / "extraction_corpus"
+
+
+def _tokens(text: str) -> Counter[str]:
+    return Counter(re.findall(r"[a-z0-9]+", text.lower()))
+
+
+def token_scores(extracted: str, gold: str) -> tuple[float, float, float]:
+    predicted, expected = _tokens(extracted), _tokens(gold)
+    overlap = sum((predicted & expected).values())
+    precision = overlap / max(1, sum(predicted.values()))
+    recall = overlap / max(1, sum(expected.values()))
+    f1 = 0.0 if overlap == 0 else 2 * precision * recall / (precision + recall)
+    return precision, recall, f1
+
+
+def save_pages(urls: list[str], corpus: Path) -> None:
+    corpus.mkdir(parents=True, exist_ok=True)
+    transport = get_transport()
+    for url in urls:
+        response = transport.get(url, timeout=30)
+        response.raise_for_status()
+        name = hashlib.sha1(url.encode("utf-8")).hexdigest()[:12]
+        (corpus / f"{name}.html").write_text(response.text, encoding="utf-8")
+        (corpus / f"{name}.url").write_text(url + "\n", encoding="utf-8")
+        print(f"saved {url} -> {name}.html")
+
+
+def benchmark(corpus: Path, backends: list[str], repeat: int) -> list[dict[str, object]]:
+    pages = sorted(corpus.glob("*.html"))
+    if not pages:
+        raise SystemExit(f"no .html pages in {corpus}")
+    documents = [(page.read_text(encoding="utf-8", errors="replace"), page.with_suffix(".txt")) for page in pages]
+    total_bytes = sum(len(html.encode("utf-8")) for html, _gold in documents)
+    rows: list[dict[str, object]] = []
+    for backend in backends:
+        started = time.perf_counter()
+        for _ in range(repeat):
+            outputs = [html_to_text(html, backend=backend) for html, _gold in documents]
+        elapsed = time.perf_counter() - started
+        scored = [
+            token_scores(text, gold.read_text(encoding="utf-8"))
+            for text, (_html, gold) in zip(outputs, documents, strict=True)
+            if gold.is_file()
+        ]
+        rows.append(
+            {
+                "backend": backend,
+                "pages/s": round(len(documents) * repeat / elapsed, 1),
+                "MB/s": round(total_bytes * repeat / elapsed / 1_000_000, 2),
+                "avg chars": round(sum(len(text) for text in outputs) / len(outputs)),
+                "gold pages": len(scored),
+                "precision": round(sum(s[0] for s in scored) / len(scored), 3) if scored else None,
+                "recall": round(sum(s[1] for s in scored) / len(scored), 3) if scored else None,
+                "f1": round(sum(s[2] for s in scored) / len(scored), 3) if scored else None,
+            }
+        )
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark HTML extraction backends.")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS)
+    parser.add_argument("--backend", action="append", dest="backends", help="backend name (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", nargs="+", metavar="URL", help="download pages into the corpus, then exit")
+    args = parser.parse_args(argv)
+
+    if args.save:
+        save_pages(args.save, args.corpus)
+        return 0
+
+    rows = benchmark(args.corpus, args.backends or available_backends(), max(1, args.repeat))
+    columns = list(rows[0])
+    print(" | ".join(columns))
+    print(" | ".join("---" for _ in columns))
+    for row in rows:
+        print(" | ".join("-" if row[column] is None else str(row[column]) for column in columns))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
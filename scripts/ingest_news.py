@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from core.news_index import INGEST_INTERVAL_SECONDS, NewsIndex, NewsIngester
+from core.news_search import FALLBACK_FEEDS
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Continuously ingest news feeds into the local search index.")
+    parser.add_argument("--index", required=True, help="SQLite index path; point NEWS_BIAS_INDEX_PATH at it")
+    parser.add_argument("--feed", action="append", dest="feeds", help="feed URL (repeatable); defaults to FALLBACK_FEEDS")
+    parser.add_argument("--interval", type=float, default=INGEST_INTERVAL_SECONDS)
+    parser.add_argument("--once", action="store_true", help="ingest a single cycle and exit")
+    args = parser.parse_args(argv)
+
+    index = NewsIndex(args.index)
+    ingester = NewsIngester(index, feeds=args.feeds or FALLBACK_FEEDS, interval_seconds=args.interval)
+    if args.once:
+        added = ingester.ingest_once()
+        print(f"ingest_news: added {added} document(s); {index.count()} indexed")
+        return 0
+
+    print(f"ingest_news: ingesting {len(ingester.feeds)} feed(s) every {args.interval:.0f}s into {args.index}")
+    try:
+        ingester.run_forever()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core.news_search import FEED_CACHE, GNEWS_CACHE, reset_gnews_limiters
+from core.resilience import reset_resilience
+from core.structured_output import PARSE_STATS
+
+
+@pytest.fixture(autouse=True)
+def _no_default_llm_cache(monkeypatch):
+    # Tests that exercise the response cache pass one in explicitly.
+    monkeypatch.setenv("NEWS_BIAS_DISABLE_LLM_CACHE", "1")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_feed_cache():
+    FEED_CACHE.clear()
+    GNEWS_CACHE.clear()
+    reset_gnews_limiters()
+    reset_resilience()
+    PARSE_STATS.clear()
+    yield
+    FEED_CACHE.clear()
+    GNEWS_CACHE.clear()
+    reset_gnews_limiters()
+    reset_resilience()
+    PARSE_STATS.clear()
+
+
+@pytest.fixture
+def local_server() -> Iterator[Callable[[type[BaseHTTPRequestHandler]], str]]:
+    """Serve a handler class on a loopback port and return its base URL; servers stop at teardown."""
+
+    servers: list[ThreadingHTTPServer] = []
+
+    def serve(handler: type[BaseHTTPRequestHandler]) -> str:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    yield serve
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+from pathlib import Path
+
+import yaml
+
 from core.news_search import article_id_for
 from core.schemas import Article
 
 
+GOLDEN_FIXTURE_PATH = Path(__file__).parent / "eval" / "golden_fixtures.yaml"
+
+
 def article(title: str, text: str, url: str = "fixture://article") -> Article:
     return Article(id=article_id_for(url + title), title=title, url=url + "/" + title.replace(" ", "-"), source="fixture", text=text)
 
@@ -48,3 +55,25 @@ CHARGED_UNCLEAR_ARTICLE = article(
         "Most claims focused on product timing and customer support."
     ),
 )
+
+
+def golden_cases() -> list[dict]:
+    data = yaml.safe_load(GOLDEN_FIXTURE_PATH.read_text(encoding="utf-8"))
+    return list(data["fixtures"])
+
+
+def golden_articles(case: dict) -> list[Article]:
+    raw_articles = case.get("articles") or [case["article"]]
+    out = []
+    for raw in raw_articles:
+        url = f"fixture://{case['id']}/{raw['title'].replace(' ', '-')}"
+        out.append(
+            Article(
+                id=article_id_for(url),
+                title=raw["title"],
+                url=url,
+                source="golden-fixture",
+                text=raw["text"],
+            )
+        )
+    return out
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import re
+
+from core.analysis import analyze
+from core.demo_cases import DEMO_CASES
+from core.lexicon import LEXICON
+from core.pipeline import fetch_articles, preprocess_subject
+from core.schemas import Article, LLMKeys
+from core.source_catalog import source_context
+
+
+def test_analysis_matches_per_sentence_rescans() -> None:
+    articles = [article for case in DEMO_CASES for article in case.articles]
+    # Lowercasing "İ" adds a character, so offsets into the lowered text shift.
+    text = "İİ Border talks. Reckless plan? Union."
+    articles.append(Article(id="u", title="İstanbul vote", url="demo://u", source="Wire", text=text))
+    for article in articles:
+        analysis = analyze(article)
+        sentences = re.split(r"(?<=[.!?])\s+", article.text.strip())
+        assert list(analysis.sentences) == sentences
+        assert list(analysis.sentence_terms) == [LEXICON.find_terms(sentence.lower()) for sentence in sentences]
+        assert analysis.terms == LEXICON.find_terms(article.text.lower())
+        assert all(analysis.lowered[hit.start : hit.end] == hit.term for hit in analysis.hits)
+        assert analysis.source_context == source_context(article)
+
+
+def test_analysis_is_built_once_per_article() -> None:
+    case = DEMO_CASES[0]
+    articles, _ = fetch_articles(
+        preprocess_subject(case.subject), keys=LLMKeys(), max_articles=3, fixture_articles=list(case.articles)
+    )
+    copy = articles[0].model_copy()
+    assert analyze(copy) is analyze(articles[0])
+    assert analyze(articles[0]).frames
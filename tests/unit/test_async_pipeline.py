@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from core.async_pipeline import arun_pipeline
+from core.citation import verify_citations
+from core.llm_provider import LLMClient
+from core.resilience import ProviderUnavailable
+from core.schemas import LLMKeys
+from impls.registry import arun_many
+from tests.fixtures import LEFT_ARTICLE, RIGHT_ARTICLE, article
+
+
+class SlowClient:
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate(self, prompt: str) -> str:
+        with self._lock:
+            self.active += 1
+            self.calls += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        return ""
+
+    def client(self) -> LLMClient:
+        return LLMClient(provider="fake", model="fake", generate=self.generate)
+
+
+def test_arun_many_overlaps_runs_within_concurrency_limit(monkeypatch) -> None:
+    slow = SlowClient()
+    monkeypatch.setattr("core.async_pipeline.get_llm", lambda *_args, **_kwargs: slow.client())
+    jobs = [("static", "climate"), ("static", "border"), ("static", "budget")]
+    traces = asyncio.run(arun_many(jobs, concurrency=2, fixture_articles=[LEFT_ARTICLE, RIGHT_ARTICLE]))
+    assert [trace.subject for trace in traces] == ["climate", "border", "budget"]
+    assert slow.calls == 12
+    assert slow.peak == 2
+    assert all(not verify_citations(trace) for trace in traces)
+
+
+def test_async_map_step_awaits_digests_together(monkeypatch) -> None:
+    slow = SlowClient()
+    monkeypatch.setattr("core.async_pipeline.get_llm", lambda *_args, **_kwargs: slow.client())
+    articles = [article(f"Story {n}", f"Officials described plan number {n} at length on Monday.") for n in range(10)]
+    trace = asyncio.run(arun_pipeline("plans", implementation="static", fixture_articles=articles, max_articles=10, concurrency=4))
+    summarize_stage = next(stage for stage in trace.stages if stage.name == "summarize")
+    assert "map-reduce: 10 article digest(s) from 4 concurrent worker(s)" in summarize_stage.notes
+    assert summarize_stage.metrics["llm_calls"] == 11
+    assert slow.peak == 4
+
+
+def test_async_map_step_reports_usage_and_provider_errors_like_sync(monkeypatch) -> None:
+    def fake_post(url, headers, payload, timeout=90, transport=None, **_kwargs):
+        if "plan number 0 " in payload["input"] and payload["input"].startswith("You are a careful news reader"):
+            raise ProviderUnavailable("openai: HTTP 503 after 1 attempt(s)")
+        return {"output_text": "{}", "usage": {"input_tokens": 100, "input_tokens_details": {"cached_tokens": 40}}}
+
+    monkeypatch.setattr("core.llm_provider._post_json", fake_post)
+    articles = [article(f"Story {n}", f"Officials described plan number {n} at length on Monday.") for n in range(10)]
+    trace = asyncio.run(
+        arun_pipeline(
+            "plans",
+            implementation="static",
+            provider="openai",
+            keys=LLMKeys(openai_token="k"),
+            fixture_articles=articles,
+            max_articles=10,
+        )
+    )
+    summarize_stage = next(stage for stage in trace.stages if stage.name == "summarize")
+    assert summarize_stage.metrics["llm_calls"] == 11
+    assert summarize_stage.metrics["provider_errors"] == ["openai: HTTP 503 after 1 attempt(s)"]
+    assert summarize_stage.metrics["input_tokens"] == 1000
+    assert summarize_stage.metrics["cached_tokens"] == 400
+    assert summarize_stage.status == "warning"
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+import json
+from http.server import BaseHTTPRequestHandler
+
+from core.batch_api import AnthropicBatches, BatchRequest, DirectBackend, run_batch
+from core.llm_provider import LLMClient
+from core.schemas import LLMKeys
+from tests.fixtures import LEFT_ARTICLE, RIGHT_ARTICLE
+
+
+ANSWER = json.dumps(
+    {
+        "headline": "Batch headline",
+        "neutral_summary": "Batch summary.",
+        "key_points": ["point"],
+        "label": "Lean Left",
+        "confidence": 0.7,
+        "rationale": "Batch rationale.",
+        "refined_label": "Lean Left",
+        "agree_with_detector": True,
+        "reasoning": "Batch reasoning.",
+        "final_label": "Lean Left",
+        "executive_summary": "Batch executive summary.",
+        "caveats": ["Batch caveat."],
+    }
+)
+
+
+def _stage_of(prompt: str) -> str:
+    if "\n\nCRITIQUE:\n" in prompt:
+        return "reconcile"
+    if "DETECTOR_OUTPUT:" in prompt:
+        return "critique"
+    if "\n\nSUMMARY:\n" in prompt:
+        return "bias_detect"
+    return "summarize"
+
+
+def _batches_handler(rounds: list[list[str]], schemas: list[str] | None = None) -> type[BaseHTTPRequestHandler]:
+    """Local stand-in for the Message Batches API: each batch ends on its second poll."""
+
+    batches: dict[str, dict] = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def _json(self, payload, content_type: str = "application/json") -> None:
+            body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self) -> None:
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            batch_id = f"batch-{len(batches)}"
+            batches[batch_id] = {"requests": body["requests"], "polls": 0}
+            rounds.append([_stage_of(item["params"]["messages"][0]["content"]) for item in body["requests"]])
+            if schemas is not None:
+                schemas.extend(item["params"]["tool_choice"]["name"] for item in body["requests"])
+            self._json({"id": batch_id, "processing_status": "in_progress"})
+
+        def do_GET(self) -> None:
+            base = f"http://127.0.0.1:{self.server.server_address[1]}"
+            if self.path.startswith("/results/"):
+                lines = []
+                for item in batches[self.path.rsplit("/", 1)[1]]["requests"]:
+                    if _stage_of(item["params"]["messages"][0]["content"]) == "reconcile":
+                        result = {"type": "errored", "error": {"message": "overloaded"}}
+                    else:
+                        result = {"type": "succeeded", "message": {"content": [{"type": "text", "text": ANSWER}]}}
+                    lines.append(json.dumps({"custom_id": item["custom_id"], "result": result}))
+                self._json("\n".join(lines).encode("utf-8"), "application/jsonl")
+                return
+            batch_id = self.path.rsplit("/", 1)[1]
+            batches[batch_id]["polls"] += 1
+            ended = batches[batch_id]["polls"] >= 2
+            self._json(
+                {
+                    "id": batch_id,
+                    "processing_status": "ended" if ended else "in_progress",
+                    "results_url": f"{base}/results/{batch_id}",
+                }
+            )
+
+        def log_message(self, *_args) -> None:
+            pass
+
+    return Handler
+
+
+def test_batch_rounds_follow_stage_order_and_resume_subjects(local_server) -> None:
+    rounds: list[list[str]] = []
+    schemas: list[str] = []
+    base = local_server(_batches_handler(rounds, schemas))
+    sleeps: list[float] = []
+    traces = run_batch(
+        ["climate", "border"],
+        provider="anthropic",
+        keys=LLMKeys(anthropic_token="k"),
+        fixture_articles=[LEFT_ARTICLE, RIGHT_ARTICLE],
+        backend=AnthropicBatches("claude-test", "k", base_url=base),
+        poll_seconds=5,
+        sleep=sleeps.append,
+    )
+
+    # One round per stage; identical prompts across subjects are sent once.
+    assert rounds == [["summarize"], ["bias_detect"], ["critique"], ["reconcile"]]
+    # Each request carries its stage's schema, as a live structured call would.
+    assert schemas == ["structured_summary", "bias_judgment", "critique", "reconciled_report"]
+    assert sleeps == [5, 5, 5, 5]
+    assert [trace.subject for trace in traces] == ["climate", "border"]
+    for trace in traces:
+        assert trace.summary.headline == "Batch headline"
+        assert trace.bias_judgment.rationale == "Batch rationale."
+        assert trace.critique.reasoning == "Batch reasoning."
+        reconcile_stage = trace.stages[-1]
+        assert reconcile_stage.status == "warning"
+        assert "anthropic batch: overloaded" in reconcile_stage.notes[-1]
+        assert trace.report.final_label == "Lean Left"
+        assert "batch mode (anthropic): 4 batch(es), 4 request(s) for 2 subject(s)" in trace.framework_notes
+        assert trace.citation_errors == []
+
+
+def test_direct_backend_runs_providers_without_a_batch_api() -> None:
+    prompts: list[str] = []
+
+    def generate(prompt: str) -> str:
+        prompts.append(prompt)
+        return ANSWER
+
+    traces = run_batch(
+        ["climate"],
+        provider="ollama",
+        fixture_articles=[LEFT_ARTICLE],
+        backend=DirectBackend(LLMClient(provider="ollama", model="llama3", generate=generate)),
+        sleep=lambda _seconds: None,
+    )
+    assert len(prompts) == 4
+    assert traces[0].report.executive_summary == "Batch executive summary."
+    assert traces[0].stages[-1].status == "ok"
+
+
+class _StalledBackend:
+    """Accepts batches that never end, so only the deadline stops the sweep."""
+
+    name = "stalled"
+
+    def __init__(self) -> None:
+        self.submitted: list[dict[str, BatchRequest]] = []
+        self.cancelled: list[str] = []
+
+    def submit(self, requests: dict[str, BatchRequest]) -> str:
+        self.submitted.append(requests)
+        return f"stalled-{len(self.submitted) - 1}"
+
+    def poll(self, batch_id: str) -> None:
+        return None
+
+    def cancel(self, batch_id: str) -> None:
+        self.cancelled.append(batch_id)
+
+
+def test_nothing_is_submitted_after_the_deadline_and_open_batches_are_cancelled() -> None:
+    now = [0.0]
+    backend = _StalledBackend()
+
+    def sleep(seconds: float) -> None:
+        now[0] += seconds
+
+    traces = run_batch(
+        ["climate"],
+        provider="anthropic",
+        keys=LLMKeys(anthropic_token="k"),
+        fixture_articles=[LEFT_ARTICLE],
+        backend=backend,
+        poll_seconds=60,
+        timeout_seconds=30,
+        sleep=sleep,
+        clock=lambda: now[0],
+    )
+    # Only the summarize batch went out; the later stages were never submitted.
+    assert [[_stage_of(request.prompt) for request in chunk.values()] for chunk in backend.submitted] == [["summarize"]]
+    assert backend.cancelled == ["stalled-0"]
+    stages = {stage.name: stage for stage in traces[0].stages}
+    assert "stalled batch timed out" in stages["summarize"].notes[-1]
+    for name in ("bias_detect", "critique", "reconcile"):
+        assert stages[name].status == "warning"
+        assert "stalled batch timed out before submit" in stages[name].notes[-1]
+    assert "batch mode (stalled): 1 batch(es), 1 request(s) for 1 subject(s)" in traces[0].framework_notes
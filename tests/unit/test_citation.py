@@ -2,8 +2,16 @@ from __future__ import annotations
 
 import pytest
 
-from core.citation import CitationError, raise_on_citation_errors, verify_citation
-from core.schemas import Citation
+from core.citation import (
+    CitationError,
+    CitationIndex,
+    highlight_parts,
+    raise_on_citation_errors,
+    trace_citations,
+    verify_citation,
+)
+from core.schemas import Article, Citation
+from core.structured_output import STAGE_SCHEMAS
 from impls.static.pipeline import run
 from tests.fixtures import LEFT_ARTICLE
 
@@ -24,3 +32,38 @@ def test_pipeline_citations_raise_when_corrupted() -> None:
     trace.bias_judgment.evidence[0].span_text = "invented phrase"
     with pytest.raises(CitationError):
         raise_on_citation_errors(trace)
+
+
+def test_verify_citation_matches_normalized_spans_and_records_offsets() -> None:
+    text = "The mayor’s plan would   cut  the “boondoggle” transit line — critics said."
+    article = Article(id="n", title="Transit", url="fixture://n", text=text)
+    citation = Citation(article_id="n", span_text="mayor's plan would cut the \"boondoggle\" transit line -")
+    assert verify_citation(citation, [article]) is None
+    assert text[citation.start : citation.end] == "mayor’s plan would   cut  the “boondoggle” transit line —"
+
+    verbatim = Citation(article_id="n", span_text="critics said.")
+    assert verify_citation(verbatim, [article]) is None
+    assert (verbatim.start, verbatim.end) == (text.index("critics"), len(text))
+
+
+def test_trace_citations_carry_offsets_and_highlight_parts() -> None:
+    trace = run("climate bill", fixture_articles=[LEFT_ARTICLE])
+    for citation in trace_citations(trace):
+        assert LEFT_ARTICLE.text[citation.start : citation.end] == citation.span_text
+    evidence = trace.bias_judgment.evidence[0]
+    before, span, after = highlight_parts(LEFT_ARTICLE.text, evidence.start, evidence.end, context=10)
+    assert span == evidence.span_text and len(before) <= 11
+    # Offsets are output-only: never requested from models, never serialized unset.
+    assert "start" not in str(STAGE_SCHEMAS["summarize"].schema)
+    assert "start" not in Citation(article_id="x", span_text="unverified span").model_dump()
+
+
+def test_citation_index_handles_many_long_articles() -> None:
+    articles = [
+        Article(id=f"a{n}", title=f"Story {n}", url=f"fixture://{n}", text=" ".join(f"w{n}x{i}" for i in range(4000)))
+        for n in range(200)
+    ]
+    index = CitationIndex(articles)
+    citations = [Citation(article_id=f"a{n}", span_text=f"w{n}x3990  w{n}x3991") for n in range(200)]
+    assert all(index.verify(citation) is None for citation in citations)
+    assert articles[7].text[citations[7].start : citations[7].end] == "w7x3990 w7x3991"
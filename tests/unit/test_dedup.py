@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from core.dedup import collapse_duplicate_hits, hamming, simhash
+
+
+def test_simhash_is_close_for_light_edits_and_far_for_new_stories() -> None:
+    story = "The city council voted on Tuesday to expand bus service across three neighborhoods next spring. " * 3
+    edited = "By Staff Reporter. " + story + " Copyright Wire Service."
+    other = "A regional bank reported higher quarterly earnings on stronger mortgage lending and lower costs. " * 3
+    assert hamming(simhash(story), simhash(edited)) <= 6
+    assert hamming(simhash(story), simhash(other)) > 6
+
+
+def test_collapse_duplicate_hits_uses_title_without_source_suffix() -> None:
+    hits = [
+        {"title": "Council expands bus service - Reuters", "url": "https://news.google.com/rss/articles/abc", "source": "Reuters"},
+        {"title": "Council expands bus service - AP News", "url": "https://news.google.com/rss/articles/def", "source": "AP News"},
+        {"title": "Bank earnings rise", "url": "https://bank.example/earnings", "source": "Ledger"},
+    ]
+    kept, collapsed = collapse_duplicate_hits(hits)
+    assert [hit["source"] for hit in kept] == ["Reuters", "Ledger"]
+    assert [(dup["source"], rep["source"]) for dup, rep in collapsed] == [("AP News", "Reuters")]
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from core.fetching import DEADLINE_ERROR, fetch_texts
+from core.pipeline import fetch_articles
+from core.schemas import LLMKeys, StructuredQuery
+from core.text_extraction import ExtractedText
+
+
+def test_fetch_texts_keeps_input_order() -> None:
+    delays = {"https://a.example/1": 0.05, "https://b.example/2": 0.0, "https://c.example/3": 0.02}
+
+    def extract(url: str, *, timeout: int) -> str:
+        time.sleep(delays[url])
+        return f"text for {url}"
+
+    outcomes = fetch_texts(list(delays), extract=extract)
+    assert [outcome.url for outcome in outcomes] == list(delays)
+    assert all(outcome.text == f"text for {outcome.url}" for outcome in outcomes)
+
+
+def test_fetch_texts_caps_requests_per_host() -> None:
+    lock = threading.Lock()
+    active = {"now": 0, "peak": 0}
+
+    def extract(url: str, *, timeout: int) -> str:
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        return "ok"
+
+    urls = [f"https://same.example/{index}" for index in range(6)]
+    outcomes = fetch_texts(urls, extract=extract, max_workers=6, per_host=2)
+    assert all(outcome.text == "ok" for outcome in outcomes)
+    assert active["peak"] <= 2
+
+
+def test_fetch_texts_reports_deadline_and_errors() -> None:
+    def extract(url: str, *, timeout: int) -> str:
+        if "slow" in url:
+            time.sleep(0.5)
+        if "broken" in url:
+            raise ConnectionError("boom")
+        return "fast text"
+
+    outcomes = fetch_texts(
+        ["https://fast.example/a", "https://slow.example/b", "https://broken.example/c"],
+        extract=extract,
+        deadline=0.1,
+    )
+    assert outcomes[0].text == "fast text"
+    assert outcomes[1].error == DEADLINE_ERROR
+    assert outcomes[2].error == "ConnectionError"
+
+
+def test_fetch_articles_notes_follow_hit_order(monkeypatch) -> None:
+    hits = [
+        {"title": "Slow story", "url": "https://slow.example/story", "source": "Slow", "description": "Slow summary."},
+        {"title": "Short story", "url": "https://short.example/story", "source": "Short", "description": "Short summary."},
+        {"title": "Full story", "url": "https://full.example/story", "source": "Full", "description": "Full summary."},
+    ]
+
+    def extract(url: str, *, timeout: int) -> str:
+        if "slow" in url:
+            time.sleep(0.5)
+        if "short" in url:
+            return "tiny"
+        return "A complete article body. " * 10
+
+    monkeypatch.setattr("core.pipeline.search_articles", lambda *_args, **_kwargs: hits)
+    monkeypatch.setattr("core.fetching.fetch_article_text", extract)
+    articles, notes = fetch_articles(StructuredQuery(query="story"), keys=LLMKeys(), max_articles=3, fetch_deadline=0.1)
+    assert [article.text for article in articles[:2]] == ["Slow summary.", "Short summary."]
+    assert notes == [
+        "fetch deadline reached for https://slow.example/story; used metadata text",
+        "used metadata text for https://short.example/story",
+    ]
+
+
+def test_fetch_articles_reports_cache_counts(monkeypatch) -> None:
+    hits = [
+        {"title": f"Story {index}", "url": f"https://site{index}.example/story", "source": "Site", "description": "Summary."}
+        for index in range(3)
+    ]
+    statuses = iter(["hit", "miss", "revalidated"])
+
+    def extract(url: str, *, timeout: int) -> ExtractedText:
+        return ExtractedText(text=f"A complete article body from {url} about a distinct event. " * 6, cache_status=next(statuses))
+
+    monkeypatch.setattr("core.pipeline.search_articles", lambda *_args, **_kwargs: hits)
+    monkeypatch.setattr("core.fetching.fetch_article_text", extract)
+    _articles, notes = fetch_articles(StructuredQuery(query="story"), keys=LLMKeys(), max_articles=3, fetch_deadline=5)
+    assert notes == ["article cache: 1 hit(s), 1 revalidated, 1 miss(es)"]
+
+
+def test_fetch_articles_collapses_syndicated_copies_and_backfills(monkeypatch) -> None:
+    wire = "The agency said the storm would reach the coast on Tuesday and urged residents to prepare supplies. " * 4
+    hits = [
+        {"title": "Storm nears coast - Wire", "url": "https://wire.example/storm", "source": "Wire", "description": ""},
+        {"title": "Coastal warning issued - Daily", "url": "https://daily.example/storm", "source": "Daily", "description": ""},
+        {"title": "Storm nears coast", "url": "https://wire.example/storm?utm_source=rss", "source": "Other", "description": ""},
+        {"title": "Residents stock up", "url": "https://local.example/stock", "source": "Local", "description": ""},
+        {"title": "Port closes early", "url": "https://port.example/close", "source": "Port", "description": ""},
+    ]
+    texts = {
+        "https://wire.example/storm": wire,
+        "https://daily.example/storm": "AP - " + wire,
+        "https://local.example/stock": "Shoppers emptied grocery shelves of water and batteries before the weekend. " * 4,
+        "https://port.example/close": "The port authority closed two terminals and rerouted cargo ships north. " * 4,
+    }
+    monkeypatch.setattr("core.pipeline.search_articles", lambda *_args, **_kwargs: hits)
+    monkeypatch.setattr("core.fetching.fetch_article_text", lambda url, *, timeout: texts[url])
+    articles, notes = fetch_articles(StructuredQuery(query="storm"), keys=LLMKeys(), max_articles=3, fetch_deadline=5)
+    assert [article.url for article in articles] == [
+        "https://wire.example/storm",
+        "https://local.example/stock",
+        "https://port.example/close",
+    ]
+    assert notes == [
+        "collapsed duplicate https://wire.example/storm?utm_source=rss into https://wire.example/storm",
+        "collapsed duplicate https://daily.example/storm into https://wire.example/storm",
+    ]
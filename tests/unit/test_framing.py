@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import json
+import re
+
 from core.framing import (
     article_frames,
     framing_table,
@@ -9,6 +12,14 @@ from core.framing import (
     takeaways,
     watch_items,
 )
+from core.schemas import Article
+from core.source_catalog import (
+    SOURCE_CATALOG,
+    SOURCE_CATALOG_ENV,
+    SOURCE_CONTEXT,
+    SourceCatalog,
+    default_source_catalog,
+)
 from impls.registry import get_runner
 from tests.fixtures import LEFT_ARTICLE, MIXED_ARTICLES
 
@@ -27,8 +38,6 @@ def test_framing_table_maps_sources_to_frames() -> None:
 
 
 def test_source_context_identifies_common_policy_sources() -> None:
-    from core.schemas import Article
-
     manhattan = Article(
         id="mi",
         title="Housing policy paper",
@@ -73,3 +82,54 @@ def test_takeaways_and_watch_items_are_reader_facing() -> None:
     assert takeaways(trace)
     items = watch_items(trace)
     assert any("source rating" in item for item in items)
+
+
+def test_source_catalog_matches_naive_scan_in_catalog_order(tmp_path) -> None:
+    def naive(article: Article) -> tuple[str, str] | None:
+        haystack = f"{article.source} {article.title} {article.url}".lower()
+        for name, context in SOURCE_CONTEXT.items():
+            if re.search(rf"(?<![a-z0-9]){re.escape(name)}(?![a-z0-9])", haystack) or ("." in name and name in haystack):
+                return context
+        return None
+
+    samples = [
+        ("Fox News", "Vox explains the budget", "https://www.foxnews.com/politics/x"),
+        ("Local Paper", "Slated for Tuesday", "https://example.com/a"),
+        ("Reason", "Free minds", "https://reason.com/2024/05/01/story"),
+        ("Daily Bulletin", "AEI scholars weigh in", "https://news.example.org/aei-report"),
+        ("Aggregator", "The Nation and NPR on taxes", "fixture://x"),
+        ("Paper", "Treason trial opens", "https://treason.community.example/x"),
+    ]
+    articles = [
+        Article(id=str(n), title=title, url=url, source=source, text=title)
+        for n, (source, title, url) in enumerate(samples)
+    ]
+    catalog = SourceCatalog(SOURCE_CONTEXT)
+    assert [catalog.lookup(article) for article in articles[:-1]] == [naive(article) for article in articles[:-1]]
+    # Domains match whole labels, so "treason.community" no longer passes for reason.com.
+    assert naive(articles[-1]) is not None
+    assert catalog.lookup(articles[-1]) is None
+
+    extra = tmp_path / "catalog.json"
+    outlets = {f"outlet {n}": [f"Outlet {n}", "reference"] for n in range(5000)}
+    outlets["example-local.com"] = ["Local daily", "reference"]
+    extra.write_text(json.dumps(outlets), encoding="utf-8")
+    large = SourceCatalog.from_file(extra, base=SOURCE_CONTEXT)
+    assert len(large) == len(SOURCE_CONTEXT) + 5001
+    local = Article(id="l", title="Outlet 4999 report", url="https://www.example-local.com/x", source="", text="Local coverage")
+    assert large.lookup(local) == ("Outlet 4999", "reference")
+    assert large.lookup(articles[0]) == naive(articles[0])
+    assert large.lookup(Article(id="o", title="Outlet 49999", url="", source="", text="Local coverage")) is None
+
+
+def test_default_catalog_is_resolved_once_per_path(tmp_path, monkeypatch) -> None:
+    extra = tmp_path / "catalog.json"
+    extra.write_text(json.dumps({"county ledger": ["Local paper", "reference"]}), encoding="utf-8")
+    monkeypatch.setenv(SOURCE_CATALOG_ENV, str(extra))
+    catalog = default_source_catalog()
+    assert catalog.path == extra and "county ledger" in catalog.entries
+    # Later lookups reuse the resolved catalog without touching the file.
+    extra.unlink()
+    assert default_source_catalog() is catalog
+    monkeypatch.setenv(SOURCE_CATALOG_ENV, str(tmp_path / "missing.json"))
+    assert default_source_catalog() is SOURCE_CATALOG
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from core.demo_cases import DEMO_CASES
+from core.heuristic_batch import TERM_COLUMNS, detect_bias_batch, score_article_sets
+from core.llm_provider import get_llm
+from core.pipeline import detect_bias, summarize
+from core.schemas import Article, LLMKeys
+from tests.fixtures import LEFT_ARTICLE, MIXED_ARTICLES, golden_articles, golden_cases
+
+
+def test_batch_scoring_matches_scalar_detect_bias() -> None:
+    llm = get_llm("heuristic", keys=LLMKeys())
+    sets = [list(case.articles) for case in DEMO_CASES]
+    sets += [golden_articles(case)[:4] for case in golden_cases()]
+    sets += [[], [LEFT_ARTICLE], MIXED_ARTICLES]
+    sets.append(
+        [
+            Article(id="mi", title="Housing paper", url="fixture://mi", source="Manhattan Institute", text="Short note."),
+            Article(id="np", title="Tournament recap", url="fixture://np", source="Reuters", text="The match ended."),
+        ]
+    )
+
+    expected = [detect_bias(summarize(articles, llm), articles, llm) for articles in sets]
+    assert detect_bias_batch(sets) == expected
+    assert detect_bias_batch([]) == []
+
+
+def test_score_article_sets_reports_labels_and_term_counts() -> None:
+    scores = score_article_sets([[LEFT_ARTICLE], [], MIXED_ARTICLES])
+    assert scores.labels[1] == "Undetermined" and scores.confidence[1] == 0.0
+    assert scores.labels[0] == "Lean Left"
+    assert scores.term_counts[0, TERM_COLUMNS.index("climate")] == 1
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import random
+
+from core.demo_cases import DEMO_CASES
+from core.framing import article_frames
+from core.lexicon import FRAME_TERMS, LEXICON, Lexicon, TermHit, matcher_for
+
+
+def test_scan_reports_overlapping_hits_with_offsets() -> None:
+    lexicon = Lexicon({"a": ["he", "she", "hers"], "b": ["his", "e"]})
+    text = "ushers his"
+    hits = lexicon.scan(text)
+    assert TermHit("she", 1, 4) in hits and TermHit("he", 2, 4) in hits and TermHit("hers", 2, 6) in hits
+    assert TermHit("his", 7, 10) in hits
+    assert all(text[hit.start : hit.end] == hit.term for hit in hits)
+    assert lexicon.find_terms(text) == {"he", "she", "hers", "his", "e"}
+
+
+def test_matches_substring_semantics_on_demo_cases_and_random_text() -> None:
+    texts = [f"{article.title} {article.text}".lower() for case in DEMO_CASES for article in case.articles]
+    alphabet = "abcdeilmnorstuw "
+    rng = random.Random(7)
+    texts += ["".join(rng.choice(alphabet) for _ in range(400)) for _ in range(50)]
+    texts += [" ".join(rng.sample(sorted(LEXICON.terms), 6)) for _ in range(50)]
+    for text in texts:
+        assert LEXICON.find_terms(text) == {term for term in LEXICON.terms if term in text}
+
+
+def test_frames_and_adhoc_terms_use_the_same_semantics() -> None:
+    for case in DEMO_CASES:
+        for article in case.articles:
+            text = f"{article.title} {article.text}".lower()
+            expected = [frame for frame, terms in FRAME_TERMS.items() if any(term in text for term in terms)]
+            assert article_frames(article) == (expected or ["General reporting"])
+    matcher, wanted = matcher_for(["county", "budget vote"])
+    assert matcher is not LEXICON and matcher.find_terms("the county budget vote") == wanted
+    assert matcher_for(["climate", "border"])[0] is LEXICON
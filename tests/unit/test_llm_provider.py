@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
 import pytest
 
-from core.llm_provider import get_llm
+from core.llm_cache import LLMResponseCache
+from core.llm_provider import OLLAMA_NUM_CTX, get_llm, prewarm_ollama
+from core.pipeline import digest_articles, stage_metrics
 from core.schemas import LLMKeys
+from tests.fixtures import article
 
 
 def test_heuristic_provider_needs_no_key() -> None:
@@ -20,3 +28,114 @@ def test_missing_openai_key_fails_fast() -> None:
 def test_unknown_provider_fails_fast() -> None:
     with pytest.raises(ValueError, match="Unknown LLM provider"):
         get_llm("unknown", keys=LLMKeys())
+
+
+def _counting_post(monkeypatch) -> list[dict]:
+    payloads: list[dict] = []
+
+    def fake_post(url, headers, payload, timeout=90, transport=None, **_kwargs):
+        payloads.append(payload)
+        return {"output_text": f"answer {len(payloads)}"}
+
+    monkeypatch.setattr("core.llm_provider._post_json", fake_post)
+    return payloads
+
+
+def test_identical_prompts_are_served_from_cache(monkeypatch, tmp_path) -> None:
+    payloads = _counting_post(monkeypatch)
+    cache = LLMResponseCache(tmp_path / "llm.sqlite3")
+    client = get_llm("openai", keys=LLMKeys(openai_token="k"), cache=cache)
+    assert client.generate("same prompt") == "answer 1"
+    assert client.generate("same prompt") == "answer 1"
+    assert client.generate("other prompt") == "answer 2"
+    other_model = get_llm("openai", "gpt-4o", keys=LLMKeys(openai_token="k"), cache=cache)
+    assert other_model.generate("same prompt") == "answer 3"
+    assert len(payloads) == 3
+
+    # A fresh process sees the disk tier.
+    reopened = get_llm("openai", keys=LLMKeys(openai_token="k"), cache=LLMResponseCache(tmp_path / "llm.sqlite3"))
+    assert reopened.generate("same prompt") == "answer 1"
+    assert len(payloads) == 3
+
+
+def test_llm_cache_bypass_and_ttl(monkeypatch, tmp_path) -> None:
+    payloads = _counting_post(monkeypatch)
+    cache = LLMResponseCache(tmp_path / "llm.sqlite3")
+    get_llm("openai", keys=LLMKeys(openai_token="k"), cache=cache).generate("prompt")
+    bypass = get_llm("openai", keys=LLMKeys(openai_token="k"), cache=cache, use_cache=False)
+    assert bypass.generate("prompt") == "answer 2"
+
+    expired = LLMResponseCache(tmp_path / "llm.sqlite3", ttl_seconds=0)
+    assert get_llm("openai", keys=LLMKeys(openai_token="k"), cache=expired).generate("prompt") == "answer 3"
+    assert len(payloads) == 3
+
+
+def test_llm_cache_evicts_least_recently_used(tmp_path) -> None:
+    cache = LLMResponseCache(tmp_path / "llm.sqlite3", max_bytes=10, memory_entries=1)
+    cache.put("a", "12345")
+    cache.put("b", "12345")
+    assert cache.get("a") == "12345"
+    cache.put("c", "12345")
+    assert cache.get("b") is None
+    assert cache.get("a") == "12345"
+    assert cache.get("c") == "12345"
+
+
+def _ollama_handler(requests_seen: list[dict], active: list[int]) -> type[BaseHTTPRequestHandler]:
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            with lock:
+                requests_seen.append(request)
+                active[0] += 1
+                active[1] = max(active[1], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            body = json.dumps(
+                {
+                    "response": "{}" if "prompt" in request else "",
+                    "done": True,
+                    "load_duration": 2_000_000_000 if "prompt" not in request else 1_000_000,
+                    "prompt_eval_count": 120,
+                    "prompt_eval_duration": 300_000_000,
+                    "eval_count": 40,
+                    "eval_duration": 500_000_000,
+                }
+            ).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args) -> None:
+            pass
+
+    return Handler
+
+
+def test_ollama_prewarm_keep_alive_slots_and_timings(monkeypatch, local_server) -> None:
+    monkeypatch.setenv("OLLAMA_NUM_PARALLEL", "2")
+    seen: list[dict] = []
+    active = [0, 0]
+    host = local_server(_ollama_handler(seen, active))
+    assert prewarm_ollama(host, "llama3") == {"load_seconds": 2.0, "prompt_eval_seconds": 0.3, "eval_seconds": 0.5}
+    assert "prompt" not in seen[0] and seen[0]["keep_alive"] == "30m"
+    assert seen[0]["options"]["num_ctx"] == OLLAMA_NUM_CTX
+
+    llm = get_llm("ollama", "llama3", LLMKeys(ollama_host=host))
+    assert llm.max_concurrency == 2
+    articles = [article(f"Story {n}", f"Story {n} covers the county budget vote in detail.") for n in range(6)]
+    notes: list[str] = []
+    digest_articles(articles, llm, mode="map_reduce", notes=notes)
+    metrics = stage_metrics(llm)
+
+    assert active[1] == 2
+    assert "6 article digest(s) from 2 concurrent worker(s)" in notes[0]
+    assert all(request["keep_alive"] == "30m" for request in seen[1:])
+    assert {request["options"]["num_ctx"] for request in seen[1:]} == {OLLAMA_NUM_CTX}
+    assert metrics["eval_tokens"] == 240 and metrics["prompt_eval_seconds"] == 1.8
+    assert metrics["load_seconds"] == 0.006
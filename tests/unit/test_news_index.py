@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from core.news_index import NewsIndex, NewsIngester
+from core.news_search import FeedCache, search_articles
+from core.schemas import StructuredQuery
+
+
+def _entry(title: str, link: str, summary: str, day: int) -> object:
+    return type(
+        "Entry",
+        (),
+        {"title": title, "link": link, "summary": summary, "published_parsed": (2026, 6, day, 0, 0, 0, 0, 0, 0)},
+    )()
+
+
+def _feed(entries: list[object]) -> object:
+    return type("Feed", (), {"feed": type("FeedMeta", (), {"title": "Fixture Wire"})(), "entries": entries})()
+
+
+def _ingested_index(tmp_path, monkeypatch) -> NewsIndex:
+    entries = [
+        _entry("Climate bill clears committee", "https://wire.example/climate", "Climate bill vote set.", 3),
+        _entry("Climate rally draws crowds", "https://wire.example/rally", "Activists gathered.", 10),
+        _entry("Transit budget approved", "https://wire.example/transit", "Council passed budget.", 10),
+    ]
+    monkeypatch.setattr("core.news_search.feedparser.parse", lambda _url, **_kwargs: _feed(entries))
+    index = NewsIndex(tmp_path / "news.sqlite3")
+    ingester = NewsIngester(index, feeds=["https://wire.example/rss"], feed_cache=FeedCache())
+    assert ingester.ingest_once() == 3
+    assert ingester.ingest_once() == 0
+    return index
+
+
+def test_index_ranks_keyword_matches_inside_date_window(tmp_path, monkeypatch) -> None:
+    index = _ingested_index(tmp_path, monkeypatch)
+    hits = index.search(StructuredQuery(query="climate bill"), max_articles=5)
+    assert [hit["url"] for hit in hits] == ["https://wire.example/climate", "https://wire.example/rally"]
+
+    windowed = index.search(StructuredQuery(query="climate", date_from="2026-06-05", date_to="2026-06-30"))
+    assert [hit["url"] for hit in windowed] == ["https://wire.example/rally"]
+
+
+def test_search_articles_uses_index_and_falls_back_when_thin(tmp_path, monkeypatch) -> None:
+    index = _ingested_index(tmp_path, monkeypatch)
+    live_calls: list[str] = []
+
+    def live(query, max_articles=5):
+        live_calls.append(query.query)
+        return [{"title": "Live climate story", "url": "https://live.example/climate", "source": "Live", "description": ""}]
+
+    monkeypatch.setattr("core.news_search.fallback_rss", live)
+    notes: list[str] = []
+    hits = search_articles(StructuredQuery(query="climate"), max_articles=2, index=index, notes=notes)
+    assert len(hits) == 2
+    assert live_calls == []
+    assert notes == ["local index: 2 hit(s)"]
+
+    notes.clear()
+    hits = search_articles(StructuredQuery(query="climate"), max_articles=3, index=index, notes=notes)
+    assert [hit["url"] for hit in hits][-1] == "https://live.example/climate"
+    assert live_calls == ["climate"]
+    assert notes == ["local index: 2 hit(s); coverage thin, used live search"]
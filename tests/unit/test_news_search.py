@@ -1,6 +1,19 @@
 from __future__ import annotations
 
-from core.news_search import clean_feed_text, fallback_rss, hits_to_articles
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+
+from core.news_search import (
+    FeedCache,
+    canonical_url,
+    clean_feed_text,
+    fallback_rss,
+    gnews_limiter,
+    hits_to_articles,
+    search_articles,
+)
 from core.schemas import StructuredQuery
 
 
@@ -52,3 +65,174 @@ def test_fallback_rss_scores_query_terms(monkeypatch) -> None:
 def test_structured_query_shape() -> None:
     query = StructuredQuery(query="AI regulation", date_from="2026-06-01")
     assert query.query == "AI regulation"
+
+
+def test_canonical_url_drops_tracking_and_fragments() -> None:
+    assert canonical_url("HTTPS://Example.com:443/story/?utm_source=x&b=2&a=1#top") == "https://example.com/story?a=1&b=2"
+
+
+def test_fallback_rss_ranks_across_all_feeds(monkeypatch) -> None:
+    def entry(title: str, link: str, summary: str = "") -> object:
+        return type("Entry", (), {"title": title, "link": link, "summary": summary})()
+
+    def feed(title: str, entries: list[object]) -> object:
+        return type("Feed", (), {"feed": type("FeedMeta", (), {"title": title})(), "entries": entries})()
+
+    feeds = {
+        "news.google.com": feed("Search", [entry("Budget talks resume", "https://example.com/talks")]),
+        "bbci": feed("BBC", [entry("Climate bill budget vote", "https://bbc.example/vote", "climate budget")]),
+        "npr": feed("NPR", [entry("Budget talks resume", "https://example.com/talks/?utm_source=npr")]),
+        "cnn": feed("CNN", [entry("Climate bill passes", "https://cnn.example/climate")]),
+    }
+
+    def parse(url: str) -> object:
+        return next(value for key, value in feeds.items() if key in url)
+
+    monkeypatch.setattr("core.news_search.feedparser.parse", parse)
+    query = StructuredQuery(query="climate bill budget")
+    hits = fallback_rss(query, max_articles=3)
+    assert [hit["url"] for hit in hits] == [
+        "https://bbc.example/vote",
+        "https://cnn.example/climate",
+        "https://example.com/talks",
+    ]
+    assert fallback_rss(query, max_articles=3) == hits
+
+
+def test_feed_cache_serves_within_ttl_and_revalidates(monkeypatch) -> None:
+    calls: list[dict[str, str]] = []
+
+    class Fresh:
+        status = 200
+        etag = '"feed-v1"'
+        modified = None
+        feed = type("FeedMeta", (), {"title": "Cached"})()
+        entries = [type("Entry", (), {"title": "Cached story", "link": "https://example.com/cached", "summary": ""})()]
+
+    class NotModified:
+        status = 304
+        feed = type("FeedMeta", (), {})()
+        entries: list[object] = []
+
+    def parse(url: str, **kwargs: str) -> object:
+        calls.append(kwargs)
+        return NotModified() if kwargs else Fresh()
+
+    monkeypatch.setattr("core.news_search.feedparser.parse", parse)
+    cache = FeedCache(ttl_seconds=60)
+    assert cache.parse("https://feeds.example/rss") is not None
+    assert cache.parse("https://feeds.example/rss").entries[0].title == "Cached story"
+    assert calls == [{}]
+
+    cache.ttl_seconds = 0
+    assert cache.parse("https://feeds.example/rss").entries[0].title == "Cached story"
+    assert calls[-1] == {"etag": '"feed-v1"'}
+
+
+def test_feed_cache_keeps_the_stale_copy_when_a_refresh_fails(monkeypatch) -> None:
+    class Fresh:
+        status = 200
+        bozo = 0
+        etag = None
+        modified = None
+        feed = type("FeedMeta", (), {"title": "Cached"})()
+        entries = [type("Entry", (), {"title": "Cached story", "link": "https://example.com/cached", "summary": ""})()]
+
+    class Unreachable:
+        # What feedparser returns when the fetch itself fails: no status.
+        bozo = 1
+        feed = type("FeedMeta", (), {})()
+        entries: list[object] = []
+
+    class ServerError(Unreachable):
+        status = 503
+
+    responses: list[object] = [Fresh(), Unreachable(), ServerError()]
+    monkeypatch.setattr("core.news_search.feedparser.parse", lambda url, **_kwargs: responses.pop(0))
+    cache = FeedCache(ttl_seconds=0)
+    assert cache.parse("https://feeds.example/rss").entries[0].title == "Cached story"
+    assert cache.parse("https://feeds.example/rss").entries[0].title == "Cached story"
+    assert cache.parse("https://feeds.example/rss").entries[0].title == "Cached story"
+    assert responses == []
+
+
+def test_feed_cache_collapses_concurrent_fetches(monkeypatch) -> None:
+    calls: list[str] = []
+
+    def parse(url: str, **_kwargs: str) -> object:
+        calls.append(url)
+        time.sleep(0.05)
+        return type("Feed", (), {"feed": type("FeedMeta", (), {"title": "Slow"})(), "entries": []})()
+
+    monkeypatch.setattr("core.news_search.feedparser.parse", parse)
+    cache = FeedCache(ttl_seconds=60)
+    threads = [threading.Thread(target=cache.parse, args=("https://feeds.example/slow",)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert calls == ["https://feeds.example/slow"]
+
+
+def _gnews_handler(requests_seen: list[str], status: int = 200) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            requests_seen.append(self.path)
+            body = json.dumps(
+                {"articles": [{"title": "Mock story", "url": "https://example.com/mock", "source": {"name": "Mock"}, "description": "d"}]}
+            ).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args) -> None:
+            pass
+
+    return Handler
+
+
+def test_gnews_results_are_cached_per_query_window(monkeypatch, local_server) -> None:
+    seen: list[str] = []
+    monkeypatch.setattr("core.news_search.GNEWS_SEARCH_URL", local_server(_gnews_handler(seen)) + "/api/v4/search")
+    notes: list[str] = []
+    query = StructuredQuery(query="climate bill", date_from="2026-06-01")
+    first = search_articles(query, max_articles=1, gnews_token="key", notes=notes)
+    second = search_articles(query, max_articles=1, gnews_token="key", notes=notes)
+    search_articles(StructuredQuery(query="climate bill"), max_articles=1, gnews_token="key", notes=notes)
+    assert first == second == [{"title": "Mock story", "url": "https://example.com/mock", "source": "Mock", "description": "d"}]
+    assert len(seen) == 2
+    assert "gnews cache: hit (1 of 2 lookup(s), 50% hit rate)" in notes
+    assert "gnews quota: 2 request(s) used, 98 left" in notes
+
+
+def test_gnews_degrades_to_rss_near_quota(monkeypatch, local_server) -> None:
+    seen: list[str] = []
+    monkeypatch.setattr("core.news_search.GNEWS_SEARCH_URL", local_server(_gnews_handler(seen)) + "/api/v4/search")
+    monkeypatch.setattr("core.news_search.GNEWS_MAX_WAIT_SECONDS", 0.0)
+    monkeypatch.setenv("GNEWS_DAILY_QUOTA", "3")
+    rss_hit = {"title": "RSS story", "url": "https://example.com/rss", "source": "RSS", "description": ""}
+    monkeypatch.setattr("core.news_search.fallback_rss", lambda *_args, **_kwargs: [rss_hit])
+    notes: list[str] = []
+    hits = [
+        search_articles(StructuredQuery(query=f"topic {n}"), max_articles=1, gnews_token="key", notes=notes)
+        for n in range(3)
+    ]
+    assert len(seen) == 1
+    assert hits[0][0]["title"] == "Mock story"
+    assert hits[1] == hits[2] == [rss_hit]
+    assert notes[-1] == "gnews quota: near limit (2 left), used RSS fallback"
+
+
+def test_gnews_quota_error_drains_limiter(monkeypatch, local_server) -> None:
+    seen: list[str] = []
+    monkeypatch.setattr(
+        "core.news_search.GNEWS_SEARCH_URL", local_server(_gnews_handler(seen, status=429)) + "/api/v4/search"
+    )
+    monkeypatch.setattr("core.news_search.GNEWS_MAX_WAIT_SECONDS", 0.0)
+    monkeypatch.setattr("core.news_search.fallback_rss", lambda *_args, **_kwargs: [])
+    for n in range(2):
+        search_articles(StructuredQuery(query=f"topic {n}"), max_articles=1, gnews_token="key")
+    assert len(seen) == 1
+    assert gnews_limiter("key").available() < 1
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import json
+import threading
+
 from core.citation import verify_citations
-from core.pipeline import _first_sentence
+from core.llm_provider import LLMClient
+from core.pipeline import _first_sentence, run_pipeline
 from core.schemas import Article
 from impls.registry import IMPLEMENTATIONS, get_runner
-from tests.fixtures import LEFT_ARTICLE, MIXED_ARTICLES, NEUTRAL_ARTICLE, RIGHT_ARTICLE
+from tests.fixtures import LEFT_ARTICLE, MIXED_ARTICLES, NEUTRAL_ARTICLE, RIGHT_ARTICLE, article
 
 
 def test_all_impls_return_same_trace_shape() -> None:
@@ -65,3 +69,70 @@ def test_cataloged_conservative_source_context_contributes_right_signal() -> Non
     trace = get_runner("static")("Manhattan Institute housing", fixture_articles=[article])
     assert trace.report.final_label == "Lean Right"
     assert any("Conservative" in feature for feature in trace.bias_judgment.proxy_features)
+
+
+def test_map_reduce_digests_articles_and_keeps_citations_verifiable(monkeypatch) -> None:
+    articles = [
+        article(f"Story {n}", f"Reporters described the reckless plan number {n} in detail. Officials answered questions.")
+        for n in range(10)
+    ]
+    prompts: list[str] = []
+    threads: set[str] = set()
+
+    def generate(prompt: str) -> str:
+        prompts.append(prompt)
+        threads.add(threading.current_thread().name)
+        if prompt.startswith("You are a careful news reader"):
+            number = prompt.split("plan number ")[1].split()[0]
+            return json.dumps(
+                {
+                    "gist": f"Plan {number} was described.",
+                    "framing_spans": [{"span_text": f"the reckless plan number {number}"}, {"span_text": "an invented quote"}],
+                }
+            )
+        if "framing_spans" in prompt and "ARTICLE DIGESTS" in prompt:
+            return json.dumps({"headline": "Plans", "neutral_summary": "Ten plans.", "key_points": [], "framing_spans": []})
+        return ""
+
+    llm = LLMClient(provider="fake", model="fake", generate=generate)
+    monkeypatch.setattr("core.pipeline.get_llm", lambda *_args, **_kwargs: llm)
+    trace = run_pipeline("plans", implementation="static", fixture_articles=articles, max_articles=10)
+
+    assert len([p for p in prompts if p.startswith("You are a careful news reader")]) == 10
+    assert len(threads) > 1
+    summarize_stage = next(stage for stage in trace.stages if stage.name == "summarize")
+    assert "map-reduce: dropped 10 span(s) not found verbatim in article text" in summarize_stage.notes
+    assert trace.summary.headline == "Plans"
+    assert trace.summary.framing_notes[0].span_text == "the reckless plan number 0"
+    assert not any("Officials answered questions." in p for p in prompts if "ARTICLE DIGESTS" in p)
+    assert not verify_citations(trace)
+
+
+def test_map_reduce_stages_drop_spans_quoted_from_digest_gists(monkeypatch) -> None:
+    articles = [
+        article(f"Story {n}", f"Reporters described the reckless plan number {n} in detail. Officials answered questions.")
+        for n in range(10)
+    ]
+    gist = [{"article_id": articles[0].id, "span_text": "Plan 0 was described."}]
+
+    def generate(prompt: str) -> str:
+        if prompt.startswith("You are a careful news reader"):
+            number = prompt.split("plan number ")[1].split()[0]
+            return json.dumps(
+                {"gist": f"Plan {number} was described.", "framing_spans": [{"span_text": f"the reckless plan number {number}"}]}
+            )
+        if "DETECTOR_OUTPUT:" in prompt:
+            return json.dumps({"refined_label": "Lean Left", "reasoning": "Gist.", "trigger_phrases": gist})
+        if "\n\nSUMMARY:\n" in prompt:
+            return json.dumps({"label": "Lean Left", "confidence": 0.7, "rationale": "Gist.", "evidence": gist})
+        return json.dumps({"headline": "Plans", "neutral_summary": "Ten plans.", "framing_spans": gist})
+
+    llm = LLMClient(provider="fake", model="fake", generate=generate)
+    monkeypatch.setattr("core.pipeline.get_llm", lambda *_args, **_kwargs: llm)
+    trace = run_pipeline("plans", implementation="static", fixture_articles=articles, max_articles=10)
+
+    for citations in (trace.summary.framing_notes, trace.bias_judgment.evidence, trace.critique.trigger_phrases):
+        assert citations[0].span_text == "the reckless plan number 0"
+    assert trace.bias_judgment.rationale == "Gist."
+    assert trace.critique.reasoning == "Gist."
+    assert not verify_citations(trace)
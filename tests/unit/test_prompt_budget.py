@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from core.llm_provider import LLMClient, get_llm
+from core.pipeline import critique, detect_bias, stage_metrics, summarize
+from core.prompt_budget import (
+    ELISION,
+    allocate,
+    article_budget,
+    assemble_prompt,
+    estimate_tokens,
+    pack_articles,
+    pack_text,
+)
+from core.schemas import LLMKeys
+from tests.fixtures import LEFT_ARTICLE, RIGHT_ARTICLE, article
+
+
+def test_allocate_gives_surplus_from_short_items_to_long_ones() -> None:
+    assert allocate([10, 500, 500], [1.0, 1.0, 1.0], 300) == [10, 145, 145]
+    assert allocate([10, 500, 500], [1.0, 3.0, 1.0], 300) == [10, 217, 72]
+    assert allocate([10, 20], [1.0, 1.0], 300) == [10, 20]
+
+
+def test_pack_text_keeps_relevant_sentences_verbatim_in_order() -> None:
+    text = (
+        "The council met on Tuesday to open the session. "
+        "Members discussed parking rules for an hour. "
+        "The climate bill passed after a long debate. "
+        "Lunch was served afterwards in the hall."
+    )
+    packed = pack_text(text, budget_tokens=30, terms=["climate"])
+    assert packed == "The council met on Tuesday to open the session." + ELISION + "The climate bill passed after a long debate."
+    assert pack_text(text, budget_tokens=10_000, terms=[]) == text
+
+
+def test_pack_text_clips_unpunctuated_text_instead_of_dropping_it() -> None:
+    text = "word " * 3000
+    packed = pack_text(text, budget_tokens=500, terms=["word"])
+    assert packed and text.startswith(packed)
+    assert estimate_tokens(packed) <= 500
+    scraped = [article(f"Scrape {n}", "long unpunctuated scraped text " * 400) for n in range(6)]
+    for block in pack_articles(scraped, 3000, provider="ollama").split("\n\n"):
+        assert "long unpunctuated scraped text" in block
+
+
+def test_small_context_packs_articles_into_budget() -> None:
+    long_text = " ".join(f"Sentence {n} mentions the border budget in passing." for n in range(400))
+    articles = [article("Long one", long_text), article("Long two", long_text)]
+    prompt = assemble_prompt(["Instructions."], articles, provider="ollama", model="llama3", terms=["border"])
+    assert estimate_tokens(prompt, "ollama") <= 8192 - 1200
+    assert "Sentence 0 mentions" in prompt and "Sentence 399 mentions" not in prompt
+    assert prompt.count("[a-") == 2
+    large = assemble_prompt(["Instructions."], articles, provider="anthropic", model="claude")
+    assert long_text in large
+    assert article_budget("Instructions.", "anthropic") == 32_000
+
+
+def test_stage_prompts_record_token_counts() -> None:
+    prompts: list[str] = []
+    llm = LLMClient(provider="ollama", model="llama3", generate=lambda prompt: prompts.append(prompt) or "")
+    summary = summarize([LEFT_ARTICLE, RIGHT_ARTICLE], llm, query="climate bill")
+    detect_bias(summary, [LEFT_ARTICLE, RIGHT_ARTICLE], llm, query="climate bill")
+    metrics = stage_metrics(llm)
+    assert metrics["llm_calls"] == 2
+    assert metrics["prompt_tokens_per_call"] == [estimate_tokens(prompt, "ollama") for prompt in prompts]
+    assert LEFT_ARTICLE.text in prompts[0]
+    assert stage_metrics(llm) == {}
+
+
+def test_article_stages_share_a_byte_identical_prefix() -> None:
+    prompts: list[str] = []
+    llm = LLMClient(provider="ollama", model="llama3", generate=lambda prompt: prompts.append(prompt) or "")
+    articles = [LEFT_ARTICLE, RIGHT_ARTICLE]
+    summary = summarize(articles, llm, query="climate bill")
+    judgment = detect_bias(summary, articles, llm, query="climate bill")
+    critique(summary, judgment, articles, llm, query="climate bill")
+    prefix = prompts[0][: prompts[0].index("You are")]
+    assert prefix.startswith("ARTICLES:\n") and LEFT_ARTICLE.text in prefix and RIGHT_ARTICLE.text in prefix
+    assert all(prompt.startswith(prefix) for prompt in prompts[1:])
+
+
+def test_anthropic_prefix_is_marked_cacheable_and_cached_tokens_reported(monkeypatch) -> None:
+    payloads: list[dict] = []
+
+    def fake_post(url, headers, payload, timeout=90, transport=None, **_kwargs):
+        payloads.append(payload)
+        read = 0 if len(payloads) == 1 else 1500
+        return {
+            "content": [{"type": "text", "text": "{}"}],
+            "usage": {"input_tokens": 200, "cache_read_input_tokens": read, "cache_creation_input_tokens": 1500 - read},
+        }
+
+    monkeypatch.setattr("core.llm_provider._post_json", fake_post)
+    llm = get_llm("anthropic", keys=LLMKeys(anthropic_token="k"), use_cache=False)
+    articles = [LEFT_ARTICLE, RIGHT_ARTICLE]
+    summary = summarize(articles, llm, query="climate bill")
+    first = stage_metrics(llm)
+    detect_bias(summary, articles, llm, query="climate bill")
+    second = stage_metrics(llm)
+
+    blocks = [payload["messages"][0]["content"] for payload in payloads]
+    assert blocks[0][0]["cache_control"] == {"type": "ephemeral"}
+    assert blocks[0][0]["text"] == blocks[1][0]["text"]
+    assert blocks[0][1]["text"] != blocks[1][1]["text"]
+    assert first["cached_tokens"] == 0 and first["cache_write_tokens"] == 1500
+    assert second["cached_tokens"] == 1500 and second["input_tokens"] == 1700
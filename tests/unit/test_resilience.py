@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+import requests
+
+from core.llm_provider import LLMClient
+from core.pipeline import _stage, detect_bias, stage_metrics, summarize
+from core.resilience import (
+    CircuitOpen,
+    ProviderResilience,
+    ProviderUnavailable,
+    ResiliencePolicy,
+    retry_after_seconds,
+)
+from tests.fixtures import LEFT_ARTICLE, RIGHT_ARTICLE
+
+
+class FakeResponse:
+    def __init__(self, status_code: int = 200, headers: dict[str, str] | None = None, body: str = "ok") -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.body = body
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def _scripted(*outcomes):
+    calls = []
+
+    def send():
+        outcome = outcomes[len(calls)]
+        calls.append(outcome)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return send, calls
+
+
+def test_retries_honour_retry_after_then_succeed() -> None:
+    sleeps: list[float] = []
+    resilience = ProviderResilience("fake", sleep=sleeps.append)
+    send, calls = _scripted(
+        FakeResponse(429, {"Retry-After": "2"}),
+        requests.ConnectionError("reset"),
+        FakeResponse(200, body="done"),
+    )
+    assert resilience.call(send).body == "done"
+    assert len(calls) == 3
+    assert sleeps[0] == 2.0
+    assert 0.0 <= sleeps[1] <= ResiliencePolicy().base_delay * 2
+    assert calls[0].closed
+    assert resilience.breaker.state == "closed"
+
+
+def test_client_errors_are_not_retried() -> None:
+    resilience = ProviderResilience("fake", sleep=lambda _seconds: None)
+    send, calls = _scripted(FakeResponse(400))
+    assert resilience.call(send).status_code == 400
+    assert len(calls) == 1
+
+
+def test_retry_after_accepts_http_dates() -> None:
+    assert retry_after_seconds(FakeResponse(headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0.0
+    assert retry_after_seconds(FakeResponse(headers={"Retry-After": "soon"})) is None
+
+
+def test_breaker_opens_after_repeated_failures_and_fails_fast() -> None:
+    now = [0.0]
+    resilience = ProviderResilience(
+        "fake", ResiliencePolicy(max_attempts=1), sleep=lambda _seconds: None, clock=lambda: now[0]
+    )
+    failing, calls = _scripted(*[FakeResponse(503)] * 4)
+    for _ in range(3):
+        with pytest.raises(ProviderUnavailable, match="HTTP 503"):
+            resilience.call(failing)
+    with pytest.raises(CircuitOpen):
+        resilience.call(failing)
+    assert len(calls) == 3
+
+    # After the reset window a single trial call is let through.
+    now[0] = 31.0
+    assert resilience.breaker.state == "half-open"
+    healthy, _ = _scripted(FakeResponse(200))
+    assert resilience.call(healthy).status_code == 200
+    assert resilience.breaker.state == "closed"
+
+
+def test_unexpected_error_in_half_open_trial_does_not_wedge_the_breaker() -> None:
+    now = [0.0]
+    resilience = ProviderResilience(
+        "fake", ResiliencePolicy(max_attempts=1), sleep=lambda _seconds: None, clock=lambda: now[0]
+    )
+    failing, _ = _scripted(*[FakeResponse(503)] * 3)
+    for _ in range(3):
+        with pytest.raises(ProviderUnavailable):
+            resilience.call(failing)
+
+    now[0] = 31.0
+    broken, _ = _scripted(requests.exceptions.ChunkedEncodingError("truncated"))
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        resilience.call(broken)
+    assert resilience.breaker.state == "open"
+
+    # The failed trial reopened the breaker; the next window allows a new trial.
+    now[0] = 10_000.0
+    healthy, _ = _scripted(FakeResponse(200))
+    assert resilience.call(healthy).status_code == 200
+    assert resilience.breaker.state == "closed"
+
+
+def test_hedged_request_returns_the_faster_response() -> None:
+    resilience = ProviderResilience("fake", ResiliencePolicy(hedge_percentile=0.5))
+    for _ in range(20):
+        resilience.latencies.record(0.01)
+    lock = threading.Lock()
+    sent: list[int] = []
+
+    def send():
+        with lock:
+            sent.append(len(sent))
+            first = len(sent) == 1
+        if first:
+            time.sleep(0.5)
+            return FakeResponse(body="slow")
+        return FakeResponse(body="fast")
+
+    started = time.perf_counter()
+    assert resilience.call(send).body == "fast"
+    assert time.perf_counter() - started < 0.4
+    assert resilience.hedged == 1
+    assert len(sent) == 2
+
+
+def test_unavailable_provider_falls_back_with_stage_note() -> None:
+    def generate(prompt: str) -> str:
+        raise CircuitOpen("fake circuit open")
+
+    llm = LLMClient(provider="fake", model="fake", generate=generate)
+    articles = [LEFT_ARTICLE, RIGHT_ARTICLE]
+    summary = summarize(articles, llm)
+    assert summary.headline
+    record = _stage("summarize", "static", summary.model_dump(), metrics=stage_metrics(llm))
+    assert record.status == "warning"
+    assert record.metrics["provider_errors"] == ["fake circuit open"]
+    assert any("used heuristic fallback" in note for note in record.notes)
+
+    judgment = detect_bias(summary, articles, llm)
+    assert judgment.label
+    assert stage_metrics(llm)["provider_errors"] == ["fake circuit open"]
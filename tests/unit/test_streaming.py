@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import json
+from http.server import BaseHTTPRequestHandler
+
+from core.llm_provider import LLMClient, get_llm
+from core.pipeline import run_pipeline
+from core.schemas import LLMKeys
+from core.streaming import IncrementalJSONParser, iter_sse_data
+from tests.fixtures import LEFT_ARTICLE
+
+
+def test_incremental_parser_surfaces_fields_before_object_closes() -> None:
+    response = 'Sure:\n```json\n{"label": "Lean Left", "confidence": 0.71, "evidence": [{"span_text": "a \\"quoted\\" }"}], "ok": true}\n```'
+    parser = IncrementalJSONParser()
+    arrivals: list[tuple[int, str]] = []
+    for index, char in enumerate(response):
+        for key in parser.feed(char):
+            arrivals.append((index, key))
+    assert [key for _index, key in arrivals] == ["label", "confidence", "evidence", "ok"]
+    assert arrivals[0][0] < response.index('"confidence"')
+    assert parser.fields == json.loads(response[response.index("{") : response.rindex("}") + 1])
+    assert parser.done
+
+
+def test_sse_data_joins_lines_and_stops_at_done() -> None:
+    class Response:
+        def iter_lines(self, decode_unicode: bool = False):
+            return iter(["event: delta", "data: {\"a\":", "data: 1}", "", ": ping", "data: [DONE]", "", "data: late", ""])
+
+    assert list(iter_sse_data(Response())) == ['{"a":\n1}']
+
+
+def test_ollama_streams_ndjson_deltas(local_server) -> None:
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self) -> None:
+            request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+            assert request["stream"] is True
+            self.send_response(200)
+            self.send_header("Content-Type", "application/x-ndjson")
+            self.end_headers()
+            for piece in ['{"head', 'line": "A"}']:
+                self.wfile.write((json.dumps({"response": piece, "done": False}) + "\n").encode("utf-8"))
+                self.wfile.flush()
+            self.wfile.write(b'{"response": "", "done": true}\n')
+
+        def log_message(self, *_args) -> None:
+            pass
+
+    client = get_llm("ollama", keys=LLMKeys(ollama_host=local_server(Handler)))
+    assert client.stream is not None
+    assert list(client.stream("prompt")) == ['{"head', 'line": "A"}']
+
+
+def test_pipeline_streams_partials_and_records_ttft(monkeypatch) -> None:
+    def stream(prompt: str):
+        yield '{"headline": "Streamed", '
+        yield '"neutral_summary": "Short.", "key_points": []}'
+
+    llm = LLMClient(provider="fake", model="fake", generate=lambda prompt: "", stream=stream)
+    monkeypatch.setattr("core.pipeline.get_llm", lambda *_args, **_kwargs: llm)
+    partials: list[tuple[str, dict]] = []
+    trace = run_pipeline(
+        "climate",
+        implementation="static",
+        fixture_articles=[LEFT_ARTICLE],
+        on_partial=lambda stage, fields: partials.append((stage, fields)),
+    )
+    assert partials[0] == ("summarize", {"headline": "Streamed"})
+    assert trace.summary.headline == "Streamed"
+    summarize_stage = next(stage for stage in trace.stages if stage.name == "summarize")
+    assert summarize_stage.metrics["ttft_seconds"] >= 0
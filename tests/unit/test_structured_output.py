@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import json
+
+from core.llm_provider import LLMClient, get_llm
+from core.pipeline import detect_bias, stage_metrics, summarize
+from core.schemas import LLMKeys
+from core.structured_output import PARSE_STATS, STAGE_SCHEMAS, openapi_schema, repair_json_object
+from tests.fixtures import LEFT_ARTICLE, RIGHT_ARTICLE
+
+
+def test_stage_schemas_are_strict_and_self_contained() -> None:
+    schema = STAGE_SCHEMAS["bias_detect"].schema
+    assert "$ref" not in json.dumps(schema) and "$defs" not in schema
+    assert schema["required"] == list(schema["properties"]) and schema["additionalProperties"] is False
+    assert "Lean Left" in schema["properties"]["label"]["enum"]
+    assert schema["properties"]["evidence"]["items"]["required"] == ["article_id", "span_text"]
+    assert "framing_spans" in STAGE_SCHEMAS["summarize"].schema["properties"]
+    assert "article_count" not in STAGE_SCHEMAS["reconcile"].schema["properties"]
+    gemini = openapi_schema(STAGE_SCHEMAS["summarize"].schema)
+    assert gemini["type"] == "OBJECT" and "additionalProperties" not in json.dumps(gemini)
+
+
+def test_repair_handles_fences_trailing_commas_and_truncation() -> None:
+    assert repair_json_object('```json\n{"label": "Center", "caveats": ["a",],}\n```') == {"label": "Center", "caveats": ["a"]}
+    assert repair_json_object('Sure! {"headline": "Budget vote"} and {"other": 1}') == {"headline": "Budget vote"}
+    truncated = '{"headline": "Budget vote", "key_points": ["one", "tw'
+    assert repair_json_object(truncated) == {"headline": "Budget vote", "key_points": ["one", "tw"]}
+    assert repair_json_object('{"label": "Center", "confidence": 0.') == {"label": "Center"}
+    assert repair_json_object("no json here") is None
+
+
+def test_providers_receive_stage_schema_as_native_constraint(monkeypatch) -> None:
+    payloads: list[dict] = []
+
+    def fake_post(url, headers, payload, timeout=90, transport=None, **_kwargs):
+        payloads.append(payload)
+        if "api.anthropic.com" in url:
+            answer = {"label": "Lean Left", "confidence": 0.8, "rationale": "Tool answer.", "evidence": []}
+            return {"content": [{"type": "tool_use", "name": "bias_judgment", "input": answer}]}
+        return {"output_text": "{}"}
+
+    monkeypatch.setattr("core.llm_provider._post_json", fake_post)
+    articles = [LEFT_ARTICLE, RIGHT_ARTICLE]
+    anthropic = get_llm("anthropic", keys=LLMKeys(anthropic_token="k"), use_cache=False)
+    summary = summarize(articles, LLMClient(provider="fake", model="fake", generate=lambda prompt: ""))
+    judgment = detect_bias(summary, articles, anthropic)
+    assert payloads[0]["tool_choice"] == {"type": "tool", "name": "bias_judgment"}
+    assert payloads[0]["tools"][0]["input_schema"] == STAGE_SCHEMAS["bias_detect"].schema
+    assert judgment.rationale == "Tool answer."
+
+    openai = get_llm("openai", keys=LLMKeys(openai_token="k"), use_cache=False)
+    summarize(articles, openai)
+    assert payloads[1]["text"]["format"]["schema"] == STAGE_SCHEMAS["summarize"].schema
+    assert payloads[1]["text"]["format"]["strict"] is True
+
+
+def test_malformed_output_is_repaired_and_failures_counted() -> None:
+    replies = iter(
+        [
+            '{"headline": "Repaired headline", "neutral_summary": "Cut off", "key_points": ["a", "b',
+            "I cannot answer that.",
+        ]
+    )
+    llm = LLMClient(provider="fake", model="fake", generate=lambda prompt: next(replies))
+    articles = [LEFT_ARTICLE, RIGHT_ARTICLE]
+    summary = summarize(articles, llm)
+    assert summary.headline == "Repaired headline"
+    assert stage_metrics(llm)["parse_repaired"] == 1
+
+    judgment = detect_bias(summary, articles, llm)
+    metrics = stage_metrics(llm)
+    assert metrics["parse_failed"] == 1
+    assert judgment.label  # heuristic fallback
+    assert PARSE_STATS.snapshot() == {"fake": {"repaired": 1, "failed": 1}}
+    assert PARSE_STATS.failure_rate("fake") == 0.5
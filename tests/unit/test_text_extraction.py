@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import pytest
+
+from core.article_cache import ArticleCache
+from core.text_extraction import UnsupportedContentType, fetch_article_text, html_to_text, stream_html_to_text
+
+
+ARTICLE_HTML = "<html><body><script>var x = 1;</script><p>The council approved the transit budget after a long public hearing.</p></body></html>"
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, text: str = "", headers: dict[str, str] | None = None) -> None:
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+        self.chunks_read = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size: int):
+        body = self.text.encode("utf-8")
+        for start in range(0, len(body), chunk_size):
+            self.chunks_read += 1
+            yield body[start : start + chunk_size]
+
+    def close(self) -> None:
+        self.closed = True
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+def test_html_to_text_skips_scripts() -> None:
+    assert html_to_text(ARTICLE_HTML) == "The council approved the transit budget after a long public hearing."
+
+
+def test_fetch_article_text_caches_and_revalidates(tmp_path) -> None:
+    cache = ArticleCache(tmp_path / "articles.sqlite3", ttl_seconds=3600)
+    sent_headers: list[dict[str, str]] = []
+    responses = [FakeResponse(200, ARTICLE_HTML, {"ETag": '"v1"'}), FakeResponse(304)]
+
+    class FakeTransport:
+        def get(self, url: str, *, timeout: int, headers: dict[str, str], stream: bool) -> FakeResponse:
+            sent_headers.append(headers)
+            return responses.pop(0)
+
+    transport = FakeTransport()
+    url = "https://news.example/story?utm_source=feed"
+    first = fetch_article_text(url, cache=cache, transport=transport)
+    assert first.cache_status == "miss"
+
+    second = fetch_article_text("https://NEWS.example/story", cache=cache, transport=transport)
+    assert second.cache_status == "hit"
+    assert second.text == first.text
+    assert len(sent_headers) == 1
+
+    cache.ttl_seconds = 0
+    third = fetch_article_text(url, cache=cache, transport=transport)
+    assert third.cache_status == "revalidated"
+    assert third.text == first.text
+    assert sent_headers[-1]["If-None-Match"] == '"v1"'
+
+
+def test_article_cache_evicts_least_recently_used(tmp_path) -> None:
+    cache = ArticleCache(tmp_path / "articles.sqlite3", max_bytes=25)
+    cache.put("https://a.example/1", "a" * 10)
+    cache.put("https://b.example/2", "b" * 10)
+    assert cache.get("https://a.example/1") is not None
+    cache.put("https://c.example/3", "c" * 10)
+    assert cache.get("https://b.example/2") is None
+    assert cache.get("https://a.example/1") is not None
+    assert cache.total_bytes() <= 25
+
+
+def test_stream_html_to_text_stops_after_enough_text() -> None:
+    paragraph = "<p>" + "Officials described the rollout schedule in detail. " * 4 + "</p>"
+    response = FakeResponse(200, "<html><body>" + paragraph * 500 + "</body></html>", {"Content-Type": "text/html; charset=utf-8"})
+    text = stream_html_to_text(response, max_chars=1000)
+    assert len(text) >= 1000
+    assert response.closed
+    assert response.chunks_read == 1
+
+
+def test_stream_html_to_text_matches_full_parse_across_chunk_boundaries() -> None:
+    html = "<html><body>" + "".join(f"<p>Paragraph {index} explains the budget vote &amp; its timing.</p>" for index in range(2000)) + "</body></html>"
+    streamed = stream_html_to_text(FakeResponse(200, html, {"Content-Type": "text/html"}), max_chars=10**9, max_bytes=10**9)
+    assert streamed == html_to_text(html)
+
+
+def test_stream_html_to_text_rejects_non_html() -> None:
+    response = FakeResponse(200, "%PDF-1.7", {"Content-Type": "application/pdf"})
+    with pytest.raises(UnsupportedContentType):
+        stream_html_to_text(response)
+    assert response.chunks_read == 0
+
+
+NEWS_PAGE = """
+<html><head><title>Budget vote</title><style>.x{}</style></head><body>
+<header><div class="site-header">Subscribe today for unlimited access to every story we publish.</div></header>
+<nav><ul><li><a href="/">Home</a></li><li><a href="/world">World news coverage from every region</a></li></ul></nav>
+<article>
+  <h1>Council approves transit budget after marathon session</h1>
+  <p>The city council approved the transit budget late Tuesday after a <a href="/hearing">long hearing</a> that
+  stretched past midnight.</p>
+  <p>Supporters said the plan adds bus routes in three neighborhoods, while critics questioned the cost.</p>
+  <div class="share-bar">Share this story on Facebook, Twitter, and by email with your friends.</div>
+  <p>The mayor is expected to sign the measure next week, according to officials familiar with the schedule.</p>
+</article>
+<aside class="related"><p>Related: Another story you might like about a completely different topic.</p></aside>
+<footer><p>Copyright 2026 Example News Company. All rights reserved worldwide.</p></footer>
+</body></html>
+"""
+
+
+@pytest.mark.parametrize("backend", ["htmlparser", "lxml"])
+def test_scored_backends_drop_boilerplate(backend: str) -> None:
+    if backend == "lxml":
+        pytest.importorskip("lxml")
+    text = html_to_text(NEWS_PAGE, backend=backend)
+    assert "approved the transit budget late Tuesday after a long hearing that stretched past midnight." in text
+    assert "The mayor is expected to sign the measure next week" in text
+    for boilerplate in ("Subscribe today", "Share this story", "Related:", "Copyright 2026", "World news coverage"):
+        assert boilerplate not in text
+
+
+def test_simple_backend_keeps_every_long_text_node() -> None:
+    text = html_to_text(NEWS_PAGE, backend="simple")
+    assert "Copyright 2026" in text
+    assert "Share this story" in text
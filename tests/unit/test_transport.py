@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from http.server import BaseHTTPRequestHandler
+
+from core.llm_provider import get_llm
+from core.schemas import LLMKeys
+from core.transport import HttpTransport
+
+
+def test_transport_reuses_connections_across_calls(local_server) -> None:
+    peers: list[int] = []
+    encodings: list[str] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self) -> None:
+            peers.append(self.client_address[1])
+            encodings.append(self.headers.get("Accept-Encoding", ""))
+            self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            body = b'{"response": "{\\"ok\\": true}"}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *_args) -> None:
+            pass
+
+    base_url = local_server(Handler)
+    transport = HttpTransport(per_host=2)
+    try:
+        client = get_llm("ollama", keys=LLMKeys(ollama_host=base_url), transport=transport)
+        for _ in range(4):
+            assert client.generate("prompt") == '{"ok": true}'
+    finally:
+        transport.close()
+    assert len(peers) == 4
+    assert len(set(peers)) == 1
+    assert "gzip" in encodings[0]